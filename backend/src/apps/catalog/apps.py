@@ -7,4 +7,5 @@ class CatalogConfig(AppConfig):
     verbose_name = "Catalog"
 
     def ready(self):
+        import apps.catalog.checks  # noqa
         import apps.catalog.signals  # noqa
@@ -0,0 +1,30 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+PROCESS_LOCAL_CACHE_BACKENDS = {
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+}
+
+
+@register(Tags.caches)
+def check_shared_version_cache(app_configs, **kwargs):
+    """
+    CatalogVersion and ReferenceDataVersion are how workers tell each other to
+    reload their in-memory snapshots; a process-local cache silently drops
+    bumps made by other processes.
+    """
+    backend = settings.CACHES["default"]["BACKEND"]
+    if backend not in PROCESS_LOCAL_CACHE_BACKENDS:
+        return []
+    return [
+        Warning(
+            f"The default cache ({backend}) is not shared between processes.",
+            hint=(
+                "Catalog and reference-data changes made in other web workers "
+                "or Celery only reach this process after the snapshot max age. "
+                "Set REDIS_CACHE_URL."
+            ),
+            id="catalog.W001",
+        )
+    ]
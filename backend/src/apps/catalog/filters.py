@@ -10,6 +10,10 @@ class ProductFilter(django_filters.FilterSet):
     category__in = django_filters.BaseInFilter(
         field_name="category__id", lookup_expr="in"
     )
+    manufacturer = django_filters.NumberFilter(field_name="manufacturer__id")
+    manufacturer__in = django_filters.BaseInFilter(
+        field_name="manufacturer__id", lookup_expr="in"
+    )
     tags = django_filters.CharFilter(method="filter_tags")
     current_price = django_filters.NumberFilter(method="filter_current_price")
     current_price__gte = django_filters.NumberFilter(method="filter_current_price_gte")
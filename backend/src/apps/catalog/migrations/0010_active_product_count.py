@@ -0,0 +1,48 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_active_product_count(apps, schema_editor):
+    Product = apps.get_model("catalog", "Product")
+
+    for model_name, field in (("Category", "category"), ("Manufacturer", "manufacturer")):
+        model = apps.get_model("catalog", model_name)
+        visible_counts = (
+            Product.objects.filter(is_visible=True, **{field: OuterRef("pk")})
+            .order_by()
+            .values(field)
+            .annotate(total=Count("id"))
+            .values("total")
+        )
+        model.objects.update(
+            active_product_count=Coalesce(Subquery(visible_counts), Value(0))
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("catalog", "0009_remove_productimage_alt_text_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="active_product_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of visible products, maintained on product changes",
+            ),
+        ),
+        migrations.AddField(
+            model_name="manufacturer",
+            name="active_product_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of visible products, maintained on product changes",
+            ),
+        ),
+        migrations.RunPython(backfill_active_product_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("catalog", "0010_active_product_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="productimage",
+            name="variants",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text="Storage keys of resized copies, by size and then format",
+            ),
+        ),
+        migrations.AddField(
+            model_name="productimage",
+            name="variants_source",
+            field=models.CharField(
+                blank=True,
+                help_text="Image key the variants were generated from",
+                max_length=255,
+            ),
+        ),
+    ]
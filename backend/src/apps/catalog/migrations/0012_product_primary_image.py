@@ -0,0 +1,36 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_primary_image(apps, schema_editor):
+    Product = apps.get_model("catalog", "Product")
+    ProductImage = apps.get_model("catalog", "ProductImage")
+
+    primary_images = ProductImage.objects.filter(
+        product=OuterRef("pk"), is_primary=True
+    ).values("pk")[:1]
+    Product.objects.update(primary_image=Subquery(primary_images))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("catalog", "0011_productimage_variants"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="primary_image",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                help_text="Primary image, kept in sync with ProductImage.is_primary",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="catalog.productimage",
+            ),
+        ),
+        migrations.RunPython(backfill_primary_image, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("catalog", "0012_product_primary_image"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="wishlistitem",
+            name="saved_price",
+            field=models.DecimalField(
+                blank=True,
+                decimal_places=2,
+                editable=False,
+                help_text="Current price of the product when it was added to the wishlist",
+                max_digits=10,
+                null=True,
+            ),
+        ),
+    ]
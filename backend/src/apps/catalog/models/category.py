@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import F
 from django.utils.text import slugify
 
 from apps.common.models import TimestampedModel
@@ -15,6 +16,11 @@ class Category(TimestampedModel):
     is_active = models.BooleanField(
         default=True, help_text="Whether this category is visible"
     )
+    active_product_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of visible products, maintained on product changes",
+    )
 
     class Meta:
         verbose_name_plural = "categories"
@@ -28,3 +34,11 @@ class Category(TimestampedModel):
         if not self.slug:
             self.slug = slugify(self.name)
         super().save(*args, **kwargs)
+
+    @classmethod
+    def adjust_active_product_count(cls, category_id: int, delta: int) -> None:
+        """Atomically shift the stored visible-product counter by ``delta``."""
+        queryset = cls.objects.filter(pk=category_id)
+        if delta < 0:
+            queryset = queryset.filter(active_product_count__gte=-delta)
+        queryset.update(active_product_count=F("active_product_count") + delta)
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import F
 from django.utils.text import slugify
 
 from apps.common.models import TimestampedModel
@@ -18,6 +19,11 @@ class Manufacturer(TimestampedModel):
     is_active = models.BooleanField(
         default=True, help_text="Whether this manufacturer is visible"
     )
+    active_product_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of visible products, maintained on product changes",
+    )
 
     class Meta:
         verbose_name_plural = "manufacturers"
@@ -31,3 +37,11 @@ class Manufacturer(TimestampedModel):
         if not self.slug:
             self.slug = slugify(self.name)
         super().save(*args, **kwargs)
+
+    @classmethod
+    def adjust_active_product_count(cls, manufacturer_id: int, delta: int) -> None:
+        """Atomically shift the stored visible-product counter by ``delta``."""
+        queryset = cls.objects.filter(pk=manufacturer_id)
+        if delta < 0:
+            queryset = queryset.filter(active_product_count__gte=-delta)
+        queryset.update(active_product_count=F("active_product_count") + delta)
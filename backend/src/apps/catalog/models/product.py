@@ -60,6 +60,15 @@ class Product(TimestampedModel):
     tags = models.ManyToManyField(
         "Tag", blank=True, help_text="Tags for filtering and search"
     )
+    primary_image = models.ForeignKey(
+        "catalog.ProductImage",
+        on_delete=models.SET_NULL,
+        related_name="+",
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Primary image, kept in sync with ProductImage.is_primary",
+    )
 
     is_visible = models.BooleanField(
         default=False, help_text="Is product visible to the users"
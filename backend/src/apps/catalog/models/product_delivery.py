@@ -48,4 +48,4 @@ class ProductDelivery(TimestampedModel):
 
         if is_new:
             self.product.stock_quantity += self.quantity
-            self.product.save(update_fields=["stock_quantity"])
+            self.product.save(update_fields=["stock_quantity", "updated_at"])
@@ -1,4 +1,5 @@
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 
 from apps.common.models import TimestampedModel
 from apps.catalog.models.product import Product
@@ -20,6 +21,16 @@ class ProductImage(TimestampedModel):
     sort_order = models.PositiveIntegerField(
         default=0, help_text="Display order of images"
     )
+    variants = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Storage keys of resized copies, by size and then format",
+    )
+    variants_source = models.CharField(
+        max_length=255,
+        blank=True,
+        help_text="Image key the variants were generated from",
+    )
 
     class Meta:
         ordering = ["product", "sort_order", "created_at"]
@@ -34,11 +45,57 @@ class ProductImage(TimestampedModel):
     def __str__(self) -> str:
         return f"{self.product.name} - Image {self.sort_order}"
 
+    @property
+    def current_variants(self) -> dict:
+        """Variants of the current image; empty until they are generated."""
+        if self.image and self.variants_source == self.image.name:
+            return self.variants
+        return {}
+
     def save(self, *args, **kwargs) -> None:
-        """Ensure only one primary image per product."""
-        if self.is_primary:
-            ProductImage.objects.filter(product=self.product, is_primary=True).exclude(
-                pk=self.pk
-            ).update(is_primary=False)
+        """Ensure only one primary image per product, mirrored on the product."""
+        with transaction.atomic():
+            if self.is_primary:
+                self._lock_product()
+                ProductImage.objects.filter(
+                    product=self.product, is_primary=True
+                ).exclude(pk=self.pk).update(is_primary=False)
+
+            super().save(*args, **kwargs)
+
+            if self.is_primary:
+                Product.objects.filter(pk=self.product_id).update(primary_image=self)
+            else:
+                Product.objects.filter(pk=self.product_id, primary_image=self).update(
+                    primary_image=None
+                )
+
+    def make_primary(self) -> None:
+        """
+        Swap this image in as its product's primary image.
+
+        The flags are switched under a lock on the product row, and the
+        product's ``primary_image`` (what readers follow) moves in a single
+        UPDATE, so no reader sees two primaries or none.
+        """
+        from apps.catalog.services.catalog_version import CatalogVersion
+
+        with transaction.atomic():
+            self._lock_product()
+            ProductImage.objects.filter(
+                product_id=self.product_id, is_primary=True
+            ).exclude(pk=self.pk).update(is_primary=False)
+            ProductImage.objects.filter(pk=self.pk).update(is_primary=True)
+            Product.objects.filter(pk=self.product_id).update(
+                primary_image=self, updated_at=timezone.now()
+            )
+            transaction.on_commit(CatalogVersion.bump)
+        self.is_primary = True
 
-        super().save(*args, **kwargs)
+    def _lock_product(self) -> None:
+        """Serialize primary image changes of the same product."""
+        list(
+            Product.objects.select_for_update()
+            .filter(pk=self.product_id)
+            .values_list("pk", flat=True)
+        )
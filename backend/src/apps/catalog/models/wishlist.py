@@ -19,6 +19,14 @@ class WishlistItem(TimestampedModel):
         related_name="wishlist_items",
         help_text="Product in the wishlist",
     )
+    saved_price = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Current price of the product when it was added to the wishlist",
+    )
 
     class Meta:
         verbose_name = "Wishlist Item"
@@ -32,3 +40,16 @@ class WishlistItem(TimestampedModel):
 
     def __str__(self) -> str:
         return f"{self.user.email} - {self.product.name}"
+
+    def save(self, *args, **kwargs) -> None:
+        if self._state.adding and self.saved_price is None:
+            self.saved_price = self.product.current_price
+        super().save(*args, **kwargs)
+
+    @property
+    def price_dropped(self) -> bool:
+        """Whether the product is cheaper now than when it was saved."""
+        return (
+            self.saved_price is not None
+            and self.product.current_price < self.saved_price
+        )
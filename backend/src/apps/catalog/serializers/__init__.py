@@ -1,5 +1,10 @@
 from apps.catalog.serializers.tag import TagSerializer
-from apps.catalog.serializers.product_image import ProductImageSerializer
+from apps.catalog.serializers.product_image import (
+    ProductImageSerializer,
+    ProductImageUploadRequestSerializer,
+    ProductImageUploadSerializer,
+    ProductImageConfirmSerializer,
+)
 from apps.catalog.serializers.category import CategorySerializer
 from apps.catalog.serializers.manufacturer import (
     ManufacturerSerializer,
@@ -12,10 +17,15 @@ from apps.catalog.serializers.product import (
     ProductDetailSerializer,
     ProductCreateSerializer,
 )
+from apps.catalog.serializers.facet import (
+    ProductFacetQuerySerializer,
+    ProductFacetsSerializer,
+)
 from apps.catalog.serializers.wishlist import (
     WishlistItemSerializer,
     WishlistItemCreateSerializer,
     WishlistCheckSerializer,
+    WishlistCheckManySerializer,
 )
 from apps.catalog.serializers.notification import (
     NotificationPreferenceSerializer,
@@ -29,6 +39,9 @@ from apps.catalog.serializers.product_delivery import ProductDeliverySerializer
 __all__ = [
     "TagSerializer",
     "ProductImageSerializer",
+    "ProductImageUploadRequestSerializer",
+    "ProductImageUploadSerializer",
+    "ProductImageConfirmSerializer",
     "CategorySerializer",
     "ManufacturerSerializer",
     "ManufacturerListSerializer",
@@ -37,10 +50,13 @@ __all__ = [
     "ProductListSerializer",
     "ProductDetailSerializer",
     "ProductCreateSerializer",
+    "ProductFacetQuerySerializer",
+    "ProductFacetsSerializer",
     "ProductImageSerializer",
     "WishlistItemSerializer",
     "WishlistItemCreateSerializer",
     "WishlistCheckSerializer",
+    "WishlistCheckManySerializer",
     "NotificationPreferenceSerializer",
     "NotificationPreferenceUpdateSerializer",
     "NotificationHistorySerializer",
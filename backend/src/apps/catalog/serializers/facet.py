@@ -0,0 +1,93 @@
+from rest_framework import serializers
+
+from apps.catalog.services.facet_index import FacetFilters
+
+
+def _split(value: str) -> list[str]:
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+class ProductFacetQuerySerializer(serializers.Serializer):
+    """Filter set for facet counts; same parameter names as ProductFilter."""
+
+    category = serializers.IntegerField(required=False)
+    category__in = serializers.CharField(
+        required=False, help_text="Comma-separated category ids"
+    )
+    manufacturer = serializers.IntegerField(required=False)
+    manufacturer__in = serializers.CharField(
+        required=False, help_text="Comma-separated manufacturer ids"
+    )
+    tags = serializers.CharField(required=False, help_text="Comma-separated tag slugs")
+    current_price__gte = serializers.DecimalField(
+        max_digits=10, decimal_places=2, required=False
+    )
+    current_price__gt = serializers.DecimalField(
+        max_digits=10, decimal_places=2, required=False
+    )
+    current_price__lte = serializers.DecimalField(
+        max_digits=10, decimal_places=2, required=False
+    )
+    current_price__lt = serializers.DecimalField(
+        max_digits=10, decimal_places=2, required=False
+    )
+
+    def _ids(self, value: str) -> list[int]:
+        try:
+            return [int(part) for part in _split(value)]
+        except ValueError:
+            raise serializers.ValidationError("Expected comma-separated ids")
+
+    def validate_category__in(self, value: str) -> list[int]:
+        return self._ids(value)
+
+    def validate_manufacturer__in(self, value: str) -> list[int]:
+        return self._ids(value)
+
+    def validate_tags(self, value: str) -> list[str]:
+        return _split(value)
+
+    def to_filters(self) -> FacetFilters:
+        data = self.validated_data
+        categories = set(data.get("category__in", []))
+        if "category" in data:
+            categories.add(data["category"])
+        manufacturers = set(data.get("manufacturer__in", []))
+        if "manufacturer" in data:
+            manufacturers.add(data["manufacturer"])
+        return FacetFilters(
+            categories=frozenset(categories),
+            manufacturers=frozenset(manufacturers),
+            tags=frozenset(data.get("tags", [])),
+            price_gte=data.get("current_price__gte"),
+            price_gt=data.get("current_price__gt"),
+            price_lte=data.get("current_price__lte"),
+            price_lt=data.get("current_price__lt"),
+        )
+
+
+class FacetEntrySerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    slug = serializers.CharField()
+    count = serializers.IntegerField()
+
+    class Meta:
+        ref_name = "FacetEntry"
+
+
+class PriceBucketSerializer(serializers.Serializer):
+    min = serializers.DecimalField(max_digits=10, decimal_places=2)
+    max = serializers.DecimalField(max_digits=10, decimal_places=2, allow_null=True)
+    count = serializers.IntegerField()
+
+    class Meta:
+        ref_name = "PriceBucket"
+
+
+class ProductFacetsSerializer(serializers.Serializer):
+    total = serializers.IntegerField()
+    categories = FacetEntrySerializer(many=True)
+    manufacturers = FacetEntrySerializer(many=True)
+    tags = FacetEntrySerializer(many=True)
+    price_buckets = PriceBucketSerializer(many=True)
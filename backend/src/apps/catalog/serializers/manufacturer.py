@@ -1,13 +1,10 @@
 from rest_framework import serializers
 from apps.catalog.models import Manufacturer
-from drf_spectacular.utils import extend_schema_field
 
 
 class ManufacturerSerializer(serializers.ModelSerializer):
     """Serializer for Manufacturer model."""
 
-    active_product_count = serializers.SerializerMethodField()
-
     class Meta:
         model = Manufacturer
         fields = [
@@ -23,11 +20,6 @@ class ManufacturerSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "created_at", "updated_at", "active_product_count"]
 
-    @extend_schema_field(serializers.IntegerField)
-    def get_active_product_count(self, obj: Manufacturer) -> int:
-        """Get count of visible products from this manufacturer."""
-        return obj.products.filter(is_visible=True).count()
-
 
 class ManufacturerListSerializer(serializers.ModelSerializer):
     """Simplified manufacturer serializer for list views."""
@@ -39,6 +31,7 @@ class ManufacturerListSerializer(serializers.ModelSerializer):
             "name",
             "slug",
             "is_active",
+            "active_product_count",
             "created_at",
         ]
 
@@ -3,6 +3,7 @@ from apps.catalog.models.notification import (
     NotificationPreference,
     NotificationHistory,
 )
+from apps.catalog.serializers.product_image import image_variant_url
 
 
 class NotificationPreferenceSerializer(serializers.ModelSerializer):
@@ -56,9 +57,14 @@ class NotificationHistorySerializer(serializers.ModelSerializer):
             "created_at",
         ]
 
-    def get_product_image(self, obj):
-        """Get the first product image URL."""
-        first_image = obj.product.images.first()
-        if first_image:
-            return first_image.image.url
-        return None
+    def get_product_image(self, obj) -> str | None:
+        """Get the thumbnail URL of the product's primary image."""
+        primary_image = obj.product.primary_image
+        if primary_image is None:
+            return None
+        return image_variant_url(
+            self.context.get("request"),
+            primary_image.image.name,
+            primary_image.current_variants,
+            "thumb",
+        )
@@ -7,9 +7,12 @@ from apps.catalog.models.product import Product
 from apps.catalog.models.tag import Tag
 from apps.catalog.serializers.category import CategorySerializer
 from apps.catalog.serializers.manufacturer import ManufacturerSerializer
-from apps.catalog.serializers.product_image import ProductImageSerializer
+from apps.catalog.serializers.product_image import (
+    ProductImageSerializer,
+    image_variant_url,
+)
 from apps.catalog.serializers.tag import TagSerializer
-from shopdjango.utils import presign_download
+from apps.catalog.services.catalog_snapshot import ProductRecord
 
 
 class ProductListSerializer(serializers.ModelSerializer):
@@ -53,16 +56,17 @@ class ProductListSerializer(serializers.ModelSerializer):
             "created_at",
         ]
 
-    def get_primary_image(self, obj: Product) -> str | None:
-        """Get URL of primary product image."""
-        primary_image = obj.images.filter(is_primary=True).first()
-        if primary_image and primary_image.image:
-            return presign_download(
-                primary_image.image.name, expires=3600, as_attachment=False
-            )
-        return None
-
-    def get_current_price(self, obj: Product) -> str:
+    def get_primary_image(self, obj: Product | ProductRecord) -> str | None:
+        """Get URL of the card-sized variant of the primary product image."""
+        if isinstance(obj, ProductRecord):
+            key, variants = obj.primary_image_key, obj.primary_image_variants
+        else:
+            primary_image = obj.primary_image
+            key = primary_image.image.name if primary_image else None
+            variants = primary_image.current_variants if primary_image else {}
+        return image_variant_url(self.context.get("request"), key, variants, "card")
+
+    def get_current_price(self, obj: Product | ProductRecord) -> str:
         """Get current price as formatted decimal string."""
         return f"{obj.current_price:.2f}"
 
@@ -161,11 +165,14 @@ class ProductDetailSerializer(serializers.ModelSerializer):
         return attrs
 
     def get_primary_image(self, obj: Product) -> str | None:
-        """Get URL of primary product image."""
-        primary_image = obj.images.filter(is_primary=True).first()
+        """Get URL of the large variant of the primary product image."""
+        primary_image = obj.primary_image
         if primary_image and primary_image.image:
-            return presign_download(
-                primary_image.image.name, expires=3600, as_attachment=False
+            return image_variant_url(
+                self.context.get("request"),
+                primary_image.image.name,
+                primary_image.current_variants,
+                "large",
             )
         return None
 
@@ -1,13 +1,34 @@
+from django.conf import settings
 from rest_framework import serializers
 
+from apps.catalog.models.product import Product
 from apps.catalog.models.product_image import ProductImage
+from apps.catalog.services.image_upload_service import ProductImageUploadService
+from apps.catalog.services.image_variant_service import ImageVariantService
 from shopdjango.utils import presign_download
 
 
+def image_variant_url(
+    request, key: str | None, variants: dict, size: str
+) -> str | None:
+    """
+    Presigned URL of the ``size`` variant of an image in the best format the
+    client accepts, or of the original while no such variant exists.
+    """
+    if not key:
+        return None
+    variant = ImageVariantService.pick(
+        variants, size, ImageVariantService.accepted_formats(request)
+    )
+    return presign_download(variant or key, expires=3600, as_attachment=False)
+
+
 class ProductImageSerializer(serializers.ModelSerializer):
     """Serializer for ProductImage model."""
 
     image_url = serializers.SerializerMethodField()
+    thumbnail_url = serializers.SerializerMethodField()
+    display_url = serializers.SerializerMethodField()
 
     class Meta:
         model = ProductImage
@@ -16,14 +37,86 @@ class ProductImageSerializer(serializers.ModelSerializer):
             "product",
             "image",
             "image_url",
+            "thumbnail_url",
+            "display_url",
             "is_primary",
             "sort_order",
             "created_at",
             "updated_at",
         ]
-        read_only_fields = ["id", "image_url", "created_at", "updated_at"]
+        read_only_fields = [
+            "id",
+            "image_url",
+            "thumbnail_url",
+            "display_url",
+            "created_at",
+            "updated_at",
+        ]
 
     def get_image_url(self, obj: ProductImage) -> str | None:
         if obj.image:
             return presign_download(obj.image.name, expires=3600, as_attachment=False)
         return None
+
+    def get_thumbnail_url(self, obj: ProductImage) -> str | None:
+        return self._variant_url(obj, "thumb")
+
+    def get_display_url(self, obj: ProductImage) -> str | None:
+        return self._variant_url(obj, "large")
+
+    def _variant_url(self, obj: ProductImage, size: str) -> str | None:
+        return image_variant_url(
+            self.context.get("request"),
+            obj.image.name if obj.image else None,
+            obj.current_variants,
+            size,
+        )
+
+
+class ProductImageUploadRequestSerializer(serializers.Serializer):
+    """Request for a direct upload URL."""
+
+    product = serializers.PrimaryKeyRelatedField(queryset=Product.objects.all())
+    content_type = serializers.ChoiceField(
+        choices=list(settings.PRODUCT_IMAGE_UPLOAD_CONTENT_TYPES)
+    )
+
+
+class ProductImageUploadSerializer(serializers.Serializer):
+    """Presigned POST to send the image to, and the token to confirm it with."""
+
+    url = serializers.URLField()
+    fields = serializers.DictField(child=serializers.CharField())
+    key = serializers.CharField()
+    upload_token = serializers.CharField()
+    expires_at = serializers.DateTimeField()
+
+
+class ProductImageConfirmSerializer(serializers.Serializer):
+    """Confirmation that a direct upload finished."""
+
+    upload_token = serializers.CharField()
+    is_primary = serializers.BooleanField(default=False)
+    sort_order = serializers.IntegerField(min_value=0, default=0)
+
+    def validate_upload_token(self, value: str) -> dict:
+        upload = ProductImageUploadService.read_token(value)
+        if upload is None:
+            raise serializers.ValidationError("Invalid or expired upload token.")
+        return upload
+
+    def validate(self, attrs: dict) -> dict:
+        upload = attrs["upload_token"]
+        if not Product.objects.filter(pk=upload["product"]).exists():
+            raise serializers.ValidationError("Product no longer exists.")
+        if not ProductImageUploadService.uploaded(upload["key"]):
+            raise serializers.ValidationError("The file has not been uploaded yet.")
+        if (
+            not ProductImage.objects.filter(image=upload["key"]).exists()
+            and not ProductImageUploadService.is_image(upload["key"])
+        ):
+            ProductImageUploadService.discard(upload["key"])
+            raise serializers.ValidationError(
+                "The uploaded file is not a valid image of the declared type."
+            )
+        return attrs
@@ -1,3 +1,4 @@
+from django.conf import settings
 from rest_framework import serializers
 from apps.catalog.models.wishlist import WishlistItem
 from apps.catalog.models.product import Product
@@ -13,6 +14,7 @@ class WishlistItemSerializer(serializers.ModelSerializer):
         source="product",
         write_only=True,
     )
+    price_dropped = serializers.BooleanField(read_only=True)
 
     class Meta:
         model = WishlistItem
@@ -20,9 +22,11 @@ class WishlistItemSerializer(serializers.ModelSerializer):
             "id",
             "product",
             "product_id",
+            "saved_price",
+            "price_dropped",
             "created_at",
         ]
-        read_only_fields = ["id", "created_at"]
+        read_only_fields = ["id", "saved_price", "price_dropped", "created_at"]
 
 
 class WishlistItemCreateSerializer(serializers.ModelSerializer):
@@ -53,3 +57,13 @@ class WishlistCheckSerializer(serializers.Serializer):
     product_id = serializers.IntegerField()
     is_in_wishlist = serializers.BooleanField()
     wishlist_item_id = serializers.IntegerField(required=False, allow_null=True)
+
+
+class WishlistCheckManySerializer(serializers.Serializer):
+    """Serializer for a batch wishlist check request."""
+
+    product_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=settings.WISHLIST_CHECK_MAX_PRODUCTS,
+    )
@@ -0,0 +1,318 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import numpy as np
+from django.conf import settings
+from django.utils import timezone
+
+from apps.catalog.models import Category, Manufacturer, Product, Tag
+from apps.catalog.services.catalog_version import CatalogVersion
+from apps.catalog.services.facet_index import FacetFilters, ProductFacetIndex
+
+logger = logging.getLogger(__name__)
+
+CATEGORY_FIELDS = (
+    "id",
+    "name",
+    "slug",
+    "description",
+    "is_active",
+    "active_product_count",
+    "created_at",
+    "updated_at",
+)
+MANUFACTURER_FIELDS = CATEGORY_FIELDS + ("website",)
+TAG_FIELDS = ("id", "name", "slug")
+PRODUCT_FIELDS = (
+    "id",
+    "name",
+    "slug",
+    "short_description",
+    "price",
+    "original_price",
+    "sku",
+    "stock_quantity",
+    "is_visible",
+    "category_id",
+    "manufacturer_id",
+    "sale_start",
+    "sale_end",
+    "created_at",
+    "updated_at",
+)
+
+# Orderings the snapshot can answer; anything else goes to the database.
+# Text columns are left out: the database orders them by its collation, which
+# Python's code-point comparison does not reproduce.
+SNAPSHOT_ORDERING_FIELDS = {
+    "id": lambda record: record.id,
+    "price": lambda record: record.price,
+    "original_price": lambda record: record.original_price,
+    "stock_quantity": lambda record: record.stock_quantity,
+    "created_at": lambda record: record.created_at,
+    "updated_at": lambda record: record.updated_at,
+}
+
+
+class _Record:
+    """Read-only row with fixed attributes and no per-instance dict."""
+
+    __slots__ = ()
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+
+class CategoryRecord(_Record):
+    __slots__ = CATEGORY_FIELDS
+
+
+class ManufacturerRecord(_Record):
+    __slots__ = MANUFACTURER_FIELDS
+
+
+class TagRecord(_Record):
+    __slots__ = TAG_FIELDS
+
+
+class ProductRecord(_Record):
+    """A visible product as ProductListSerializer reads it."""
+
+    __slots__ = PRODUCT_FIELDS + (
+        "tag_ids",
+        "primary_image_key",
+        "primary_image_variants",
+        "category",
+        "manufacturer",
+    )
+
+    is_on_sale = Product.is_on_sale
+    current_price = Product.current_price
+    discount_percentage = Product.discount_percentage
+    is_in_stock = Product.is_in_stock
+    is_available = Product.is_available
+
+    def with_relations(self, categories, manufacturers) -> "ProductRecord":
+        """This record pointing at the given category/manufacturer records."""
+        category = categories.get(self.category_id)
+        manufacturer = manufacturers.get(self.manufacturer_id)
+        if category is self.category and manufacturer is self.manufacturer:
+            return self
+        return ProductRecord(*self.values()[:-2], category, manufacturer)
+
+
+class CatalogSnapshot:
+    """
+    Read-only, per-process copy of the visible catalog.
+
+    Built once per worker and then refreshed incrementally: when the shared
+    CatalogVersion changes, only products updated since the last load (tag
+    and image edits touch ``updated_at`` too) are read again, together with
+    the small category, manufacturer and tag tables. Unchanged records are
+    shared between consecutive snapshots. A full reload happens after
+    ``CATALOG_SNAPSHOT_MAX_AGE_SECONDS`` as a safety net.
+    """
+
+    _lock = threading.Lock()
+    _current: "CatalogSnapshot | None" = None
+
+    def __init__(
+        self,
+        version: int,
+        loaded_at: datetime,
+        categories: dict[int, CategoryRecord],
+        manufacturers: dict[int, ManufacturerRecord],
+        tags: dict[int, TagRecord],
+        products: dict[int, ProductRecord],
+        built_at: float | None = None,
+    ):
+        self.version = version
+        self.loaded_at = loaded_at
+        self.built_at = built_at if built_at is not None else time.monotonic()
+        self.categories = categories
+        self.manufacturers = manufacturers
+        self.tags = tags
+        self.products = products
+        # Positions used by the facet index and orderings.
+        self.records = tuple(sorted(products.values(), key=lambda record: record.id))
+        self._orderings: dict[tuple[str, ...], np.ndarray] = {}
+        self._facet_index: ProductFacetIndex | None = None
+
+    @classmethod
+    def get(cls) -> "CatalogSnapshot":
+        """The current process-wide snapshot, refreshed if the catalog changed."""
+        version = CatalogVersion.current()
+        snapshot = cls._current
+        if snapshot is None or not snapshot._fresh(version):
+            with cls._lock:
+                snapshot = cls._current
+                if snapshot is None or snapshot._expired():
+                    snapshot = cls._current = cls.load(version)
+                elif snapshot.version != version:
+                    snapshot = cls._current = snapshot.refreshed(version)
+        return snapshot
+
+    def _expired(self) -> bool:
+        return (
+            time.monotonic() - self.built_at
+            >= settings.CATALOG_SNAPSHOT_MAX_AGE_SECONDS
+        )
+
+    def _fresh(self, version: int) -> bool:
+        return self.version == version and not self._expired()
+
+    @classmethod
+    def load(cls, version: int) -> "CatalogSnapshot":
+        """Read the whole visible catalog."""
+        loaded_at = timezone.now()
+        categories, manufacturers, tags = _load_lookups()
+        products = {
+            record.id: record
+            for record in _load_products(
+                Product.objects.filter(is_visible=True), categories, manufacturers
+            )
+        }
+        logger.info(f"Loaded catalog snapshot with {len(products)} products")
+        return cls(version, loaded_at, categories, manufacturers, tags, products)
+
+    def refreshed(self, version: int) -> "CatalogSnapshot":
+        """
+        A new snapshot with the changes since this one was loaded.
+
+        Products updated after ``loaded_at`` (minus
+        ``CATALOG_SNAPSHOT_DELTA_OVERLAP_SECONDS`` for late commits) are
+        re-read; deleted or hidden ones are dropped using the current list of
+        visible ids.
+        """
+        loaded_at = timezone.now()
+        categories, manufacturers, tags = _load_lookups(
+            self.categories, self.manufacturers, self.tags
+        )
+        since = self.loaded_at - timedelta(
+            seconds=settings.CATALOG_SNAPSHOT_DELTA_OVERLAP_SECONDS
+        )
+        changed = _load_products(
+            Product.objects.filter(updated_at__gte=since), categories, manufacturers
+        )
+        visible_ids = set(
+            Product.objects.filter(is_visible=True).values_list("id", flat=True)
+        )
+
+        products = {
+            product_id: record.with_relations(categories, manufacturers)
+            for product_id, record in self.products.items()
+            if product_id in visible_ids
+        }
+        for record in changed:
+            if record.is_visible:
+                products[record.id] = record
+            else:
+                products.pop(record.id, None)
+        return CatalogSnapshot(
+            version,
+            loaded_at,
+            categories,
+            manufacturers,
+            tags,
+            products,
+            built_at=self.built_at,
+        )
+
+    @property
+    def facet_index(self) -> ProductFacetIndex:
+        if self._facet_index is None:
+            self._facet_index = ProductFacetIndex(self)
+        return self._facet_index
+
+    def ordered(self, ordering: tuple[str, ...]) -> np.ndarray:
+        """
+        Positions of all records in ``ordering`` (DRF-style field names, a
+        leading ``-`` meaning descending), ties broken by id.
+        """
+        positions = self._orderings.get(ordering)
+        if positions is None:
+            order = list(range(len(self.records)))
+            for term in reversed(ordering):
+                key = SNAPSHOT_ORDERING_FIELDS[term.lstrip("-")]
+                order.sort(
+                    key=lambda position: key(self.records[position]),
+                    reverse=term.startswith("-"),
+                )
+            positions = self._orderings[ordering] = np.array(order, dtype=np.int64)
+        return positions
+
+    def select(
+        self,
+        filters: FacetFilters,
+        ordering: tuple[str, ...],
+        now: datetime | None = None,
+    ) -> list[ProductRecord]:
+        """Records matching ``filters`` in ``ordering``."""
+        positions = self.ordered(ordering)
+        matching = self.facet_index.mask(filters, now or timezone.now())
+        return [self.records[position] for position in positions[matching[positions]]]
+
+
+def _reuse(previous: dict, record_class, rows) -> dict:
+    """Records for ``rows``, keeping the previous object when unchanged."""
+    records = {}
+    for row in rows:
+        record = previous.get(row[0])
+        if record is None or record.values() != row:
+            record = record_class(*row)
+        records[row[0]] = record
+    return records
+
+
+def _load_lookups(categories=None, manufacturers=None, tags=None):
+    return (
+        _reuse(
+            categories or {},
+            CategoryRecord,
+            Category.objects.order_by().values_list(*CATEGORY_FIELDS),
+        ),
+        _reuse(
+            manufacturers or {},
+            ManufacturerRecord,
+            Manufacturer.objects.order_by().values_list(*MANUFACTURER_FIELDS),
+        ),
+        _reuse(tags or {}, TagRecord, Tag.objects.order_by().values_list(*TAG_FIELDS)),
+    )
+
+
+def _load_products(queryset, categories, manufacturers) -> list[ProductRecord]:
+    """Records for ``queryset`` with their tags and primary image, in 2 queries."""
+    rows = queryset.order_by().values_list(
+        *PRODUCT_FIELDS,
+        "primary_image__image",
+        "primary_image__variants",
+        "primary_image__variants_source",
+    )
+    tag_ids = defaultdict(list)
+    for product_id, tag_id in Product.tags.through.objects.filter(
+        product_id__in=queryset.values("id")
+    ).values_list("product_id", "tag_id"):
+        tag_ids[product_id].append(tag_id)
+    records = []
+    for *row, image_key, variants, variants_source in rows:
+        records.append(
+            ProductRecord(
+                *row,
+                tuple(sorted(tag_ids[row[0]])),
+                image_key or None,
+                variants if image_key and variants_source == image_key else {},
+                categories.get(row[9]),
+                manufacturers.get(row[10]),
+            )
+        )
+    return records
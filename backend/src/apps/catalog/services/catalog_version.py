@@ -0,0 +1,31 @@
+import time
+
+from django.core.cache import cache
+
+CATALOG_VERSION_KEY = "catalog:version"
+
+
+class CatalogVersion:
+    """
+    Shared stamp that changes whenever catalog data changes.
+
+    Per-process catalog structures remember the stamp they were built at and
+    compare it with the current one (a single cache read) to decide whether
+    to refresh. Only equality matters: if the key is evicted it restarts from
+    the current time, which still differs from every stamp seen before.
+    """
+
+    @staticmethod
+    def current() -> int:
+        version = cache.get(CATALOG_VERSION_KEY)
+        if version is None:
+            cache.add(CATALOG_VERSION_KEY, time.time_ns(), timeout=None)
+            version = cache.get(CATALOG_VERSION_KEY)
+        return version
+
+    @staticmethod
+    def bump() -> None:
+        try:
+            cache.incr(CATALOG_VERSION_KEY)
+        except ValueError:
+            cache.add(CATALOG_VERSION_KEY, time.time_ns(), timeout=None)
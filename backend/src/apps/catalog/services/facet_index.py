@@ -0,0 +1,211 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+import numpy as np
+from django.conf import settings
+from django.utils import timezone
+
+
+@dataclass(frozen=True)
+class FacetFilters:
+    """The filter set facets are counted for; empty means "any"."""
+
+    categories: frozenset[int] = frozenset()
+    manufacturers: frozenset[int] = frozenset()
+    tags: frozenset[str] = frozenset()
+    price_gte: Decimal | None = None
+    price_gt: Decimal | None = None
+    price_lte: Decimal | None = None
+    price_lt: Decimal | None = None
+
+
+class ProductFacetIndex:
+    """
+    Column arrays over a catalog snapshot, for filtering and counting facets
+    in memory.
+
+    Each product is one position. Category and manufacturer are dense codes
+    (the last code meaning "none"), tags are one packed bitset per tag, and
+    prices are kept with the sale window so the current price can be worked
+    out per request. A filter becomes a boolean mask over positions and every
+    facet is counted under the filters of the *other* facets, so a sidebar
+    shows how many products each alternative would yield.
+    """
+
+    def __init__(self, snapshot):
+        records = snapshot.records
+        self.categories = _by_name(snapshot.categories.values())
+        self.manufacturers = _by_name(snapshot.manufacturers.values())
+        self.tags = _by_name(snapshot.tags.values())
+        self.category_code = {row[0]: code for code, row in enumerate(self.categories)}
+        self.manufacturer_code = {
+            row[0]: code for code, row in enumerate(self.manufacturers)
+        }
+        self.tag_code = {row[2]: code for code, row in enumerate(self.tags)}
+        tag_codes = {row[0]: code for code, row in enumerate(self.tags)}
+
+        self.size = len(records)
+        self.category_codes = np.array(
+            [
+                self.category_code.get(record.category_id, len(self.categories))
+                for record in records
+            ],
+            dtype=np.int32,
+        )
+        self.manufacturer_codes = np.array(
+            [
+                self.manufacturer_code.get(
+                    record.manufacturer_id, len(self.manufacturers)
+                )
+                for record in records
+            ],
+            dtype=np.int32,
+        )
+        self.price = np.array([record.price for record in records], dtype=float)
+        self.original_price = np.array(
+            [record.original_price for record in records], dtype=float
+        )
+        self.sale_start = np.array(
+            [_timestamp(record.sale_start) for record in records], dtype=float
+        )
+        self.sale_end = np.array(
+            [_timestamp(record.sale_end) for record in records], dtype=float
+        )
+
+        tag_matrix = np.zeros((len(self.tags), self.size), dtype=bool)
+        for position, record in enumerate(records):
+            for tag_id in record.tag_ids:
+                if tag_id in tag_codes:
+                    tag_matrix[tag_codes[tag_id], position] = True
+        self.tag_bits = np.packbits(tag_matrix, axis=1)
+
+    def current_prices(self, now: datetime) -> np.ndarray:
+        moment = now.timestamp()
+        # NaN bounds (no sale window) compare False, so those use original_price.
+        on_sale = (self.sale_start <= moment) & (moment <= self.sale_end)
+        return np.where(on_sale, self.price, self.original_price)
+
+    def mask(self, filters: FacetFilters, now: datetime) -> np.ndarray:
+        """Positions matching every filter."""
+        category_mask, manufacturer_mask, tag_mask, price_mask, _ = self._masks(
+            filters, now
+        )
+        return category_mask & manufacturer_mask & tag_mask & price_mask
+
+    def facets(self, filters: FacetFilters, now: datetime | None = None) -> dict:
+        """
+        Count products per category, manufacturer, tag and price bucket.
+
+        Returns:
+            Dict with the total under all filters and, per facet, entries
+            with a non-zero count (plus any selected ones)
+        """
+        category_mask, manufacturer_mask, tag_mask, price_mask, prices = self._masks(
+            filters, now or timezone.now()
+        )
+
+        category_counts = np.bincount(
+            self.category_codes[manufacturer_mask & tag_mask & price_mask],
+            minlength=len(self.categories) + 1,
+        )
+        manufacturer_counts = np.bincount(
+            self.manufacturer_codes[category_mask & tag_mask & price_mask],
+            minlength=len(self.manufacturers) + 1,
+        )
+        tag_counts = np.bitwise_count(
+            self.tag_bits & np.packbits(category_mask & manufacturer_mask & price_mask)
+        ).sum(axis=1, dtype=np.int64)
+
+        edges = np.array(settings.CATALOG_FACET_PRICE_EDGES, dtype=float)
+        bucket_prices = prices[category_mask & manufacturer_mask & tag_mask]
+        bucket_counts = np.bincount(
+            np.searchsorted(edges, bucket_prices, side="right"),
+            minlength=len(edges) + 1,
+        )
+        price_buckets = [
+            {
+                "min": Decimal(str(low)).quantize(Decimal("0.01")),
+                "max": (
+                    Decimal(str(high)).quantize(Decimal("0.01"))
+                    if high is not None
+                    else None
+                ),
+                "count": int(count),
+            }
+            for low, high, count in zip(
+                [0.0, *edges.tolist()], [*edges.tolist(), None], bucket_counts
+            )
+        ]
+
+        return {
+            "total": int(
+                (category_mask & manufacturer_mask & tag_mask & price_mask).sum()
+            ),
+            "categories": _entries(
+                self.categories, category_counts, filters.categories
+            ),
+            "manufacturers": _entries(
+                self.manufacturers, manufacturer_counts, filters.manufacturers
+            ),
+            "tags": _entries(
+                self.tags, tag_counts, filters.tags, selected_by=lambda row: row[2]
+            ),
+            "price_buckets": price_buckets,
+        }
+
+    def _masks(self, filters: FacetFilters, now: datetime):
+        everything = np.ones(self.size, dtype=bool)
+        prices = self.current_prices(now)
+
+        category_mask = everything
+        if filters.categories:
+            category_mask = np.isin(
+                self.category_codes, _codes(self.category_code, filters.categories)
+            )
+        manufacturer_mask = everything
+        if filters.manufacturers:
+            manufacturer_mask = np.isin(
+                self.manufacturer_codes,
+                _codes(self.manufacturer_code, filters.manufacturers),
+            )
+        tag_mask = everything
+        if filters.tags:
+            # Like ProductFilter.tags, a product matches if it has any of them.
+            any_tag = np.zeros(self.tag_bits.shape[1], dtype=np.uint8)
+            for code in _codes(self.tag_code, filters.tags):
+                any_tag |= self.tag_bits[code]
+            tag_mask = np.unpackbits(any_tag, count=self.size).astype(bool)
+        price_mask = everything.copy()
+        if filters.price_gte is not None:
+            price_mask &= prices >= float(filters.price_gte)
+        if filters.price_gt is not None:
+            price_mask &= prices > float(filters.price_gt)
+        if filters.price_lte is not None:
+            price_mask &= prices <= float(filters.price_lte)
+        if filters.price_lt is not None:
+            price_mask &= prices < float(filters.price_lt)
+        return category_mask, manufacturer_mask, tag_mask, price_mask, prices
+
+
+def _timestamp(moment: datetime | None) -> float:
+    return moment.timestamp() if moment is not None else np.nan
+
+
+def _codes(codes: dict, selected) -> list[int]:
+    return [codes[value] for value in selected if value in codes]
+
+
+def _entries(rows, counts, selected, selected_by=lambda row: row[0]) -> list[dict]:
+    return [
+        {"id": row[0], "name": row[1], "slug": row[2], "count": int(count)}
+        for row, count in zip(rows, counts)
+        if count or selected_by(row) in selected
+    ]
+
+
+def _by_name(records) -> list[tuple[int, str, str]]:
+    return sorted(
+        ((record.id, record.name, record.slug) for record in records),
+        key=lambda row: (row[1], row[0]),
+    )
@@ -0,0 +1,131 @@
+import logging
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core import signing
+from django.db import transaction
+from django.utils import timezone
+
+from apps.catalog.models import Product, ProductImage
+from shopdjango.utils import presign_upload
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_TOKEN_SALT = "catalog.product-image-upload"
+
+# Bytes read from the start of an upload to check its file signature.
+SIGNATURE_BYTES = 32
+
+
+class ProductImageUploadService:
+    """
+    Product image uploads that go straight from the client to the bucket.
+
+    ``issue`` hands out a presigned POST for a fresh key plus a signed token
+    naming that key and the product; once the client has uploaded, the token
+    is confirmed and the ``ProductImage`` is created pointing at the key.
+    The web process only signs, checks that the object exists and that its
+    first bytes match the declared image type (the presigned policy pins the
+    Content-Type header, not the content); resizing happens in the variant
+    pipeline.
+    """
+
+    @staticmethod
+    def issue(product: Product, content_type: str) -> dict:
+        """
+        Reserve a key for a new image of ``product``.
+
+        Returns:
+            Dict with the POST ``url`` and form ``fields``, the ``key``, the
+            ``upload_token`` to confirm with and when the URL ``expires_at``
+        """
+        extension = settings.PRODUCT_IMAGE_UPLOAD_CONTENT_TYPES[content_type]
+        key = f"{uuid.uuid4().hex}{extension}"
+        expires = settings.PRODUCT_IMAGE_UPLOAD_EXPIRES_SECONDS
+        upload = presign_upload(
+            key, content_type, settings.PRODUCT_IMAGE_UPLOAD_MAX_BYTES, expires
+        )
+        return {
+            "url": upload["url"],
+            "fields": upload["fields"],
+            "key": key,
+            "upload_token": signing.dumps(
+                {"key": key, "product": product.pk}, salt=UPLOAD_TOKEN_SALT
+            ),
+            "expires_at": timezone.now() + timedelta(seconds=expires),
+        }
+
+    @staticmethod
+    def read_token(token: str) -> dict | None:
+        """The key and product id of a valid upload token, or None."""
+        try:
+            return signing.loads(
+                token,
+                salt=UPLOAD_TOKEN_SALT,
+                max_age=settings.PRODUCT_IMAGE_UPLOAD_CONFIRM_SECONDS,
+            )
+        except signing.BadSignature:
+            return None
+
+    @staticmethod
+    def uploaded(key: str) -> bool:
+        """Whether the object for ``key`` is in the bucket (a HEAD request)."""
+        return ProductImage._meta.get_field("image").storage.exists(key)
+
+    @staticmethod
+    def is_image(key: str) -> bool:
+        """Whether the uploaded object starts with the signature of its type."""
+        storage = ProductImage._meta.get_field("image").storage
+        bucket = getattr(storage, "bucket", None)
+        if bucket is not None:
+            # Ranged GET: only the signature is transferred, not the upload.
+            response = bucket.Object(key).get(Range=f"bytes=0-{SIGNATURE_BYTES - 1}")
+            head = response["Body"].read()
+        else:
+            with storage.open(key, "rb") as handle:
+                head = handle.read(SIGNATURE_BYTES)
+        return _has_signature(key.rsplit(".", 1)[-1], head)
+
+    @staticmethod
+    def discard(key: str) -> None:
+        """Delete a rejected upload so it is not left publicly readable."""
+        ProductImage._meta.get_field("image").storage.delete(key)
+        logger.warning(
+            f"Discarded upload {key}: content is not the declared image type"
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def confirm(
+        product_id: int, key: str, is_primary: bool = False, sort_order: int = 0
+    ) -> tuple[ProductImage, bool]:
+        """
+        Register an uploaded object as a product image.
+
+        Confirming the same key again returns the existing image.
+
+        Returns:
+            The image and whether it was created now
+        """
+        product = Product.objects.select_for_update().get(pk=product_id)
+        image = ProductImage.objects.filter(image=key).first()
+        if image is not None:
+            return image, False
+        image = ProductImage.objects.create(
+            product=product, image=key, is_primary=is_primary, sort_order=sort_order
+        )
+        logger.info(f"Registered uploaded image {key} for product {product.pk}")
+        return image, True
+
+
+def _has_signature(extension: str, head: bytes) -> bool:
+    if extension == "jpg":
+        return head.startswith(b"\xff\xd8\xff")
+    if extension == "png":
+        return head.startswith(b"\x89PNG\r\n\x1a\n")
+    if extension == "webp":
+        return head[:4] == b"RIFF" and head[8:12] == b"WEBP"
+    if extension == "avif":
+        return head[4:8] == b"ftyp" and (b"avif" in head[8:] or b"avis" in head[8:])
+    return False
@@ -0,0 +1,189 @@
+import io
+import logging
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from PIL import Image, ImageOps, features
+
+from apps.catalog.models import Product, ProductImage
+from apps.catalog.services.catalog_version import CatalogVersion
+
+logger = logging.getLogger(__name__)
+
+
+class VariantFormat(NamedTuple):
+    pil_format: str
+    extension: str
+    content_type: str
+    save_options: dict
+
+
+VARIANT_FORMATS = {
+    "avif": VariantFormat("AVIF", "avif", "image/avif", {"quality": 55}),
+    "webp": VariantFormat("WEBP", "webp", "image/webp", {"quality": 80, "method": 4}),
+    "jpeg": VariantFormat(
+        "JPEG", "jpg", "image/jpeg", {"quality": 85, "optimize": True}
+    ),
+}
+
+
+class ImageVariantService:
+    """
+    Resized copies of product images in modern formats.
+
+    Every size in ``PRODUCT_IMAGE_VARIANT_WIDTHS`` is encoded in each format of
+    ``PRODUCT_IMAGE_VARIANT_FORMATS`` the installed Pillow supports and stored
+    next to the original as ``<original stem>_<size>.<ext>``. The keys are kept
+    on ``ProductImage.variants`` together with the original key they were made
+    from, so replacing the image invalidates them.
+    """
+
+    @staticmethod
+    def supported_formats() -> list[str]:
+        """Configured variant formats this Pillow build can encode."""
+        return [
+            name
+            for name in settings.PRODUCT_IMAGE_VARIANT_FORMATS
+            if name == "jpeg" or features.check(name)
+        ]
+
+    @staticmethod
+    def accepted_formats(request) -> list[str]:
+        """
+        Variant formats to offer the client, best first.
+
+        Clients that list image types in ``Accept`` get exactly those (JPEG is
+        always acceptable); API clients that do not are assumed to handle
+        ``PRODUCT_IMAGE_DEFAULT_FORMATS``.
+        """
+        accept = request.headers.get("Accept", "") if request is not None else ""
+        if "image/" not in accept:
+            return list(settings.PRODUCT_IMAGE_DEFAULT_FORMATS)
+        return [
+            name
+            for name in settings.PRODUCT_IMAGE_VARIANT_FORMATS
+            if name == "jpeg" or VARIANT_FORMATS[name].content_type in accept
+        ]
+
+    @staticmethod
+    def pick(variants: dict, size: str, formats: list[str]) -> str | None:
+        """Key of the first available variant of ``size`` in ``formats``."""
+        by_format = variants.get(size, {})
+        for name in formats:
+            if name in by_format:
+                return by_format[name]
+        return None
+
+    @classmethod
+    def generate(cls, image_id: int) -> dict | None:
+        """
+        Create and record the variants of a product image.
+
+        Images whose variants are current are skipped. An original that
+        cannot be decoded is recorded with no variants, so clients keep
+        getting the original and the backfill does not retry it.
+
+        Returns:
+            The recorded variants, or None if nothing was done
+        """
+        image = ProductImage.objects.filter(pk=image_id).first()
+        if (
+            image is None
+            or not image.image
+            or image.variants_source == image.image.name
+        ):
+            return None
+
+        source = image.image.name
+        storage = image.image.storage
+        try:
+            variants = cls._encode(storage, source)
+        except (OSError, Image.DecompressionBombError) as exc:
+            logger.warning(f"Cannot create variants of image {source}: {exc}")
+            variants = {}
+
+        recorded = ProductImage.objects.filter(pk=image.pk, image=source).update(
+            variants=variants, variants_source=source
+        )
+        if not recorded:
+            # Replaced while we were working; the new image gets its own run.
+            cls._delete(storage, variants)
+            return None
+        cls._delete(storage, image.variants, keep=variants)
+        Product.objects.filter(pk=image.product_id).update(updated_at=timezone.now())
+        transaction.on_commit(CatalogVersion.bump)
+        logger.info(f"Created {sum(map(len, variants.values()))} variants of {source}")
+        return variants
+
+    @staticmethod
+    def stale_ids(limit: int) -> list[int]:
+        """Images whose variants are missing or belong to a previous original."""
+        return list(
+            ProductImage.objects.exclude(image="")
+            .exclude(variants_source=F("image"))
+            .order_by("id")
+            .values_list("id", flat=True)[:limit]
+        )
+
+    @classmethod
+    def _encode(cls, storage, source: str) -> dict:
+        with storage.open(source, "rb") as handle:
+            original = Image.open(handle)
+            original.load()
+        original = ImageOps.exif_transpose(original)
+        stem = source.rsplit(".", 1)[0]
+        formats = cls.supported_formats()
+
+        variants = {}
+        saved = {}
+        try:
+            for size, width in settings.PRODUCT_IMAGE_VARIANT_WIDTHS.items():
+                resized = _fit_width(original, width)
+                variants[size] = {}
+                for name in formats:
+                    # Sizes larger than the original reuse the same file.
+                    if (resized.size, name) not in saved:
+                        saved[resized.size, name] = _save(
+                            storage, resized, f"{stem}_{size}", VARIANT_FORMATS[name]
+                        )
+                    variants[size][name] = saved[resized.size, name]
+        except Exception:
+            cls._delete(storage, variants)
+            raise
+        return variants
+
+    @staticmethod
+    def _delete(storage, variants: dict, keep: dict | None = None) -> None:
+        kept = {
+            key for by_format in (keep or {}).values() for key in by_format.values()
+        }
+        for key in {
+            key for by_format in variants.values() for key in by_format.values()
+        }:
+            if key not in kept:
+                storage.delete(key)
+
+
+def _fit_width(image: Image.Image, width: int) -> Image.Image:
+    if image.width <= width:
+        return image
+    height = max(1, round(image.height * width / image.width))
+    return image.resize((width, height), Image.Resampling.LANCZOS)
+
+
+def _save(storage, image: Image.Image, name: str, variant_format: VariantFormat) -> str:
+    if image.mode not in {"RGB", "RGBA"}:
+        image = image.convert("RGBA" if image.has_transparency_data else "RGB")
+    if image.mode == "RGBA" and variant_format.pil_format == "JPEG":
+        background = Image.new("RGB", image.size, "white")
+        background.paste(image, mask=image)
+        image = background
+    buffer = io.BytesIO()
+    image.save(buffer, variant_format.pil_format, **variant_format.save_options)
+    content = ContentFile(buffer.getvalue())
+    content.content_type = variant_format.content_type
+    return storage.save(f"{name}.{variant_format.extension}", content)
@@ -0,0 +1,80 @@
+import logging
+from collections import Counter
+from typing import NamedTuple
+
+from django.db.models import Count
+
+from apps.catalog.models import Category, Manufacturer, Product
+
+logger = logging.getLogger(__name__)
+
+
+class CountedState(NamedTuple):
+    """The product fields that decide which counters include it."""
+
+    is_visible: bool
+    category_id: int | None
+    manufacturer_id: int | None
+
+    @classmethod
+    def of(cls, product: Product) -> "CountedState":
+        return cls(product.is_visible, product.category_id, product.manufacturer_id)
+
+
+class ProductCountService:
+    """Keeps Category/Manufacturer.active_product_count in step with products."""
+
+    @staticmethod
+    def _contributions(state: CountedState | None) -> Counter:
+        if state is None or not state.is_visible:
+            return Counter()
+        contributions = Counter({(Category, state.category_id): 1})
+        if state.manufacturer_id is not None:
+            contributions[(Manufacturer, state.manufacturer_id)] += 1
+        return contributions
+
+    @classmethod
+    def apply_change(
+        cls, previous: CountedState | None, current: CountedState | None
+    ) -> None:
+        """
+        Move counters from a product's previous state to its current one.
+
+        Args:
+            previous: State before the change, or None for a new product
+            current: State after the change, or None for a deleted product
+        """
+        deltas = cls._contributions(current)
+        deltas.subtract(cls._contributions(previous))
+        for (model, pk), delta in deltas.items():
+            if delta and pk is not None:
+                model.adjust_active_product_count(pk, delta)
+
+    @staticmethod
+    def reconcile() -> dict[str, int]:
+        """
+        Recount visible products and fix any drifted counters, e.g. after
+        queryset updates or bulk operations that bypass signals.
+
+        Returns:
+            Number of corrected rows per model
+        """
+        corrected = {}
+        for model, field in ((Category, "category"), (Manufacturer, "manufacturer")):
+            actual = dict(
+                Product.objects.filter(is_visible=True, **{f"{field}__isnull": False})
+                .order_by()
+                .values_list(field)
+                .annotate(total=Count("id"))
+            )
+            drifted = []
+            for obj in model.objects.only("id", "active_product_count"):
+                count = actual.get(obj.pk, 0)
+                if obj.active_product_count != count:
+                    obj.active_product_count = count
+                    drifted.append(obj)
+            model.objects.bulk_update(drifted, ["active_product_count"])
+            corrected[model._meta.model_name] = len(drifted)
+        if any(corrected.values()):
+            logger.warning(f"Corrected drifted product counters: {corrected}")
+        return corrected
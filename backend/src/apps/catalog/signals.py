@@ -1,14 +1,25 @@
 import logging
 from time import sleep
 import uuid
-from django.db.models.signals import post_save, pre_save
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 from django.dispatch import receiver
+from django.utils import timezone
 from decimal import Decimal
 
+from apps.catalog.models.category import Category
+from apps.catalog.models.manufacturer import Manufacturer
 from apps.catalog.models.product import Product
+from apps.catalog.models.product_image import ProductImage
+from apps.catalog.models.tag import Tag
 from apps.catalog.models.wishlist import WishlistItem
 from apps.catalog.models.notification import NotificationPreference, NotificationType
-from apps.catalog.tasks import send_wishlist_notification
+from apps.catalog.services.catalog_version import CatalogVersion
+from apps.catalog.services.product_count_service import (
+    CountedState,
+    ProductCountService,
+)
+from apps.catalog.tasks import generate_image_variants, send_wishlist_notification
 
 
 @receiver(pre_save, sender=Product)
@@ -20,10 +31,72 @@ def track_product_changes(sender, instance, **kwargs):
             instance._previous_stock = old.stock_quantity
             instance._previous_price = old.price
             instance._previous_is_visible = old.is_visible
+            instance._previous_counted_state = CountedState.of(old)
         except Product.DoesNotExist:
             instance._previous_stock = None
             instance._previous_price = None
             instance._previous_is_visible = None
+            instance._previous_counted_state = None
+
+
+@receiver(post_save, sender=Product)
+def update_active_product_counts(sender, instance, created, raw=False, **kwargs):
+    """Shift category/manufacturer counters by the product's visibility change."""
+    if raw:
+        return
+    previous = None if created else getattr(instance, "_previous_counted_state", None)
+    ProductCountService.apply_change(previous, CountedState.of(instance))
+
+
+@receiver(post_delete, sender=Product)
+def release_active_product_counts(sender, instance, **kwargs):
+    """Drop a deleted product from the counters it was part of."""
+    ProductCountService.apply_change(CountedState.of(instance), None)
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(m2m_changed, sender=Product.tags.through)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Manufacturer)
+@receiver(post_delete, sender=Manufacturer)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def bump_catalog_version(sender, **kwargs):
+    """Tell per-process catalog indexes to refresh once the change commits."""
+    if kwargs.get("action", "post_").startswith("post_"):
+        transaction.on_commit(CatalogVersion.bump)
+
+
+@receiver(m2m_changed, sender=Product.tags.through)
+def touch_products_on_tag_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """Mark re-tagged products as updated so catalog snapshots re-read them."""
+    if action == "pre_clear" and reverse:
+        product_ids = list(instance.product_set.values_list("id", flat=True))
+    elif action in {"post_add", "post_remove", "post_clear"}:
+        product_ids = pk_set if reverse else [instance.pk]
+    else:
+        return
+    if product_ids:
+        Product.objects.filter(pk__in=product_ids).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+def touch_product_on_image_change(sender, instance, **kwargs):
+    """A new primary image changes how the product is listed."""
+    Product.objects.filter(pk=instance.product_id).update(updated_at=timezone.now())
+    transaction.on_commit(CatalogVersion.bump)
+
+
+@receiver(post_save, sender=ProductImage)
+def queue_image_variants(sender, instance, raw=False, **kwargs):
+    """Resize a newly uploaded or replaced image in the background."""
+    if raw or not instance.image or instance.variants_source == instance.image.name:
+        return
+    image_id = instance.pk
+    transaction.on_commit(lambda: generate_image_variants.delay(image_id))
 
 
 @receiver(post_save, sender=Product)
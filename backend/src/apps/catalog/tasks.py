@@ -13,7 +13,9 @@ from apps.catalog.models.notification import (
     NotificationHistory,
     NotificationType,
 )
+from apps.catalog.services.image_variant_service import ImageVariantService
 from apps.catalog.services.notification_service import SimulatorNotificationService
+from apps.catalog.services.product_count_service import ProductCountService
 
 logger = logging.getLogger(__name__)
 
@@ -100,3 +102,26 @@ def send_wishlist_notification(
     )
 
     return
+
+
+@shared_task(name="catalog.reconcile_product_counts")
+def reconcile_product_counts() -> dict[str, int]:
+    """Repair category/manufacturer visible-product counters that drifted."""
+    return ProductCountService.reconcile()
+
+
+@shared_task(name="catalog.generate_image_variants")
+def generate_image_variants(image_id: int) -> None:
+    """Create the resized/re-encoded copies of an uploaded product image."""
+    ImageVariantService.generate(image_id)
+
+
+@shared_task(name="catalog.backfill_image_variants")
+def backfill_image_variants() -> int:
+    """Queue variant generation for images that have none for their original."""
+    image_ids = ImageVariantService.stale_ids(
+        settings.PRODUCT_IMAGE_VARIANT_BACKFILL_SIZE
+    )
+    for image_id in image_ids:
+        generate_image_variants.delay(image_id)
+    return len(image_ids)
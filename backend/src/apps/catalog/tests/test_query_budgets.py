@@ -0,0 +1,94 @@
+import pytest
+
+from apps.catalog.models import NotificationHistory, WishlistItem
+from apps.catalog.models.notification import NotificationType
+from conftest import DATASET_SIZES
+from shopdjango.query_metrics import query_budget
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize("size", DATASET_SIZES)
+def test_customer_product_list(size, customer, api_client, make_products):
+    make_products(size)
+    client = api_client(customer)
+
+    with query_budget(6):
+        response = client.get("/api/catalog/products/")
+
+    assert response.status_code == 200
+    assert response.data["count"] == size
+
+
+@pytest.mark.parametrize("size", DATASET_SIZES)
+def test_staff_product_list(size, employee, api_client, make_products):
+    make_products(size)
+    client = api_client(employee)
+
+    with query_budget(5):
+        response = client.get("/api/catalog/products/")
+
+    assert response.status_code == 200
+    assert response.data["count"] == size
+
+
+@pytest.mark.parametrize("size", DATASET_SIZES)
+def test_wishlist_list(size, customer, api_client, make_products):
+    for product in make_products(size):
+        WishlistItem.objects.create(user=customer, product=product)
+    client = api_client(customer)
+
+    with query_budget(1):
+        response = client.get("/api/catalog/wishlist/")
+
+    assert response.status_code == 200
+    assert len(response.data) == size
+
+
+@pytest.mark.parametrize("size", DATASET_SIZES)
+def test_wishlist_check(size, customer, make_user, api_client, make_products):
+    products = make_products(size)
+    wishlisted = {
+        product.id: WishlistItem.objects.create(user=customer, product=product).id
+        for product in products[::2]
+    }
+    # Another customer's wishlist must not leak into the answer.
+    WishlistItem.objects.create(user=make_user(), product=products[1])
+    requested = [product.id for product in reversed(products)]
+    client = api_client(customer)
+
+    with query_budget(1):
+        response = client.post(
+            "/api/catalog/wishlist/check/",
+            {"product_ids": requested + [requested[0]]},
+            format="json",
+        )
+
+    assert response.status_code == 200
+    assert response.data == [
+        {
+            "product_id": product_id,
+            "is_in_wishlist": product_id in wishlisted,
+            "wishlist_item_id": wishlisted.get(product_id),
+        }
+        for product_id in requested
+    ]
+
+
+@pytest.mark.parametrize("size", DATASET_SIZES)
+def test_notification_history_list(size, customer, api_client, make_products):
+    for product in make_products(size):
+        NotificationHistory.objects.create(
+            user=customer,
+            product=product,
+            notification_type=NotificationType.PRICE_DROP,
+            title="Price drop",
+            body="Cheaper now",
+        )
+    client = api_client(customer)
+
+    with query_budget(3):
+        response = client.get("/api/catalog/notifications/history/")
+
+    assert response.status_code == 200
+    assert response.data["count"] == size
@@ -14,6 +14,7 @@ class CategoryViewSet(BaseViewSet):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     pagination_class = None
+    read_replica_actions = {"list", "retrieve"}
 
     def get_permissions(self):
         return [ReadOnlyOrRoles({Profile.Role.ADMIN})]
@@ -34,12 +35,9 @@ class CategoryViewSet(BaseViewSet):
     pagination_class = None
 
     def get_queryset(self):
-        """Optimize queryset based on action."""
+        """Hide inactive categories from customers."""
         queryset = super().get_queryset()
 
-        if self.action in ["list", "retrieve"]:
-            queryset = queryset.prefetch_related("products")
-
         role = get_user_role(getattr(self.request, "user", None))
         if role not in {Profile.Role.ADMIN, Profile.Role.EMPLOYEE}:
             queryset = queryset.filter(is_active=True)
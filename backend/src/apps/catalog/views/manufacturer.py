@@ -31,6 +31,7 @@ class ManufacturerViewSet(BaseViewSet):
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ["id"]
     pagination_class = None
+    read_replica_actions = {"list", "retrieve"}
 
     ordering_fields = [
         "id",
@@ -118,7 +118,9 @@ class NotificationHistoryViewSet(BaseViewSet):
 
     def get_queryset(self):
         role = get_user_role(getattr(self.request, "user", None))
-        queryset = NotificationHistory.objects.select_related("product", "user")
+        queryset = NotificationHistory.objects.select_related(
+            "product__primary_image", "user"
+        )
 
         if role in [Profile.Role.ADMIN, Profile.Role.EMPLOYEE]:
             return queryset
@@ -1,4 +1,5 @@
 from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema
@@ -7,9 +8,16 @@ from apps.catalog.models import Product
 from apps.catalog.serializers import (
     ProductCreateSerializer,
     ProductDetailSerializer,
+    ProductFacetQuerySerializer,
+    ProductFacetsSerializer,
     ProductListSerializer,
 )
 from apps.catalog.filters import ProductFilter
+from apps.catalog.services.catalog_snapshot import (
+    SNAPSHOT_ORDERING_FIELDS,
+    CatalogSnapshot,
+    ProductRecord,
+)
 from django.db.models.functions import Lower
 from apps.profile.models import Profile
 from apps.profile.permissions import get_user_role, ReadOnlyOrRoles
@@ -20,6 +28,7 @@ class ProductViewSet(BaseViewSet):
     """ViewSet for Product model with advanced CRUD operations."""
 
     queryset = Product.objects.all()
+    read_replica_actions = {"list", "retrieve", "facets"}
 
     def get_permissions(self):
         return [ReadOnlyOrRoles({Profile.Role.ADMIN})]
@@ -57,9 +66,9 @@ class ProductViewSet(BaseViewSet):
         """Optimize queryset based on action and user permissions."""
         queryset = super().get_queryset()
 
-        queryset = queryset.select_related("category").prefetch_related(
-            "tags", "images"
-        )
+        queryset = queryset.select_related(
+            "category", "manufacturer", "primary_image"
+        ).prefetch_related("tags", "images")
 
         queryset = queryset.annotate(
             name_lower=Lower("name"),
@@ -69,6 +78,43 @@ class ProductViewSet(BaseViewSet):
             queryset = queryset.filter(is_visible=True)
         return queryset
 
+    def _snapshot_records(self, request) -> list[ProductRecord] | None:
+        """
+        Visible products for the request from the snapshot, or None when the
+        request needs the database (staff, search, or filters and orderings
+        the snapshot does not cover).
+        """
+        if get_user_role(request.user) in {Profile.Role.ADMIN, Profile.Role.EMPLOYEE}:
+            return None
+        paginator = self.paginator
+        supported = set(ProductFacetQuerySerializer().fields) | {
+            "ordering",
+            paginator.page_query_param,
+            paginator.page_size_query_param,
+        }
+        if not set(request.query_params) <= supported:
+            return None
+        query = ProductFacetQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return None
+        ordering = tuple(
+            term.strip()
+            for term in request.query_params.get("ordering", "").split(",")
+            if term.strip()
+        ) or tuple(self.ordering)
+        if any(term.lstrip("-") not in SNAPSHOT_ORDERING_FIELDS for term in ordering):
+            return None
+        return CatalogSnapshot.get().select(query.to_filters(), ordering)
+
+    def list(self, request, *args, **kwargs):
+        """Serve customers from the in-memory catalog snapshot when possible."""
+        records = self._snapshot_records(request)
+        if records is None:
+            return super().list(request, *args, **kwargs)
+        page = self.paginate_queryset(records)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
         if self.action == "create":
@@ -78,6 +124,24 @@ class ProductViewSet(BaseViewSet):
         else:
             return ProductDetailSerializer
 
+    @extend_schema(
+        summary="Product facet counts",
+        description=(
+            "Counts of visible products per category, manufacturer, tag and "
+            "price bucket for the given filters. Each facet is counted with "
+            "the other facets' filters applied, so every entry shows how many "
+            "products selecting it would give. Served from an in-memory index."
+        ),
+        parameters=[ProductFacetQuerySerializer],
+        responses={200: ProductFacetsSerializer},
+    )
+    @action(detail=False, methods=["get"])
+    def facets(self, request):
+        query = ProductFacetQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        facets = CatalogSnapshot.get().facet_index.facets(query.to_filters())
+        return Response(ProductFacetsSerializer(facets).data)
+
     @extend_schema(
         responses={
             200: {
@@ -3,11 +3,16 @@ from apps.common.models import BaseViewSet
 from rest_framework.filters import OrderingFilter, SearchFilter
 from drf_spectacular.utils import extend_schema
 from rest_framework.decorators import action
+from rest_framework import status
 from rest_framework.response import Response
 from apps.catalog.models import ProductImage
 from apps.catalog.serializers import (
+    ProductImageConfirmSerializer,
     ProductImageSerializer,
+    ProductImageUploadRequestSerializer,
+    ProductImageUploadSerializer,
 )
+from apps.catalog.services.image_upload_service import ProductImageUploadService
 from apps.profile.models import Profile
 from apps.profile.permissions import ReadOnlyOrRoles
 
@@ -47,6 +52,11 @@ class ProductImageViewSet(BaseViewSet):
         return queryset.select_related("product")
 
     @extend_schema(
+        description=(
+            "Upload through the API server. Prefer upload-url and "
+            "confirm-upload, which send the file straight to storage."
+        ),
+        deprecated=True,
         request={
             "multipart/form-data": {
                 "type": "object",
@@ -77,6 +87,54 @@ class ProductImageViewSet(BaseViewSet):
         """Create a new product image with file upload."""
         return super().create(request, *args, **kwargs)
 
+    @extend_schema(
+        summary="Get a direct upload URL",
+        description=(
+            "Returns a presigned POST: send the returned fields and then the "
+            "file (as the `file` field) to `url`, then call confirm-upload "
+            "with `upload_token`. The policy limits size and content type."
+        ),
+        request=ProductImageUploadRequestSerializer,
+        responses={201: ProductImageUploadSerializer},
+    )
+    @action(detail=False, methods=["post"], url_path="upload-url")
+    def upload_url(self, request) -> Response:
+        serializer = ProductImageUploadRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = ProductImageUploadService.issue(
+            serializer.validated_data["product"],
+            serializer.validated_data["content_type"],
+        )
+        return Response(
+            ProductImageUploadSerializer(upload).data, status=status.HTTP_201_CREATED
+        )
+
+    @extend_schema(
+        summary="Register a direct upload",
+        description=(
+            "Creates the product image for an uploaded file and queues its "
+            "resized variants. Confirming the same upload again returns the "
+            "existing image with 200."
+        ),
+        request=ProductImageConfirmSerializer,
+        responses={200: ProductImageSerializer, 201: ProductImageSerializer},
+    )
+    @action(detail=False, methods=["post"], url_path="confirm-upload")
+    def confirm_upload(self, request) -> Response:
+        serializer = ProductImageConfirmSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.validated_data["upload_token"]
+        image, created = ProductImageUploadService.confirm(
+            upload["product"],
+            upload["key"],
+            is_primary=serializer.validated_data["is_primary"],
+            sort_order=serializer.validated_data["sort_order"],
+        )
+        return Response(
+            self.get_serializer(image).data,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
     @extend_schema(
         summary="Set image as primary",
         description="Set this image as primary for its product",
@@ -87,13 +145,7 @@ class ProductImageViewSet(BaseViewSet):
     def set_primary(self, request, pk: int = None) -> Response:
         """Set this image as primary for its product."""
         image = self.get_object()
-
-        ProductImage.objects.filter(product=image.product, is_primary=True).exclude(
-            pk=image.pk
-        ).update(is_primary=False)
-
-        image.is_primary = True
-        image.save()
+        image.make_primary()
 
         serializer = self.get_serializer(image)
         return Response(serializer.data)
@@ -14,6 +14,7 @@ class TagViewSet(BaseViewSet):
 
     queryset = Tag.objects.all()
     serializer_class = TagSerializer
+    read_replica_actions = {"list", "retrieve"}
 
     def get_permissions(self):
         if self.request.method in SAFE_METHODS:
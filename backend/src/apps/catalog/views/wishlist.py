@@ -11,6 +11,7 @@ from apps.catalog.serializers import (
     WishlistItemSerializer,
     WishlistItemCreateSerializer,
     WishlistCheckSerializer,
+    WishlistCheckManySerializer,
 )
 from django_filters.rest_framework import DjangoFilterBackend
 
@@ -92,7 +93,9 @@ class WishlistViewSet(BaseViewSet):
 
     def get_queryset(self):
         """Return only the current user's wishlist items."""
-        return WishlistItem.objects.filter(user=self.request.user)
+        return WishlistItem.objects.filter(user=self.request.user).select_related(
+            "product__category", "product__manufacturer", "product__primary_image"
+        )
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -139,3 +142,34 @@ class WishlistViewSet(BaseViewSet):
         serializer = WishlistCheckSerializer(data=data)
         serializer.is_valid(raise_exception=True)
         return Response(serializer.data)
+
+    @extend_schema(
+        tags=["wishlist"],
+        request=WishlistCheckManySerializer,
+        responses={200: WishlistCheckSerializer(many=True)},
+        description=(
+            "Check which of the given products are in the wishlist. Returns one "
+            "entry per distinct product id, in request order."
+        ),
+    )
+    @action(detail=False, methods=["post"], url_path="check")
+    def check_products(self, request: Request) -> Response:
+        """Check many products against the user's wishlist in one query."""
+        serializer = WishlistCheckManySerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        product_ids = list(dict.fromkeys(serializer.validated_data["product_ids"]))
+
+        item_ids = dict(
+            WishlistItem.objects.filter(
+                user=request.user, product_id__in=product_ids
+            ).values_list("product_id", "id")
+        )
+        data = [
+            {
+                "product_id": product_id,
+                "is_in_wishlist": product_id in item_ids,
+                "wishlist_item_id": item_ids.get(product_id),
+            }
+            for product_id in product_ids
+        ]
+        return Response(WishlistCheckSerializer(data, many=True).data)
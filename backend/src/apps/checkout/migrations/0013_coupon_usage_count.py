@@ -0,0 +1,38 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_usage_count(apps, schema_editor):
+    Coupon = apps.get_model("checkout", "Coupon")
+    CouponRedemption = apps.get_model("checkout", "CouponRedemption")
+
+    redemption_counts = (
+        CouponRedemption.objects.filter(coupon=OuterRef("pk"))
+        .order_by()
+        .values("coupon")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    Coupon.objects.update(
+        usage_count=Coalesce(Subquery(redemption_counts), Value(0))
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("checkout", "0012_alter_shipment_options_remove_shipment_courier_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="coupon",
+            name="usage_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of redemptions, maintained on redemption create/delete",
+            ),
+        ),
+        migrations.RunPython(backfill_usage_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("checkout", "0013_coupon_usage_count"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="payment",
+            name="stripe_payment_intent_id",
+            field=models.CharField(
+                blank=True, db_index=True, max_length=255, null=True
+            ),
+        ),
+    ]
@@ -0,0 +1,86 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("catalog", "0009_remove_productimage_alt_text_and_more"),
+        ("checkout", "0014_payment_intent_id_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StockReservation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text="Timestamp when the record was created",
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True,
+                        help_text="Timestamp when the record was last updated",
+                    ),
+                ),
+                (
+                    "quantity",
+                    models.PositiveIntegerField(help_text="Number of units held"),
+                ),
+                (
+                    "expires_at",
+                    models.DateTimeField(
+                        help_text="Hold is ignored after this time and removed by the sweeper"
+                    ),
+                ),
+                (
+                    "cart",
+                    models.ForeignKey(
+                        help_text="Cart holding the stock",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stock_reservations",
+                        to="checkout.cart",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        help_text="Reserved product",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stock_reservations",
+                        to="catalog.product",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["expires_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["product", "expires_at"],
+                        name="checkout_st_product_cdc11e_idx",
+                    ),
+                    models.Index(
+                        fields=["expires_at"], name="checkout_st_expires_206f5f_idx"
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("cart", "product"),
+                        name="unique_cart_product_reservation",
+                    )
+                ],
+            },
+        ),
+    ]
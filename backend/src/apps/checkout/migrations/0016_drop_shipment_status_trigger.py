@@ -0,0 +1,39 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("checkout", "0015_stock_reservation"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+            DROP TRIGGER IF EXISTS shipment_status_trigger ON checkout_shipment;
+            DROP FUNCTION IF EXISTS update_order_status_on_shipment();
+            """,
+            reverse_sql="""
+            CREATE OR REPLACE FUNCTION update_order_status_on_shipment()
+            RETURNS TRIGGER AS $$
+            BEGIN
+                IF NEW.shipped_at IS NOT NULL AND (OLD.shipped_at IS NULL OR OLD.shipped_at IS NULL) THEN
+                    UPDATE checkout_order
+                    SET status = 'shipped'
+                    WHERE id = NEW.order_id;
+                ELSIF NEW.delivered_at IS NOT NULL AND (OLD.delivered_at IS NULL OR OLD.delivered_at IS NULL) THEN
+                    UPDATE checkout_order
+                    SET status = 'delivered'
+                    WHERE id = NEW.order_id;
+                END IF;
+
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql;
+
+            CREATE TRIGGER shipment_status_trigger
+                AFTER INSERT OR UPDATE ON checkout_shipment
+                FOR EACH ROW
+                EXECUTE FUNCTION update_order_status_on_shipment();
+            """,
+        ),
+    ]
@@ -0,0 +1,59 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_product_snapshot(apps, schema_editor):
+    OrderItem = apps.get_model("checkout", "OrderItem")
+    Product = apps.get_model("catalog", "Product")
+    ProductImage = apps.get_model("catalog", "ProductImage")
+
+    product = Product.objects.filter(pk=OuterRef("product_id"))
+    primary_image = ProductImage.objects.filter(
+        product_id=OuterRef("product_id"), is_primary=True
+    )
+    OrderItem.objects.update(
+        product_name=Subquery(product.values("name")[:1]),
+        product_sku=Subquery(product.values("sku")[:1]),
+        product_thumbnail_key=Coalesce(
+            Subquery(primary_image.values("image")[:1]), Value("")
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("catalog", "0009_remove_productimage_alt_text_and_more"),
+        ("checkout", "0016_drop_shipment_status_trigger"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="orderitem",
+            name="product_name",
+            field=models.CharField(
+                blank=True,
+                help_text="Product name at time of order",
+                max_length=200,
+            ),
+        ),
+        migrations.AddField(
+            model_name="orderitem",
+            name="product_sku",
+            field=models.CharField(
+                blank=True,
+                help_text="Product SKU at time of order",
+                max_length=100,
+            ),
+        ),
+        migrations.AddField(
+            model_name="orderitem",
+            name="product_thumbnail_key",
+            field=models.CharField(
+                blank=True,
+                help_text="Storage key of the primary product image at time of order",
+                max_length=255,
+            ),
+        ),
+        migrations.RunPython(backfill_product_snapshot, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,118 @@
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations, models
+
+# Mirrors SearchDocumentService.compose: lowercased, non-empty values joined
+# by single spaces, so the service sees backfilled rows as up to date.
+BACKFILL_ORDERS_SQL = """
+UPDATE checkout_order AS o
+SET search_document = d.document
+FROM (
+    SELECT
+        o2.id,
+        lower(concat_ws(
+            ' ',
+            NULLIF(o2.order_number, ''),
+            NULLIF(u.email, ''),
+            NULLIF(u.username, ''),
+            NULLIF(u.first_name, ''),
+            NULLIF(u.last_name, ''),
+            NULLIF(sm.name, ''),
+            NULLIF(cr.name, ''),
+            NULLIF(cp.code, ''),
+            NULLIF(cp.description, ''),
+            NULLIF(a.address, ''),
+            NULLIF(a.city, ''),
+            NULLIF(a.postal_code, ''),
+            NULLIF(c.name, '')
+        )) AS document
+    FROM checkout_order AS o2
+    JOIN auth_user AS u ON u.id = o2.user_id
+    JOIN checkout_shippingmethod AS sm ON sm.id = o2.shipping_method_id
+    LEFT JOIN checkout_courier AS cr ON cr.id = sm.courier_id
+    LEFT JOIN checkout_coupon AS cp ON cp.id = o2.applied_coupon_id
+    JOIN profile_address AS a ON a.id = o2.shipping_address_id
+    LEFT JOIN geographic_country AS c ON c.id = a.country_id
+) AS d
+WHERE o.id = d.id
+"""
+
+BACKFILL_CARTS_SQL = """
+UPDATE checkout_cart AS ca
+SET search_document = d.document
+FROM (
+    SELECT
+        ca2.id,
+        lower(concat_ws(
+            ' ',
+            NULLIF(u.email, ''),
+            NULLIF(u.username, ''),
+            NULLIF(u.first_name, ''),
+            NULLIF(u.last_name, ''),
+            NULLIF(a.address, ''),
+            NULLIF(a.city, ''),
+            NULLIF(sm.name, ''),
+            NULLIF(cp.code, '')
+        )) AS document
+    FROM checkout_cart AS ca2
+    LEFT JOIN auth_user AS u ON u.id = ca2.user_id
+    LEFT JOIN profile_address AS a ON a.id = ca2.shipping_address_id
+    LEFT JOIN checkout_shippingmethod AS sm ON sm.id = ca2.shipping_method_id
+    LEFT JOIN checkout_coupon AS cp ON cp.id = ca2.applied_coupon_id
+) AS d
+WHERE ca.id = d.id
+"""
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("checkout", "0018_backoffice_list_indexes"),
+        ("profile", "0008_profile_missing_checkout_fields"),
+        ("geographic", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="cart",
+            name="search_document",
+            field=models.TextField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Lowercased customer, address and shipping text for back-office search",
+            ),
+        ),
+        migrations.AddField(
+            model_name="order",
+            name="search_document",
+            field=models.TextField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Lowercased customer, address and shipping text for back-office search",
+            ),
+        ),
+        migrations.RunSQL(BACKFILL_ORDERS_SQL, migrations.RunSQL.noop),
+        migrations.RunSQL(BACKFILL_CARTS_SQL, migrations.RunSQL.noop),
+        AddIndexConcurrently(
+            model_name="cart",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_document"],
+                name="checkout_cart_search_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="order",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_document"],
+                name="checkout_order_search_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,116 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("checkout", "0019_search_documents"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SalesRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text="Timestamp when the record was created",
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True,
+                        help_text="Timestamp when the record was last updated",
+                    ),
+                ),
+                (
+                    "granularity",
+                    models.CharField(
+                        choices=[("hour", "Hour"), ("day", "Day")],
+                        help_text="Length of the period the row covers",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "bucket",
+                    models.DateTimeField(help_text="Start of the period (UTC)"),
+                ),
+                (
+                    "dimension",
+                    models.CharField(
+                        choices=[
+                            ("total", "Total"),
+                            ("product", "Product"),
+                            ("manufacturer", "Manufacturer"),
+                            ("tag", "Tag"),
+                            ("shipping_method", "Shipping method"),
+                            ("country", "Country"),
+                        ],
+                        help_text="What the row is grouped by",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "key",
+                    models.BigIntegerField(
+                        default=0,
+                        help_text="Id of the grouped object; 0 for totals and unknowns",
+                    ),
+                ),
+                (
+                    "label",
+                    models.CharField(
+                        blank=True,
+                        help_text="Name of the grouped object",
+                        max_length=255,
+                    ),
+                ),
+                (
+                    "orders_count",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Orders placed in the period"
+                    ),
+                ),
+                (
+                    "items_sold",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Units sold in the period"
+                    ),
+                ),
+                (
+                    "revenue",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        help_text="Order totals, or line totals for product-level dimensions",
+                        max_digits=14,
+                    ),
+                ),
+                (
+                    "coupon_orders",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Orders in the period that used a coupon"
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["granularity", "dimension", "bucket"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("granularity", "dimension", "bucket", "key"),
+                        name="unique_sales_rollup_row",
+                    )
+                ],
+            },
+        ),
+    ]
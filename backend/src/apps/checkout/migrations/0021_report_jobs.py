@@ -0,0 +1,153 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("checkout", "0020_sales_rollup"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReportJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text="Timestamp when the record was created",
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True,
+                        help_text="Timestamp when the record was last updated",
+                    ),
+                ),
+                (
+                    "report_type",
+                    models.CharField(
+                        choices=[
+                            ("orders", "Orders export"),
+                            ("sales_summary", "Sales summary"),
+                        ],
+                        help_text="Which report to build",
+                        max_length=30,
+                    ),
+                ),
+                (
+                    "file_format",
+                    models.CharField(
+                        choices=[
+                            ("csv", "CSV"),
+                            ("xlsx", "Excel"),
+                            ("parquet", "Parquet"),
+                        ],
+                        help_text="Artifact file format",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "params",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        help_text="Report parameters, e.g. the period",
+                    ),
+                ),
+                (
+                    "fingerprint",
+                    models.CharField(
+                        help_text="Hash of type, format and parameters used to reuse artifacts",
+                        max_length=64,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("ready", "Ready"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        help_text="Build status",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "artifact",
+                    models.FileField(
+                        blank=True, help_text="Built report file", upload_to="reports/"
+                    ),
+                ),
+                (
+                    "row_count",
+                    models.PositiveIntegerField(
+                        blank=True,
+                        help_text="Number of data rows in the artifact",
+                        null=True,
+                    ),
+                ),
+                (
+                    "error",
+                    models.TextField(blank=True, help_text="Failure reason, if any"),
+                ),
+                (
+                    "started_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="When a worker picked the job up",
+                        null=True,
+                    ),
+                ),
+                (
+                    "finished_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="When the artifact was stored or the job failed",
+                        null=True,
+                    ),
+                ),
+                (
+                    "requested_by",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="User who requested the report",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="report_jobs",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Report Job",
+                "verbose_name_plural": "Report Jobs",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["fingerprint", "-created_at"],
+                        name="checkout_re_fingerp_f53a75_idx",
+                    ),
+                    models.Index(
+                        fields=["requested_by", "-created_at"],
+                        name="checkout_re_request_9334b4_idx",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+def blank_intent_ids_to_null(apps, schema_editor):
+    Payment = apps.get_model("checkout", "Payment")
+    Payment.objects.filter(stripe_payment_intent_id="").update(
+        stripe_payment_intent_id=None
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("checkout", "0021_report_jobs"),
+    ]
+
+    operations = [
+        migrations.RunPython(blank_intent_ids_to_null, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="payment",
+            name="stripe_payment_intent_id",
+            field=models.CharField(blank=True, max_length=255, null=True, unique=True),
+        ),
+    ]
@@ -11,6 +11,9 @@ from apps.checkout.models.shipping_method import ShippingMethod
 from apps.checkout.models.coupon import Coupon, CouponRedemption
 from apps.checkout.models.invoice_template import InvoiceTemplate
 from apps.checkout.models.invoice import Invoice
+from apps.checkout.models.stock_reservation import StockReservation
+from apps.checkout.models.sales_rollup import SalesRollup
+from apps.checkout.models.report_job import ReportJob
 
 __all__ = [
     "Cart",
@@ -28,4 +31,7 @@ __all__ = [
     "CouponRedemption",
     "InvoiceTemplate",
     "Invoice",
+    "StockReservation",
+    "SalesRollup",
+    "ReportJob",
 ]
@@ -1,6 +1,7 @@
 from decimal import Decimal
 from django.db import models
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
 
 from apps.common.models import TimestampedModel
 
@@ -60,12 +61,23 @@ class Cart(TimestampedModel):
         default=Decimal("0.00"),
         help_text="Discount amount from applied coupon",
     )
+    search_document = models.TextField(
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Lowercased customer, address and shipping text for back-office search",
+    )
 
     class Meta:
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["user", "status"]),
             models.Index(fields=["status", "created_at"]),
+            GinIndex(
+                fields=["search_document"],
+                name="checkout_cart_search_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
         ]
 
     def __str__(self) -> str:
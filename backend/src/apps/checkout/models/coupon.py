@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import F
 from django.contrib.auth import get_user_model
 
 from apps.common.models import TimestampedModel
@@ -23,6 +24,11 @@ class Coupon(TimestampedModel):
     max_uses_per_user = models.PositiveIntegerField(
         default=1, help_text="Maximum uses per user"
     )
+    usage_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of redemptions, maintained on redemption create/delete",
+    )
 
     valid_from = models.DateTimeField()
     valid_until = models.DateTimeField()
@@ -35,6 +41,14 @@ class Coupon(TimestampedModel):
     def __str__(self) -> str:
         return f"{self.code} - {self.name}"
 
+    @classmethod
+    def adjust_usage_count(cls, coupon_id: int, delta: int) -> None:
+        """Atomically shift the stored redemption counter by ``delta``."""
+        queryset = cls.objects.filter(pk=coupon_id)
+        if delta < 0:
+            queryset = queryset.filter(usage_count__gte=-delta)
+        queryset.update(usage_count=F("usage_count") + delta)
+
 
 class CouponRedemption(TimestampedModel):
     """Track coupon usage by users."""
@@ -23,6 +23,9 @@ class Invoice(TimestampedModel):
         ordering = ["-created_at"]
         verbose_name = "Invoice"
         verbose_name_plural = "Invoices"
+        indexes = [
+            models.Index(fields=["-created_at"]),
+        ]
 
     def __str__(self) -> str:
         return f"Invoice {self.invoice_number} for Order {self.order.order_number}"
@@ -1,8 +1,13 @@
 from decimal import Decimal
 from django.db import models
+from django.db.models import F
 from django.contrib.auth import get_user_model
+from django.utils import timezone
+from django.contrib.postgres.indexes import GinIndex
 import uuid
 
+from apps.catalog.models import Product
+from apps.catalog.services.catalog_version import CatalogVersion
 from apps.common.models import TimestampedModel
 from apps.checkout.models.order_item import OrderItem
 from django.db import transaction
@@ -93,6 +98,12 @@ class Order(TimestampedModel):
         blank=True,
         help_text="Additional notes for the order",
     )
+    search_document = models.TextField(
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Lowercased customer, address and shipping text for back-office search",
+    )
 
     class Meta:
         ordering = ["-created_at"]
@@ -102,6 +113,12 @@ class Order(TimestampedModel):
             models.Index(fields=["user", "status"]),
             models.Index(fields=["order_number"]),
             models.Index(fields=["status", "created_at"]),
+            models.Index(fields=["user", "-created_at"]),
+            GinIndex(
+                fields=["search_document"],
+                name="checkout_order_search_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
         ]
 
     def __str__(self) -> str:
@@ -120,7 +137,7 @@ class Order(TimestampedModel):
     @classmethod
     def create_from_cart(cls, cart, payment) -> "Order":
         """Create order from cart and payment."""
-        cart_items = list(cart.items.all())
+        cart_items = list(cart.items.select_related("product__primary_image"))
         
         with transaction.atomic():
             order = cls.objects.create(
@@ -138,20 +155,38 @@ class Order(TimestampedModel):
 
             created_items = []
             for cart_item in cart_items:
+                primary_image = cart_item.product.primary_image
                 order_item = OrderItem.objects.create(
                     order=order,
                     product=cart_item.product,
+                    product_name=cart_item.product.name,
+                    product_sku=cart_item.product.sku,
+                    product_thumbnail_key=(
+                        primary_image.image.name if primary_image else ""
+                    ),
                     quantity=cart_item.quantity,
                     unit_price=cart_item.unit_price,
                     total_price=cart_item.total_price,
                 )
                 created_items.append(order_item)
                 
-                if cart_item.product.stock_quantity < cart_item.quantity:
-                    raise ValueError(f"Insufficient stock for product {cart_item.product.name}. Available: {cart_item.product.stock_quantity}, Requested: {cart_item.quantity}")
-                
-                cart_item.product.stock_quantity -= cart_item.quantity
-                cart_item.product.save(update_fields=['stock_quantity'])
+                # Conditional decrement: concurrent finalizations cannot
+                # oversell or overwrite each other's stock changes.
+                decremented = Product.objects.filter(
+                    pk=cart_item.product_id, stock_quantity__gte=cart_item.quantity
+                ).update(
+                    stock_quantity=F("stock_quantity") - cart_item.quantity,
+                    updated_at=timezone.now(),
+                )
+                if not decremented:
+                    available = (
+                        Product.objects.filter(pk=cart_item.product_id)
+                        .values_list("stock_quantity", flat=True)
+                        .first()
+                    )
+                    raise ValueError(f"Insufficient stock for product {cart_item.product.name}. Available: {available}, Requested: {cart_item.quantity}")
+
+            transaction.on_commit(CatalogVersion.bump)
 
             transaction.on_commit(lambda: cls._create_invoice_after_commit(order))
 
@@ -19,6 +19,21 @@ class OrderItem(TimestampedModel):
         related_name="order_items",
         help_text="Product that was ordered",
     )
+    product_name = models.CharField(
+        max_length=200,
+        blank=True,
+        help_text="Product name at time of order",
+    )
+    product_sku = models.CharField(
+        max_length=100,
+        blank=True,
+        help_text="Product SKU at time of order",
+    )
+    product_thumbnail_key = models.CharField(
+        max_length=255,
+        blank=True,
+        help_text="Storage key of the primary product image at time of order",
+    )
     quantity = models.PositiveIntegerField(
         help_text="Quantity ordered",
     )
@@ -44,7 +59,7 @@ class OrderItem(TimestampedModel):
 
     def __str__(self) -> str:
         return (
-            f"{self.quantity}x {self.product.name} in Order {self.order.order_number}"
+            f"{self.quantity}x {self.product_name} in Order {self.order.order_number}"
         )
 
     def save(self, *args, **kwargs) -> None:
@@ -23,7 +23,9 @@ class Payment(TimestampedModel):
         help_text="Current status of the payment",
     )
 
-    stripe_payment_intent_id = models.CharField(max_length=255, null=True, blank=True)
+    stripe_payment_intent_id = models.CharField(
+        max_length=255, null=True, blank=True, unique=True
+    )
     stripe_charge_id = models.CharField(max_length=255, null=True, blank=True)
     stripe_customer_id = models.CharField(max_length=255, null=True, blank=True)
 
@@ -0,0 +1,76 @@
+from django.conf import settings
+from django.db import models
+
+from apps.common.models import TimestampedModel
+
+
+class ReportJob(TimestampedModel):
+    """A report export built in the background and stored as a file."""
+
+    class ReportType(models.TextChoices):
+        ORDERS = "orders", "Orders export"
+        SALES_SUMMARY = "sales_summary", "Sales summary"
+
+    class FileFormat(models.TextChoices):
+        CSV = "csv", "CSV"
+        XLSX = "xlsx", "Excel"
+        PARQUET = "parquet", "Parquet"
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        RUNNING = "running", "Running"
+        READY = "ready", "Ready"
+        FAILED = "failed", "Failed"
+
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="report_jobs",
+        help_text="User who requested the report",
+    )
+    report_type = models.CharField(
+        max_length=30, choices=ReportType.choices, help_text="Which report to build"
+    )
+    file_format = models.CharField(
+        max_length=10, choices=FileFormat.choices, help_text="Artifact file format"
+    )
+    params = models.JSONField(
+        default=dict, blank=True, help_text="Report parameters, e.g. the period"
+    )
+    fingerprint = models.CharField(
+        max_length=64,
+        help_text="Hash of type, format and parameters used to reuse artifacts",
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+        help_text="Build status",
+    )
+    artifact = models.FileField(
+        upload_to="reports/", blank=True, help_text="Built report file"
+    )
+    row_count = models.PositiveIntegerField(
+        null=True, blank=True, help_text="Number of data rows in the artifact"
+    )
+    error = models.TextField(blank=True, help_text="Failure reason, if any")
+    started_at = models.DateTimeField(
+        null=True, blank=True, help_text="When a worker picked the job up"
+    )
+    finished_at = models.DateTimeField(
+        null=True, blank=True, help_text="When the artifact was stored or the job failed"
+    )
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = "Report Job"
+        verbose_name_plural = "Report Jobs"
+        indexes = [
+            models.Index(fields=["fingerprint", "-created_at"]),
+            models.Index(fields=["requested_by", "-created_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.report_type}.{self.file_format} #{self.pk} ({self.status})"
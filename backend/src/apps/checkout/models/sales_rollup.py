@@ -0,0 +1,81 @@
+from datetime import timedelta
+
+from django.db import models
+from django.db.models import Max
+
+from apps.common.models import TimestampedModel
+
+
+class SalesRollup(TimestampedModel):
+    """
+    Pre-aggregated sales for one hour or day, per grouping key.
+
+    Every rolled-up hour has a ``total`` row, even when nothing sold, so the
+    latest one marks how far the rollup has progressed. Closed periods never
+    change; the open hour is computed live by the analytics engine.
+    """
+
+    class Granularity(models.TextChoices):
+        HOUR = "hour", "Hour"
+        DAY = "day", "Day"
+
+    class Dimension(models.TextChoices):
+        TOTAL = "total", "Total"
+        PRODUCT = "product", "Product"
+        MANUFACTURER = "manufacturer", "Manufacturer"
+        TAG = "tag", "Tag"
+        SHIPPING_METHOD = "shipping_method", "Shipping method"
+        COUNTRY = "country", "Country"
+
+    granularity = models.CharField(
+        max_length=10,
+        choices=Granularity.choices,
+        help_text="Length of the period the row covers",
+    )
+    bucket = models.DateTimeField(help_text="Start of the period (UTC)")
+    dimension = models.CharField(
+        max_length=20,
+        choices=Dimension.choices,
+        help_text="What the row is grouped by",
+    )
+    key = models.BigIntegerField(
+        default=0, help_text="Id of the grouped object; 0 for totals and unknowns"
+    )
+    label = models.CharField(
+        max_length=255, blank=True, help_text="Name of the grouped object"
+    )
+    orders_count = models.PositiveIntegerField(
+        default=0, help_text="Orders placed in the period"
+    )
+    items_sold = models.PositiveIntegerField(
+        default=0, help_text="Units sold in the period"
+    )
+    revenue = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        help_text="Order totals, or line totals for product-level dimensions",
+    )
+    coupon_orders = models.PositiveIntegerField(
+        default=0, help_text="Orders in the period that used a coupon"
+    )
+
+    class Meta:
+        ordering = ["granularity", "dimension", "bucket"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["granularity", "dimension", "bucket", "key"],
+                name="unique_sales_rollup_row",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.dimension} {self.key} @ {self.bucket:%Y-%m-%d %H:00} ({self.granularity})"
+
+    @classmethod
+    def rolled_until(cls):
+        """End of the last rolled-up hour, or None before the first run."""
+        latest = cls.objects.filter(
+            granularity=cls.Granularity.HOUR, dimension=cls.Dimension.TOTAL
+        ).aggregate(latest=Max("bucket"))["latest"]
+        return latest + timedelta(hours=1) if latest else None
@@ -25,6 +25,9 @@ class Shipment(TimestampedModel):
         ordering = ["-created_at"]
         verbose_name = "Shipment"
         verbose_name_plural = "Shipments"
+        indexes = [
+            models.Index(fields=["-created_at"]),
+        ]
 
     def __str__(self) -> str:
         return f"Shipment for Order {self.order.order_number}"
@@ -0,0 +1,60 @@
+from django.db import models
+from django.db.models import Sum
+from django.utils import timezone
+
+from apps.common.models import TimestampedModel
+from apps.catalog.models import Product
+
+
+class StockReservation(TimestampedModel):
+    """Temporary hold on product stock while a cart is being paid for."""
+
+    cart = models.ForeignKey(
+        "Cart",
+        on_delete=models.CASCADE,
+        related_name="stock_reservations",
+        help_text="Cart holding the stock",
+    )
+    product = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        related_name="stock_reservations",
+        help_text="Reserved product",
+    )
+    quantity = models.PositiveIntegerField(help_text="Number of units held")
+    expires_at = models.DateTimeField(
+        help_text="Hold is ignored after this time and removed by the sweeper"
+    )
+
+    class Meta:
+        ordering = ["expires_at"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["cart", "product"], name="unique_cart_product_reservation"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["product", "expires_at"]),
+            models.Index(fields=["expires_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.quantity}x product {self.product_id} for cart {self.cart_id}"
+
+    @classmethod
+    def reserved_quantities(
+        cls, product_ids, exclude_cart_id: int | None = None
+    ) -> dict[int, int]:
+        """Sum unexpired holds per product, optionally ignoring one cart's own."""
+        queryset = cls.objects.filter(
+            product_id__in=product_ids, expires_at__gt=timezone.now()
+        )
+        if exclude_cart_id is not None:
+            queryset = queryset.exclude(cart_id=exclude_cart_id)
+        rows = (
+            queryset.order_by()
+            .values("product_id")
+            .annotate(total=Sum("quantity"))
+            .values_list("product_id", "total")
+        )
+        return dict(rows)
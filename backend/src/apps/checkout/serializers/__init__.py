@@ -25,12 +25,21 @@ from apps.checkout.serializers.coupon import (
 from apps.checkout.serializers.invoice import (
     InvoiceTemplateSerializer,
     InvoiceSerializer,
+    InvoiceListSerializer,
 )
 from apps.checkout.serializers.courier import CourierSerializer
-from apps.checkout.serializers.shipment import ShipmentSerializer
+from apps.checkout.serializers.shipment import (
+    ShipmentSerializer,
+    ShipmentStatusBatchSerializer,
+    ShipmentStatusBatchResponseSerializer,
+)
 from apps.checkout.serializers.order_processing_note import (
     OrderProcessingNoteSerializer,
 )
+from apps.checkout.serializers.report_job import (
+    ReportJobCreateSerializer,
+    ReportJobSerializer,
+)
 
 __all__ = [
     "CartSerializer",
@@ -53,7 +62,12 @@ __all__ = [
     "CouponRemoveResponseSerializer",
     "InvoiceTemplateSerializer",
     "InvoiceSerializer",
+    "InvoiceListSerializer",
     "CourierSerializer",
     "ShipmentSerializer",
+    "ShipmentStatusBatchSerializer",
+    "ShipmentStatusBatchResponseSerializer",
     "OrderProcessingNoteSerializer",
+    "ReportJobCreateSerializer",
+    "ReportJobSerializer",
 ]
@@ -1,5 +1,11 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
 from rest_framework import serializers
 
+from apps.checkout.models import SalesRollup
+
 
 class ShippingMethodEntrySerializer(serializers.Serializer):
     name = serializers.CharField()
@@ -74,3 +80,73 @@ class DashboardStatsSerializer(serializers.Serializer):
 
     class Meta:
         ref_name = "DashboardStats"
+
+
+class SalesSeriesQuerySerializer(serializers.Serializer):
+    """Query parameters of the sales series endpoint."""
+
+    group_by = serializers.ChoiceField(
+        choices=SalesRollup.Dimension.choices, default=SalesRollup.Dimension.TOTAL
+    )
+    start = serializers.DateTimeField(required=False)
+    end = serializers.DateTimeField(required=False)
+    bucket = serializers.RegexField(
+        r"^[1-9]\d*[hd]$",
+        default="1d",
+        help_text="Bucket length in hours or days, e.g. 1h, 6h, 1d, 7d",
+    )
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=10)
+
+    def validate_bucket(self, value):
+        amount, unit = int(value[:-1]), value[-1]
+        return timedelta(hours=amount) if unit == "h" else timedelta(days=amount)
+
+    def validate(self, attrs):
+        end = attrs.get("end") or timezone.now()
+        start = attrs.get("start") or end - timedelta(days=7)
+        if start >= end:
+            raise serializers.ValidationError("start must be before end")
+        if (end - start) / attrs["bucket"] > settings.SALES_ANALYTICS_MAX_BUCKETS:
+            raise serializers.ValidationError(
+                f"Range spans more than {settings.SALES_ANALYTICS_MAX_BUCKETS} buckets"
+            )
+        attrs["start"] = start
+        attrs["end"] = end
+        return attrs
+
+
+class SalesSeriesTotalsSerializer(serializers.Serializer):
+    orders_count = serializers.IntegerField()
+    items_sold = serializers.IntegerField()
+    revenue = serializers.FloatField()
+    coupon_orders = serializers.IntegerField()
+
+    class Meta:
+        ref_name = "SalesSeriesTotals"
+
+
+class SalesSeriesEntrySerializer(serializers.Serializer):
+    key = serializers.IntegerField()
+    label = serializers.CharField()
+    orders_count = serializers.ListField(child=serializers.IntegerField())
+    items_sold = serializers.ListField(child=serializers.IntegerField())
+    revenue = serializers.ListField(child=serializers.FloatField())
+    coupon_orders = serializers.ListField(child=serializers.IntegerField())
+    totals = SalesSeriesTotalsSerializer()
+
+    class Meta:
+        ref_name = "SalesSeriesEntry"
+
+
+class SalesSeriesSerializer(serializers.Serializer):
+    """Bucketed sales metrics grouped by one dimension."""
+
+    group_by = serializers.CharField()
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField()
+    bucket = serializers.CharField()
+    buckets = serializers.ListField(child=serializers.DateTimeField())
+    series = SalesSeriesEntrySerializer(many=True)
+
+    class Meta:
+        ref_name = "SalesSeries"
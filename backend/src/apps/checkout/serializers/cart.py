@@ -2,6 +2,9 @@ from rest_framework import serializers
 from decimal import Decimal
 
 from apps.checkout.models import Cart, CartItem
+from apps.checkout.services.stock_reservation_service import (
+    StockReservationService,
+)
 from apps.catalog.models import Product
 from apps.catalog.serializers.product import ProductListSerializer
 from apps.profile.serializers.address import AddressSerializer
@@ -70,15 +73,27 @@ class CartItemCreateSerializer(serializers.ModelSerializer):
             "quantity",
         ]
 
-    def validate_quantity(self, value: int) -> int:
-        """Validate quantity against product stock."""
-        product = self.initial_data.get("product_id")
-        if product and hasattr(product, "stock_quantity"):
-            if value > product.stock_quantity:
+    def validate(self, attrs):
+        """Validate quantity against stock not held by other carts."""
+        product = attrs.get("product")
+        quantity = attrs.get("quantity", 1)
+        request = self.context.get("request")
+        if product and request and request.user.is_authenticated:
+            cart_id = (
+                Cart.objects.filter(user=request.user, status=Cart.CartStatus.ACTIVE)
+                .values_list("id", flat=True)
+                .first()
+            )
+            available_stock = StockReservationService.available_quantity(
+                product, exclude_cart_id=cart_id
+            )
+            if quantity > available_stock:
                 raise serializers.ValidationError(
-                    f"Requested quantity ({value}) exceeds available stock ({product.stock_quantity})"
+                    {
+                        "quantity": f"Requested quantity ({quantity}) exceeds available stock ({available_stock})"
+                    }
                 )
-        return value
+        return attrs
 
 
 class CartItemQuantitySerializer(serializers.Serializer):
@@ -99,10 +114,13 @@ class CartItemUpdateQuantitySerializer(serializers.Serializer):
     def validate_quantity(self, value: int) -> int:
         """Validate quantity against product stock."""
         cart_item = self.context.get("cart_item")
-        if cart_item and cart_item.product.stock_quantity:
-            if value > cart_item.product.stock_quantity:
+        if cart_item:
+            available_stock = StockReservationService.available_quantity(
+                cart_item.product, exclude_cart_id=cart_item.cart_id
+            )
+            if value > available_stock:
                 raise serializers.ValidationError(
-                    f"Requested quantity ({value}) exceeds available stock ({cart_item.product.stock_quantity})"
+                    f"Requested quantity ({value}) exceeds available stock ({available_stock})"
                 )
         return value
 
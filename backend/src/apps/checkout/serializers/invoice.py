@@ -72,3 +72,17 @@ class InvoiceSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = ["invoice_number", "created_at", "updated_at"]
+
+
+class InvoiceListSerializer(InvoiceSerializer):
+    """Invoice row for back-office tables, without the rendered HTML."""
+
+    class Meta(InvoiceSerializer.Meta):
+        fields = [
+            "id",
+            "order",
+            "order_number",
+            "invoice_number",
+            "created_at",
+            "updated_at",
+        ]
@@ -1,15 +1,35 @@
 from rest_framework import serializers
 from apps.checkout.models.order import Order, OrderItem
-from apps.catalog.serializers.product import ProductDetailSerializer
+from shopdjango.utils import presign_download
 from apps.profile.serializers.address import AddressSerializer
 from apps.checkout.serializers.shipping_method import ShippingMethodSerializer
 from apps.checkout.serializers.coupon import CouponSerializer
 
 
+class OrderItemProductSerializer(serializers.ModelSerializer):
+    """Product as it was when the order was placed, read from the order line."""
+
+    id = serializers.IntegerField(source="product_id", read_only=True)
+    name = serializers.CharField(source="product_name", read_only=True)
+    sku = serializers.CharField(source="product_sku", read_only=True)
+    primary_image = serializers.SerializerMethodField()
+
+    class Meta:
+        model = OrderItem
+        fields = ["id", "name", "sku", "primary_image"]
+
+    def get_primary_image(self, obj: OrderItem) -> str | None:
+        if obj.product_thumbnail_key:
+            return presign_download(
+                obj.product_thumbnail_key, expires=3600, as_attachment=False
+            )
+        return None
+
+
 class OrderItemSerializer(serializers.ModelSerializer):
     """Serializer for order items."""
 
-    product = ProductDetailSerializer(read_only=True)
+    product = OrderItemProductSerializer(source="*", read_only=True)
 
     class Meta:
         model = OrderItem
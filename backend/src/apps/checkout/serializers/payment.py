@@ -2,8 +2,8 @@ from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_serializer
 
 from apps.checkout.models import Payment
+from apps.common.services.reference_data import ReferenceData
 from apps.profile.models import Address
-from apps.checkout.models import ShippingMethod
 
 
 class CreateCheckoutSessionSerializer(serializers.Serializer):
@@ -32,11 +32,9 @@ class CreateCheckoutSessionSerializer(serializers.Serializer):
 
     def validate_shipping_method_id(self, value):
         """Validate that the shipping method exists."""
-        try:
-            ShippingMethod.objects.get(id=value)
-            return value
-        except ShippingMethod.DoesNotExist:
+        if ReferenceData.get().shipping_method(value) is None:
             raise serializers.ValidationError("Shipping method not found")
+        return value
 
     def set_shipping_on_cart(self, cart):
         """Set shipping address and method on the cart."""
@@ -48,7 +46,7 @@ class CreateCheckoutSessionSerializer(serializers.Serializer):
             cart.shipping_address = address
 
         if shipping_method_id:
-            shipping_method = ShippingMethod.objects.get(id=shipping_method_id)
+            shipping_method = ReferenceData.get().shipping_method(shipping_method_id)
             cart.shipping_method = shipping_method
 
         cart.save()
@@ -73,8 +71,9 @@ class PaymentConfirmationResponseSerializer(serializers.Serializer):
     """Serializer for payment confirmation response."""
 
     success = serializers.BooleanField()
+    status = serializers.CharField()
     payment_id = serializers.IntegerField()
-    order_number = serializers.CharField()
+    order_number = serializers.CharField(allow_null=True)
     message = serializers.CharField()
     amount_paid = serializers.DecimalField(max_digits=10, decimal_places=2)
     currency = serializers.CharField()
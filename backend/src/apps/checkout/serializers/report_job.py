@@ -0,0 +1,44 @@
+from rest_framework import serializers
+
+from apps.checkout.models import ReportJob
+from apps.checkout.services.report_service import REPORT_PERIODS
+from shopdjango.utils import presign_download
+
+
+class ReportJobCreateSerializer(serializers.Serializer):
+    """Request body for a new report job."""
+
+    report_type = serializers.ChoiceField(choices=ReportJob.ReportType.choices)
+    file_format = serializers.ChoiceField(
+        choices=ReportJob.FileFormat.choices, default=ReportJob.FileFormat.CSV
+    )
+    period = serializers.ChoiceField(choices=list(REPORT_PERIODS), default="7d")
+
+
+class ReportJobSerializer(serializers.ModelSerializer):
+    """Report job status, with a download link once the artifact is ready."""
+
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ReportJob
+        fields = [
+            "id",
+            "report_type",
+            "file_format",
+            "params",
+            "status",
+            "row_count",
+            "error",
+            "download_url",
+            "requested_by",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
+
+    def get_download_url(self, obj: ReportJob) -> str | None:
+        if obj.status == ReportJob.Status.READY and obj.artifact:
+            return presign_download(obj.artifact.name, expires=3600, as_attachment=True)
+        return None
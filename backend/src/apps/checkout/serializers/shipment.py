@@ -37,3 +37,23 @@ class ShipmentSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
+
+
+class ShipmentStatusEventSerializer(serializers.Serializer):
+    """Single courier scan event."""
+
+    order_number = serializers.CharField(max_length=50)
+    status = serializers.ChoiceField(choices=["shipped", "delivered"])
+    occurred_at = serializers.DateTimeField()
+
+
+class ShipmentStatusBatchSerializer(serializers.Serializer):
+    """Batch of courier scan events."""
+
+    events = ShipmentStatusEventSerializer(many=True, allow_empty=False)
+
+
+class ShipmentStatusBatchResponseSerializer(serializers.Serializer):
+    received = serializers.IntegerField()
+    updated_shipments = serializers.IntegerField()
+    updated_orders = serializers.IntegerField()
@@ -1,9 +1,55 @@
 from apps.checkout.services.coupon_service import CouponService
 from apps.checkout.services.template_validator import TemplateValidator
 from apps.checkout.services.invoice_template_service import InvoiceTemplateService
+from apps.checkout.services.checkout_preflight_service import (
+    CheckoutPreflight,
+    CheckoutPreflightService,
+)
+from apps.checkout.services.order_finalization_service import (
+    OrderFinalizationService,
+)
+from apps.checkout.services.shipment_status_service import (
+    ShipmentStatusEvent,
+    ShipmentStatusService,
+)
+from apps.checkout.services.sales_rollup_service import (
+    SalesFact,
+    SalesRollupService,
+)
+from apps.checkout.services.sales_analytics_service import (
+    SalesAnalyticsService,
+    SalesSeries,
+)
+from apps.checkout.services.report_service import ReportJobService
+from apps.checkout.services.search_document_service import (
+    SearchDocumentService,
+)
+from apps.checkout.services.stock_reservation_service import (
+    StockReservationService,
+)
+from apps.checkout.services.payment_gateway import (
+    PaymentGateway,
+    PaymentGatewayError,
+    get_payment_gateway,
+)
 
 __all__ = [
     "CouponService",
     "TemplateValidator",
     "InvoiceTemplateService",
+    "CheckoutPreflight",
+    "CheckoutPreflightService",
+    "OrderFinalizationService",
+    "PaymentGateway",
+    "PaymentGatewayError",
+    "get_payment_gateway",
+    "ShipmentStatusEvent",
+    "ShipmentStatusService",
+    "StockReservationService",
+    "SearchDocumentService",
+    "SalesFact",
+    "SalesRollupService",
+    "SalesAnalyticsService",
+    "SalesSeries",
+    "ReportJobService",
 ]
@@ -0,0 +1,116 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any
+
+from django.db.models import IntegerField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.checkout.models import Cart, CartItem, StockReservation
+
+
+@dataclass(frozen=True)
+class CheckoutPreflight:
+    """Snapshot of a cart taken right before creating a PaymentIntent."""
+
+    item_count: int
+    subtotal: Decimal
+    shipping_cost: Decimal
+    coupon_discount: Decimal
+    unavailable_items: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return self.item_count == 0
+
+    @property
+    def is_available(self) -> bool:
+        return not self.unavailable_items
+
+    @property
+    def total(self) -> Decimal:
+        return self.subtotal + self.shipping_cost - self.coupon_discount
+
+    @property
+    def amount_cents(self) -> int:
+        return int(self.total * 100)
+
+
+class CheckoutPreflightService:
+    """Validates stock and prices a cart in a single query."""
+
+    @staticmethod
+    def run(cart: Cart) -> CheckoutPreflight:
+        """
+        Check stock and compute totals for every item in the cart.
+
+        Items are read with their product's stock, minus unexpired holds of
+        other carts, in one joined query, so the cost does not grow with the
+        number of lines in the cart. Shipping and coupon values come from the
+        cart instance itself.
+
+        Args:
+            cart: Cart with shipping method already assigned
+
+        Returns:
+            CheckoutPreflight with totals and any items short on stock
+        """
+        reserved_by_others = (
+            StockReservation.objects.filter(
+                product_id=OuterRef("product_id"), expires_at__gt=timezone.now()
+            )
+            .exclude(cart=cart)
+            .order_by()
+            .values("product_id")
+            .annotate(total=Sum("quantity"))
+            .values("total")
+        )
+        rows = (
+            CartItem.objects.filter(cart=cart)
+            .annotate(
+                reserved_quantity=Coalesce(
+                    Subquery(reserved_by_others, output_field=IntegerField()),
+                    Value(0),
+                )
+            )
+            .values_list(
+                "product_id",
+                "product__name",
+                "product__stock_quantity",
+                "reserved_quantity",
+                "quantity",
+                "unit_price",
+            )
+        )
+
+        item_count = 0
+        subtotal = Decimal("0.00")
+        unavailable_items = []
+        for (
+            product_id,
+            product_name,
+            stock_quantity,
+            reserved_quantity,
+            quantity,
+            unit_price,
+        ) in rows:
+            item_count += quantity
+            subtotal += unit_price * quantity
+            available_stock = max(stock_quantity - reserved_quantity, 0)
+            if available_stock < quantity:
+                unavailable_items.append(
+                    {
+                        "product_id": product_id,
+                        "product_name": product_name,
+                        "requested_quantity": quantity,
+                        "available_stock": available_stock,
+                    }
+                )
+
+        return CheckoutPreflight(
+            item_count=item_count,
+            subtotal=subtotal,
+            shipping_cost=cart.shipping_cost,
+            coupon_discount=cart.coupon_discount,
+            unavailable_items=unavailable_items,
+        )
@@ -25,7 +25,7 @@ class CouponService:
                 f"Coupon '{coupon.code}' has expired. Valid until {coupon.valid_until.strftime('%Y-%m-%d')}",
             )
 
-        if coupon.max_uses and coupon.redemptions.count() >= coupon.max_uses:
+        if coupon.max_uses and coupon.usage_count >= coupon.max_uses:
             return False, f"Coupon '{coupon.code}' usage limit exceeded"
 
         user_redemptions = coupon.redemptions.filter(user=user).count()
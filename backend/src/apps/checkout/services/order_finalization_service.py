@@ -0,0 +1,129 @@
+import logging
+
+from django.db import transaction
+
+from apps.checkout.models import Cart, Order, Payment
+from apps.checkout.services.payment_gateway import (
+    PaymentGatewayError,
+    get_payment_gateway,
+)
+from apps.checkout.services.stock_reservation_service import (
+    StockReservationService,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class OrderFinalizationService:
+    """Turns a paid PaymentIntent into an order exactly once."""
+
+    @classmethod
+    def finalize(cls, payment_intent_id: str) -> Order | None:
+        """
+        Create the order for a succeeded PaymentIntent.
+
+        The payment row is locked for the duration, and an existing order for
+        the payment short-circuits, so webhook redeliveries, task retries and
+        concurrent reconciliation all converge on a single order. A paid cart
+        whose stock is gone (its holds expired or were released) cannot be
+        fulfilled; the payment is then marked failed and refunded.
+
+        Args:
+            payment_intent_id: Provider id stored on ``Payment``
+
+        Returns:
+            The order for this payment, or None if it cannot be finalized
+        """
+        with transaction.atomic():
+            payment = (
+                Payment.objects.select_for_update()
+                .filter(stripe_payment_intent_id=payment_intent_id)
+                .first()
+            )
+            if payment is None:
+                logger.warning(f"No payment recorded for PaymentIntent {payment_intent_id}")
+                return None
+
+            existing_order = Order.objects.filter(payment=payment).first()
+            if existing_order:
+                return existing_order
+            if payment.metadata.get("finalization_error"):
+                return None
+
+            cart_id = payment.metadata.get("cart_id")
+            cart = Cart.objects.filter(id=cart_id, user=payment.user).first()
+            if cart is None:
+                logger.error(
+                    f"Cart {cart_id} for PaymentIntent {payment_intent_id} not found"
+                )
+                return None
+
+            try:
+                with transaction.atomic():
+                    payment.status = Payment.PaymentStatus.COMPLETED
+                    payment.save(update_fields=["status", "updated_at"])
+
+                    order = Order.create_from_cart(cart, payment)
+
+                    cart.status = Cart.CartStatus.CONVERTED
+                    cart.save(update_fields=["status", "updated_at"])
+                    cart.clear()
+                    StockReservationService.release(cart.id)
+            except ValueError as e:
+                payment.status = Payment.PaymentStatus.FAILED
+                payment.metadata["finalization_error"] = str(e)
+                payment.save(update_fields=["status", "metadata", "updated_at"])
+                StockReservationService.release(cart.id)
+                order = None
+
+        if order is None:
+            cls._refund(payment)
+            return None
+
+        logger.info(
+            f"PaymentIntent {payment_intent_id} finalized as order {order.order_number}"
+        )
+        return order
+
+    @staticmethod
+    def _refund(payment: Payment) -> None:
+        """Give the money back for a payment that could not become an order."""
+        payment_intent_id = payment.stripe_payment_intent_id
+        reason = payment.metadata["finalization_error"]
+        try:
+            refund_id = get_payment_gateway().refund_payment_intent(payment_intent_id)
+        except PaymentGatewayError as e:
+            payment.metadata["refund_error"] = str(e)
+            logger.error(
+                f"PaymentIntent {payment_intent_id} could not be fulfilled ({reason}) "
+                f"and the refund failed, needs manual handling: {e}"
+            )
+        else:
+            payment.metadata["refund_id"] = refund_id
+            logger.error(
+                f"PaymentIntent {payment_intent_id} could not be fulfilled ({reason}); "
+                f"refunded as {refund_id}"
+            )
+        payment.save(update_fields=["metadata", "updated_at"])
+
+    @classmethod
+    def mark_canceled(cls, payment_intent_id: str) -> None:
+        """
+        Flag a still-pending payment as canceled and free its stock holds.
+
+        Only a canceled intent is final; a declined attempt
+        (``requires_payment_method``) can still be retried and succeed.
+        """
+        payment = Payment.objects.filter(
+            stripe_payment_intent_id=payment_intent_id,
+            status=Payment.PaymentStatus.PENDING,
+        ).first()
+        if payment is None:
+            return
+
+        Payment.objects.filter(
+            pk=payment.pk, status=Payment.PaymentStatus.PENDING
+        ).update(status=Payment.PaymentStatus.CANCELED)
+        cart_id = payment.metadata.get("cart_id")
+        if cart_id:
+            StockReservationService.release(cart_id)
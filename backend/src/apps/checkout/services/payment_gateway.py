@@ -0,0 +1,269 @@
+import hashlib
+import itertools
+import json
+from abc import ABC, abstractmethod
+import logging
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import Any
+
+import requests
+import stripe
+from django.conf import settings
+from django.utils.module_loading import import_string
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class PaymentGatewayError(Exception):
+    """Raised when the payment provider fails, times out or rejects a request."""
+
+
+class WebhookVerificationError(PaymentGatewayError):
+    """Raised when a webhook payload is malformed or its signature is invalid."""
+
+
+@dataclass(frozen=True)
+class PaymentIntentResult:
+    """Provider-neutral view of a PaymentIntent."""
+
+    id: str
+    client_secret: str | None
+    status: str
+    amount: int
+    currency: str
+    metadata: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class WebhookEvent:
+    """Verified provider event; ``payment_intent`` is set for intent events."""
+
+    id: str
+    type: str
+    payment_intent: PaymentIntentResult | None = None
+
+
+class PaymentGateway(ABC):
+    """Interface for payment providers used by the checkout views."""
+
+    @abstractmethod
+    def create_payment_intent(
+        self,
+        *,
+        amount_cents: int,
+        currency: str,
+        metadata: dict[str, Any],
+        idempotency_key: str,
+    ) -> PaymentIntentResult:
+        """Create a PaymentIntent, honouring the idempotency key."""
+
+    @abstractmethod
+    def retrieve_payment_intent(self, payment_intent_id: str) -> PaymentIntentResult:
+        """Current state of a PaymentIntent."""
+
+    @abstractmethod
+    def parse_webhook_event(self, payload: bytes, signature: str) -> WebhookEvent:
+        """Verify a webhook payload and return the event it carries."""
+
+    @abstractmethod
+    def refund_payment_intent(self, payment_intent_id: str) -> str:
+        """Refund a succeeded intent in full and return the refund id."""
+
+    @staticmethod
+    def idempotency_key_for_cart(
+        cart_id: int, amount_cents: int, currency: str, metadata: dict[str, Any]
+    ) -> str:
+        """
+        Retried checkouts of an unchanged cart map to the same PaymentIntent.
+
+        The key covers everything sent with the request: Stripe rejects a
+        reused key whose parameters differ, e.g. a cart whose contents changed
+        at the same total.
+        """
+        digest = hashlib.sha256(
+            json.dumps(metadata, sort_keys=True, default=str).encode()
+        ).hexdigest()[:16]
+        return f"checkout-cart-{cart_id}-{amount_cents}-{currency.lower()}-{digest}"
+
+
+class StripePaymentGateway(PaymentGateway):
+    """Stripe adapter with pooled connections, strict timeouts and retries."""
+
+    def __init__(self) -> None:
+        timeout = settings.STRIPE_TIMEOUT_SECONDS
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=settings.STRIPE_HTTP_POOL_SIZE,
+            pool_maxsize=settings.STRIPE_HTTP_POOL_SIZE,
+        )
+        session.mount("https://", adapter)
+
+        http_client = stripe.RequestsClient(timeout=timeout, session=session)
+        self.client = stripe.StripeClient(
+            settings.STRIPE_SECRET_KEY,
+            http_client=http_client,
+            max_network_retries=settings.STRIPE_MAX_NETWORK_RETRIES,
+        )
+
+    def create_payment_intent(
+        self,
+        *,
+        amount_cents: int,
+        currency: str,
+        metadata: dict[str, Any],
+        idempotency_key: str,
+    ) -> PaymentIntentResult:
+        try:
+            intent = self.client.payment_intents.create(
+                params=self._create_params(amount_cents, currency, metadata),
+                options={"idempotency_key": idempotency_key},
+            )
+        except stripe.StripeError as e:
+            logger.error(f"Stripe PaymentIntent creation failed: {str(e)}")
+            raise PaymentGatewayError(str(e)) from e
+        return self._to_result(intent)
+
+    def retrieve_payment_intent(self, payment_intent_id: str) -> PaymentIntentResult:
+        try:
+            intent = self.client.payment_intents.retrieve(payment_intent_id)
+        except stripe.StripeError as e:
+            logger.error(f"Stripe PaymentIntent retrieval failed: {str(e)}")
+            raise PaymentGatewayError(str(e)) from e
+        return self._to_result(intent)
+
+    def parse_webhook_event(self, payload: bytes, signature: str) -> WebhookEvent:
+        try:
+            event = self.client.construct_event(
+                payload, signature, settings.STRIPE_WEBHOOK_SECRET
+            )
+        except (ValueError, stripe.SignatureVerificationError) as e:
+            raise WebhookVerificationError(str(e)) from e
+
+        payment_intent = None
+        data_object = event.data.object
+        if getattr(data_object, "object", None) == "payment_intent":
+            payment_intent = self._to_result(data_object)
+        return WebhookEvent(id=event.id, type=event.type, payment_intent=payment_intent)
+
+    def refund_payment_intent(self, payment_intent_id: str) -> str:
+        try:
+            refund = self.client.refunds.create(
+                params={"payment_intent": payment_intent_id},
+                options={"idempotency_key": f"refund-{payment_intent_id}"},
+            )
+        except stripe.StripeError as e:
+            logger.error(f"Stripe refund of {payment_intent_id} failed: {str(e)}")
+            raise PaymentGatewayError(str(e)) from e
+        return refund.id
+
+    @staticmethod
+    def _create_params(
+        amount_cents: int, currency: str, metadata: dict[str, Any]
+    ) -> dict[str, Any]:
+        return {
+            "amount": amount_cents,
+            "currency": currency,
+            "automatic_payment_methods": {"enabled": True},
+            "metadata": metadata,
+        }
+
+    @staticmethod
+    def _to_result(intent) -> PaymentIntentResult:
+        return PaymentIntentResult(
+            id=intent.id,
+            client_secret=intent.client_secret,
+            status=intent.status,
+            amount=intent.amount,
+            currency=intent.currency,
+            metadata=dict(intent.metadata or {}),
+        )
+
+
+class FakePaymentGateway(PaymentGateway):
+    """In-process gateway for local development and tests.
+
+    Intents live in a class-level registry so every instance in the process
+    sees the same state. Honours idempotency keys like Stripe does.
+    """
+
+    initial_status = "requires_payment_method"
+
+    _intents: dict[str, PaymentIntentResult] = {}
+    _idempotency_index: dict[str, str] = {}
+    _refunds: dict[str, str] = {}
+    _sequence = itertools.count(1)
+
+    def create_payment_intent(
+        self,
+        *,
+        amount_cents: int,
+        currency: str,
+        metadata: dict[str, Any],
+        idempotency_key: str,
+    ) -> PaymentIntentResult:
+        existing_id = self._idempotency_index.get(idempotency_key)
+        if existing_id:
+            return self._intents[existing_id]
+
+        intent_id = f"pi_fake_{next(self._sequence)}"
+        intent = PaymentIntentResult(
+            id=intent_id,
+            client_secret=f"{intent_id}_secret",
+            status=self.initial_status,
+            amount=amount_cents,
+            currency=currency,
+            metadata={key: str(value) for key, value in metadata.items()},
+        )
+        self._intents[intent_id] = intent
+        self._idempotency_index[idempotency_key] = intent_id
+        return intent
+
+    def retrieve_payment_intent(self, payment_intent_id: str) -> PaymentIntentResult:
+        try:
+            return self._intents[payment_intent_id]
+        except KeyError:
+            raise PaymentGatewayError(f"No such payment_intent: {payment_intent_id}")
+
+    def refund_payment_intent(self, payment_intent_id: str) -> str:
+        if payment_intent_id not in self._intents:
+            raise PaymentGatewayError(f"No such payment_intent: {payment_intent_id}")
+        return self._refunds.setdefault(
+            payment_intent_id, f"re_fake_{next(self._sequence)}"
+        )
+
+    def parse_webhook_event(self, payload: bytes, signature: str) -> WebhookEvent:
+        """Accept unsigned Stripe-shaped JSON; intents resolve from the registry."""
+        try:
+            event = json.loads(payload)
+            data_object = event["data"]["object"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise WebhookVerificationError(f"Invalid payload: {str(e)}") from e
+
+        payment_intent = None
+        if data_object.get("object") == "payment_intent":
+            payment_intent = self._intents.get(data_object.get("id"))
+        return WebhookEvent(
+            id=event.get("id", ""), type=event.get("type", ""), payment_intent=payment_intent
+        )
+
+    @classmethod
+    def set_status(cls, payment_intent_id: str, status: str) -> PaymentIntentResult:
+        """Simulate the customer completing (or failing) the payment."""
+        intent = replace(cls._intents[payment_intent_id], status=status)
+        cls._intents[payment_intent_id] = intent
+        return intent
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._intents.clear()
+        cls._idempotency_index.clear()
+        cls._refunds.clear()
+
+
+@lru_cache(maxsize=1)
+def get_payment_gateway() -> PaymentGateway:
+    """Return the process-wide gateway configured by ``PAYMENT_GATEWAY``."""
+    return import_string(settings.PAYMENT_GATEWAY)()
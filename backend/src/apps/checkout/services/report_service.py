@@ -0,0 +1,390 @@
+import csv
+import hashlib
+import io
+import json
+import logging
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+
+from apps.checkout.models import Order, ReportJob
+from apps.checkout.services.sales_analytics_service import SalesAnalyticsService
+
+logger = logging.getLogger(__name__)
+
+REPORT_PERIODS = {
+    "24h": timedelta(days=1),
+    "7d": timedelta(days=7),
+    "30d": timedelta(days=30),
+    "lifetime": None,
+}
+
+
+def period_start(period: str, now: datetime) -> datetime | None:
+    """
+    Start of a dashboard period ending at ``now``.
+
+    Raises:
+        ValueError: If the period is not one of REPORT_PERIODS
+    """
+    if period not in REPORT_PERIODS:
+        raise ValueError(f"Invalid period: {period}")
+    length = REPORT_PERIODS[period]
+    return now - length if length is not None else None
+
+
+@dataclass(frozen=True)
+class ReportColumn:
+    """A report column; ``kind`` is one of int, str, decimal or datetime."""
+
+    name: str
+    kind: str
+
+
+ORDER_EXPORT_COLUMNS = (
+    ReportColumn("id", "int"),
+    ReportColumn("order_number", "str"),
+    ReportColumn("created_at", "datetime"),
+    ReportColumn("status", "str"),
+    ReportColumn("subtotal", "decimal"),
+    ReportColumn("shipping_cost", "decimal"),
+    ReportColumn("total", "decimal"),
+    ReportColumn("shipping_method_name", "str"),
+    ReportColumn("coupon_code", "str"),
+    ReportColumn("buyer_display_name", "str"),
+    ReportColumn("buyer_email", "str"),
+    ReportColumn("shipping_country", "str"),
+    ReportColumn("shipping_city", "str"),
+)
+
+SALES_SUMMARY_COLUMNS = (
+    ReportColumn("dimension", "str"),
+    ReportColumn("key", "int"),
+    ReportColumn("label", "str"),
+    ReportColumn("orders_count", "int"),
+    ReportColumn("items_sold", "int"),
+    ReportColumn("revenue", "decimal"),
+    ReportColumn("coupon_orders", "int"),
+)
+
+
+def order_export_rows(since: datetime | None) -> Iterator[tuple]:
+    """
+    Stream one tuple per order placed since ``since``, in ORDER_EXPORT_COLUMNS
+    order, without instantiating models.
+    """
+    orders = Order.objects.order_by("created_at", "id")
+    if since is not None:
+        orders = orders.filter(created_at__gte=since)
+
+    for (
+        order_id,
+        order_number,
+        created_at,
+        status,
+        subtotal,
+        shipping_cost,
+        total,
+        shipping_method_name,
+        coupon_code,
+        first_name,
+        last_name,
+        email,
+        country_name,
+        city,
+    ) in orders.values_list(
+        "id",
+        "order_number",
+        "created_at",
+        "status",
+        "subtotal",
+        "shipping_cost",
+        "total",
+        "shipping_method__name",
+        "applied_coupon__code",
+        "shipping_address__profile__first_name",
+        "shipping_address__profile__last_name",
+        "shipping_address__profile__user__email",
+        "shipping_address__country__name",
+        "shipping_address__city",
+    ).iterator(chunk_size=settings.REPORT_JOB_BATCH_SIZE):
+        # Same fallbacks as Profile.get_display_name.
+        if first_name and last_name:
+            display_name = f"{first_name} {last_name}"
+        else:
+            display_name = first_name or email or ""
+        yield (
+            order_id,
+            order_number,
+            created_at,
+            status,
+            subtotal,
+            shipping_cost,
+            total,
+            shipping_method_name or "",
+            coupon_code or "",
+            display_name,
+            email or "",
+            country_name or "",
+            city or "",
+        )
+
+
+def sales_summary_rows(since: datetime | None, now: datetime) -> Iterator[tuple]:
+    """Totals per key of every sales dimension, in SALES_SUMMARY_COLUMNS order."""
+    for dimension, entries in SalesAnalyticsService.summary(since, now).items():
+        for entry in sorted(entries, key=lambda e: e["revenue"], reverse=True):
+            yield (
+                dimension,
+                entry["key"],
+                entry["label"],
+                int(entry["orders_count"]),
+                int(entry["items_sold"]),
+                Decimal(str(entry["revenue"])).quantize(Decimal("0.01")),
+                int(entry["coupon_orders"]),
+            )
+
+
+@dataclass(frozen=True)
+class ReportDefinition:
+    columns: tuple[ReportColumn, ...]
+    rows: Callable[[datetime | None, datetime], Iterable[tuple]]
+
+
+REPORTS = {
+    ReportJob.ReportType.ORDERS: ReportDefinition(
+        ORDER_EXPORT_COLUMNS, lambda since, now: order_export_rows(since)
+    ),
+    ReportJob.ReportType.SALES_SUMMARY: ReportDefinition(
+        SALES_SUMMARY_COLUMNS, sales_summary_rows
+    ),
+}
+
+
+class ReportJobService:
+    """Creates report jobs and builds their artifacts in a worker."""
+
+    @staticmethod
+    def fingerprint(report_type: str, file_format: str, params: dict) -> str:
+        payload = json.dumps(
+            {"type": report_type, "format": file_format, "params": params},
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @classmethod
+    def request(
+        cls, user, report_type: str, file_format: str, params: dict
+    ) -> tuple[ReportJob, bool]:
+        """
+        Return a job for the report, reusing a recent identical one.
+
+        A pending, running or ready job with the same type, format and
+        parameters created within ``REPORT_JOB_REUSE_SECONDS`` is returned
+        as is; otherwise a new job is created and queued once the
+        transaction commits.
+
+        Returns:
+            Tuple of (job, created)
+        """
+        from apps.checkout.tasks import build_report
+
+        fingerprint = cls.fingerprint(report_type, file_format, params)
+        reusable = (
+            ReportJob.objects.filter(
+                fingerprint=fingerprint,
+                status__in=[
+                    ReportJob.Status.PENDING,
+                    ReportJob.Status.RUNNING,
+                    ReportJob.Status.READY,
+                ],
+                created_at__gte=timezone.now()
+                - timedelta(seconds=settings.REPORT_JOB_REUSE_SECONDS),
+            )
+            .order_by("-created_at")
+            .first()
+        )
+        if reusable is not None:
+            return reusable, False
+
+        job = ReportJob.objects.create(
+            requested_by=user,
+            report_type=report_type,
+            file_format=file_format,
+            params=params,
+            fingerprint=fingerprint,
+        )
+        transaction.on_commit(lambda: build_report.delay(job.pk))
+        return job, True
+
+    @classmethod
+    def build(cls, job_id: int) -> ReportJob | None:
+        """
+        Build and store the artifact of a pending job.
+
+        Rows are streamed in batches of ``REPORT_JOB_BATCH_SIZE`` into a
+        temporary file, which is then uploaded to storage. Periods are
+        resolved against the job's creation time, so a reused artifact
+        covers exactly what its first requester asked for.
+
+        Returns:
+            The job, or None if it was missing or already picked up
+        """
+        claimed = ReportJob.objects.filter(
+            pk=job_id, status=ReportJob.Status.PENDING
+        ).update(status=ReportJob.Status.RUNNING, started_at=timezone.now())
+        if not claimed:
+            return None
+        job = ReportJob.objects.get(pk=job_id)
+
+        try:
+            definition = REPORTS[job.report_type]
+            since = period_start(job.params.get("period", "7d"), job.created_at)
+            rows = iter(definition.rows(since, job.created_at))
+            writer_class = WRITERS[job.file_format]
+            with tempfile.TemporaryFile() as artifact:
+                writer = writer_class(artifact, definition.columns)
+                row_count = 0
+                while batch := list(islice(rows, settings.REPORT_JOB_BATCH_SIZE)):
+                    writer.write(batch)
+                    row_count += len(batch)
+                writer.close()
+                artifact.seek(0)
+                job.artifact.save(
+                    f"{job.report_type}_{job.params.get('period', '7d')}_"
+                    f"{job.pk}.{job.file_format}",
+                    File(artifact),
+                    save=False,
+                )
+        except Exception as e:
+            logger.exception(f"Report job {job.pk} failed")
+            job.status = ReportJob.Status.FAILED
+            job.error = str(e)
+            job.finished_at = timezone.now()
+            job.save(update_fields=["status", "error", "finished_at", "updated_at"])
+            return job
+
+        job.status = ReportJob.Status.READY
+        job.row_count = row_count
+        job.finished_at = timezone.now()
+        job.save(
+            update_fields=[
+                "status",
+                "artifact",
+                "row_count",
+                "finished_at",
+                "updated_at",
+            ]
+        )
+        logger.info(f"Report job {job.pk} stored {row_count} rows at {job.artifact.name}")
+        return job
+
+    @staticmethod
+    def purge_expired(now: datetime | None = None) -> int:
+        """
+        Delete jobs older than ``REPORT_JOB_RETENTION_DAYS`` with their files.
+
+        Returns:
+            Number of jobs deleted
+        """
+        cutoff = (now or timezone.now()) - timedelta(
+            days=settings.REPORT_JOB_RETENTION_DAYS
+        )
+        expired = ReportJob.objects.filter(created_at__lt=cutoff)
+        for job in expired.exclude(artifact="").only("id", "artifact").iterator():
+            job.artifact.delete(save=False)
+        deleted, _ = expired.delete()
+        return deleted
+
+
+class _CsvWriter:
+    def __init__(self, artifact, columns):
+        self._file = io.TextIOWrapper(artifact, encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([column.name for column in columns])
+
+    def write(self, rows):
+        self._writer.writerows(
+            [
+                value.isoformat() if isinstance(value, datetime) else value
+                for value in row
+            ]
+            for row in rows
+        )
+
+    def close(self):
+        # Hand the underlying file back without closing it.
+        self._file.detach()
+
+
+class _XlsxWriter:
+    def __init__(self, artifact, columns):
+        from openpyxl import Workbook
+
+        self._artifact = artifact
+        # Write-only mode streams rows to disk instead of keeping the sheet.
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet("report")
+        self._sheet.append([column.name for column in columns])
+
+    def write(self, rows):
+        for row in rows:
+            # Excel has no time zones; store UTC wall time.
+            self._sheet.append(
+                [
+                    value.astimezone(dt_timezone.utc).replace(tzinfo=None)
+                    if isinstance(value, datetime)
+                    else value
+                    for value in row
+                ]
+            )
+
+    def close(self):
+        self._workbook.save(self._artifact)
+
+
+class _ParquetWriter:
+    def __init__(self, artifact, columns):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        types = {
+            "int": pa.int64(),
+            "str": pa.string(),
+            "decimal": pa.decimal128(14, 2),
+            "datetime": pa.timestamp("us", tz="UTC"),
+        }
+        self._pa = pa
+        self._schema = pa.schema([(column.name, types[column.kind]) for column in columns])
+        self._writer = pq.ParquetWriter(artifact, self._schema)
+
+    def write(self, rows):
+        # One row group per batch keeps memory bounded by the batch size.
+        self._writer.write_batch(
+            self._pa.RecordBatch.from_arrays(
+                [
+                    self._pa.array(values, type=field.type)
+                    for values, field in zip(zip(*rows), self._schema)
+                ],
+                schema=self._schema,
+            )
+        )
+
+    def close(self):
+        self._writer.close()
+
+
+WRITERS = {
+    ReportJob.FileFormat.CSV: _CsvWriter,
+    ReportJob.FileFormat.XLSX: _XlsxWriter,
+    ReportJob.FileFormat.PARQUET: _ParquetWriter,
+}
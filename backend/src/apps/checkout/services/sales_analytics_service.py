@@ -0,0 +1,341 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+
+from apps.checkout.models import Order, SalesRollup
+from apps.checkout.services.sales_rollup_service import (
+    DAY,
+    HOUR,
+    SalesRollupService,
+    SalesRollupVersion,
+    floor_day,
+    floor_hour,
+)
+
+METRICS = ("orders_count", "items_sold", "revenue", "coupon_orders")
+
+
+@dataclass
+class SalesSeries:
+    """Metrics per bucket for each key of one dimension."""
+
+    buckets: list[datetime]
+    keys: np.ndarray
+    labels: list[str]
+    # Shape (len(METRICS), len(keys), len(buckets)), in METRICS order.
+    values: np.ndarray
+
+    def metric(self, name: str) -> np.ndarray:
+        return self.values[METRICS.index(name)]
+
+    def top(self, limit: int, by: str = "revenue") -> "SalesSeries":
+        """Keep the ``limit`` keys with the largest total of ``by``."""
+        if len(self.keys) <= limit:
+            return self
+        order = np.argsort(-self.metric(by).sum(axis=1), kind="stable")[:limit]
+        return SalesSeries(
+            buckets=self.buckets,
+            keys=self.keys[order],
+            labels=[self.labels[index] for index in order],
+            values=self.values[:, order, :],
+        )
+
+
+class SalesAnalyticsService:
+    """
+    Answers arbitrary ``[start, end)`` / bucket / group-by questions from
+    the sales rollup.
+
+    Buckets that end before the rollup watermark only change when an hour
+    is re-rolled, so their aggregates are cached individually under the
+    current SalesRollupVersion; only buckets that reach into the open hour
+    are recomputed, from live orders for the un-rolled part.
+    """
+
+    @staticmethod
+    def _cache_key(
+        version: int, dimension: str, start: datetime, end: datetime
+    ) -> str:
+        return (
+            f"sales-analytics:{version}:{dimension}:{int(start.timestamp())}:"
+            f"{int(end.timestamp())}"
+        )
+
+    @classmethod
+    def series(
+        cls, dimension: str, start: datetime, end: datetime, bucket: timedelta
+    ) -> SalesSeries:
+        """
+        Build a bucketed series.
+
+        Args:
+            dimension: A SalesRollup.Dimension value
+            start: Range start; floored to the hour
+            end: Range end (exclusive); the last bucket is clipped to it
+            bucket: Bucket length, a whole number of hours
+
+        Returns:
+            SalesSeries covering every bucket, including empty ones
+        """
+        start = floor_hour(start)
+        end = max(floor_hour(end - timedelta(microseconds=1)) + HOUR, start + HOUR)
+        edges = []
+        bucket_start = start
+        while bucket_start < end:
+            edges.append((bucket_start, min(bucket_start + bucket, end)))
+            bucket_start += bucket
+
+        rolled_until = SalesRollup.rolled_until() or start
+        closed = [edge for edge in edges if edge[1] <= rolled_until]
+        open_edges = [edge for edge in edges if edge[1] > rolled_until]
+
+        version = SalesRollupVersion.current()
+        keys = {edge: cls._cache_key(version, dimension, *edge) for edge in closed}
+        cached = cache.get_many(keys.values())
+        entries = {edge: cached[key] for edge, key in keys.items() if key in cached}
+
+        missing = [edge for edge in closed if edge not in entries]
+        if missing:
+            use_days = bucket % DAY == timedelta(0) and start == floor_day(start)
+            rows = cls._rollup_rows(
+                [dimension], missing[0][0], missing[-1][1], use_days=use_days
+            )
+            computed = cls._aggregate([row[1:] for row in rows], missing)
+            cache.set_many(
+                {keys[edge]: computed[edge] for edge in missing},
+                timeout=settings.SALES_ANALYTICS_CACHE_SECONDS,
+            )
+            entries.update(computed)
+
+        if open_edges:
+            rows = cls._rollup_rows(
+                [dimension], open_edges[0][0], rolled_until, use_days=False
+            )
+            rows += cls._live_rows(
+                [dimension], max(open_edges[0][0], rolled_until), open_edges[-1][1]
+            )
+            entries.update(cls._aggregate([row[1:] for row in rows], open_edges))
+
+        return cls._combine(edges, entries)
+
+    @classmethod
+    def summary(cls, start: datetime | None, end: datetime) -> dict[str, list[dict]]:
+        """
+        Totals per key of every dimension over ``[start, end)``.
+
+        Whole days come from day rows, whole hours from hour rows, and the
+        partial first hour plus anything newer than the rollup from one live
+        pass over the orders, all summed together.
+
+        Args:
+            start: Range start, or None for all time
+            end: Range end (exclusive)
+
+        Returns:
+            Per dimension, a list of dicts with key, label and the METRICS
+        """
+        dimensions = SalesRollup.Dimension.values
+        rolled_until = SalesRollup.rolled_until()
+        if start is None:
+            first_bucket = (
+                SalesRollup.objects.filter(
+                    granularity=SalesRollup.Granularity.HOUR,
+                    dimension=SalesRollup.Dimension.TOTAL,
+                )
+                .order_by("bucket")
+                .values_list("bucket", flat=True)
+                .first()
+            )
+            start = first_bucket or (
+                Order.objects.order_by("created_at")
+                .values_list("created_at", flat=True)
+                .first()
+            )
+        if start is None or start >= end:
+            return {dimension: [] for dimension in dimensions}
+
+        body_start = floor_hour(start)
+        if body_start < start:
+            body_start += HOUR
+        body_end = max(min(floor_hour(end), rolled_until or body_start), body_start)
+
+        rows = cls._live_rows(dimensions, start, min(body_start, end))
+        rows += cls._rollup_rows(dimensions, body_start, body_end, use_days=True)
+        rows += cls._live_rows(dimensions, max(body_end, body_start), end)
+        if not rows:
+            return {dimension: [] for dimension in dimensions}
+
+        dimension_codes = np.array([dimensions.index(row[0]) for row in rows])
+        row_keys = np.array([row[2] for row in rows], dtype=np.int64)
+        groups, group_index = np.unique(
+            np.stack([dimension_codes, row_keys], axis=1),
+            axis=0,
+            return_inverse=True,
+        )
+        group_index = group_index.reshape(-1)
+        sums = np.stack(
+            [
+                np.bincount(
+                    group_index,
+                    weights=np.array([row[4 + position] for row in rows], dtype=float),
+                    minlength=len(groups),
+                )
+                for position in range(len(METRICS))
+            ]
+        )
+        labels = {}
+        for row, group in zip(rows, group_index.tolist()):
+            labels[group] = row[3] or labels.get(group, "")
+
+        result = {dimension: [] for dimension in dimensions}
+        for group, (code, key) in enumerate(groups.tolist()):
+            entry = {"key": key, "label": labels[group]}
+            entry.update(
+                {metric: sums[position, group] for position, metric in enumerate(METRICS)}
+            )
+            result[dimensions[code]].append(entry)
+        return result
+
+    @staticmethod
+    def _rollup_rows(
+        dimensions, start: datetime, end: datetime, use_days: bool
+    ) -> list[tuple]:
+        """
+        Read rollup rows of ``dimensions`` within ``[start, end)`` in one query.
+
+        With ``use_days``, day rows stand in for the 24 hour rows of every
+        whole day in the range (only completed days have them); hours at the
+        edges are read individually.
+        """
+        if start >= end:
+            return []
+        hours = SalesRollup.Granularity.HOUR
+        condition = Q(granularity=hours, bucket__gte=start, bucket__lt=end)
+        if use_days:
+            days_start = floor_day(start)
+            if days_start < start:
+                days_start += DAY
+            days_end = floor_day(end)
+            if days_end > days_start:
+                condition = (
+                    Q(
+                        granularity=SalesRollup.Granularity.DAY,
+                        bucket__gte=days_start,
+                        bucket__lt=days_end,
+                    )
+                    | Q(granularity=hours, bucket__gte=start, bucket__lt=days_start)
+                    | Q(granularity=hours, bucket__gte=days_end, bucket__lt=end)
+                )
+
+        return list(
+            SalesRollup.objects.filter(condition, dimension__in=dimensions)
+            .order_by()
+            .values_list("dimension", "bucket", "key", "label", *METRICS)
+        )
+
+    @staticmethod
+    def _live_rows(dimensions, start: datetime, end: datetime) -> list[tuple]:
+        """Facts for orders not covered by the rollup, shaped like rollup rows."""
+        if start >= end:
+            return []
+        return [
+            (
+                fact.dimension,
+                fact.bucket,
+                fact.key,
+                fact.label,
+                fact.orders_count,
+                fact.items_sold,
+                fact.revenue,
+                fact.coupon_orders,
+            )
+            for fact in SalesRollupService.compute_facts(start, end)
+            if fact.dimension in dimensions
+        ]
+
+    @staticmethod
+    def _aggregate(rows: list[tuple], edges) -> dict[tuple, dict]:
+        """
+        Sum rows into per-bucket entries with NumPy.
+
+        Each entry is a plain dict (sorted keys, labels and one list per
+        metric) so it can go straight into the cache.
+        """
+        entries = {
+            edge: {"keys": [], "labels": [], "values": [[] for _ in METRICS]}
+            for edge in edges
+        }
+        if not rows:
+            return entries
+
+        starts = np.array([edge[0].timestamp() for edge in edges])
+        ends = np.array([edge[1].timestamp() for edge in edges])
+        timestamps = np.array([row[0].timestamp() for row in rows])
+        bucket_index = np.searchsorted(starts, timestamps, side="right") - 1
+        # Rows between non-adjacent edges (e.g. of already cached buckets)
+        # belong to none of them.
+        inside = (bucket_index >= 0) & (
+            timestamps < ends[np.clip(bucket_index, 0, None)]
+        )
+        rows = [row for row, keep in zip(rows, inside) if keep]
+        if not rows:
+            return entries
+        bucket_index = bucket_index[inside]
+
+        _, row_keys, labels, *metrics = zip(*rows)
+        unique_keys, key_index = np.unique(np.array(row_keys), return_inverse=True)
+
+        flat = bucket_index * len(unique_keys) + key_index
+        size = len(edges) * len(unique_keys)
+        sums = np.stack(
+            [
+                np.bincount(
+                    flat, weights=np.array(values, dtype=float), minlength=size
+                )
+                for values in metrics
+            ]
+        ).reshape(len(METRICS), len(edges), len(unique_keys))
+        present = np.bincount(flat, minlength=size).reshape(
+            len(edges), len(unique_keys)
+        )
+
+        key_labels = {}
+        for key, label in zip(row_keys, labels):
+            key_labels[key] = label or key_labels.get(key, "")
+
+        for position, edge in enumerate(edges):
+            columns = np.flatnonzero(present[position])
+            entries[edge] = {
+                "keys": unique_keys[columns].tolist(),
+                "labels": [key_labels[key] for key in unique_keys[columns].tolist()],
+                "values": sums[:, position, columns].tolist(),
+            }
+        return entries
+
+    @staticmethod
+    def _combine(edges, entries) -> SalesSeries:
+        keys = np.unique(
+            np.concatenate(
+                [np.array(entries[edge]["keys"], dtype=np.int64) for edge in edges]
+            )
+        )
+        values = np.zeros((len(METRICS), len(keys), len(edges)))
+        labels = [""] * len(keys)
+        for position, edge in enumerate(edges):
+            entry = entries[edge]
+            if not entry["keys"]:
+                continue
+            columns = np.searchsorted(keys, entry["keys"])
+            values[:, columns, position] = entry["values"]
+            for column, label in zip(columns, entry["labels"]):
+                labels[column] = label or labels[column]
+        return SalesSeries(
+            buckets=[edge[0] for edge in edges],
+            keys=keys,
+            labels=labels,
+            values=values,
+        )
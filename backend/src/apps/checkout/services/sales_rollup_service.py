@@ -0,0 +1,398 @@
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Max, Sum
+from django.db.models.functions import TruncHour
+from django.utils import timezone
+
+from apps.catalog.models import Product
+from apps.checkout.models import Order, SalesRollup
+
+logger = logging.getLogger(__name__)
+
+HOUR = timedelta(hours=1)
+DAY = timedelta(days=1)
+
+SALES_ROLLUP_VERSION_KEY = "sales_rollup:version"
+
+Dimension = SalesRollup.Dimension
+
+# One row per order line (orders without lines yield a single row of NULL
+# line columns), carrying everything every dimension needs.
+LINE_COLUMNS = (
+    "id",
+    "hour",
+    "total",
+    "applied_coupon_id",
+    "shipping_method_id",
+    "shipping_method__name",
+    "shipping_address__country_id",
+    "shipping_address__country__name",
+    "items__product_id",
+    "items__product_name",
+    "items__product__manufacturer_id",
+    "items__product__manufacturer__name",
+    "items__quantity",
+    "items__total_price",
+)
+
+
+@dataclass(frozen=True)
+class SalesFact:
+    """One aggregated row for a dimension key within one hour."""
+
+    dimension: str
+    bucket: datetime
+    key: int
+    label: str
+    orders_count: int
+    items_sold: int
+    revenue: Decimal
+    coupon_orders: int
+
+
+def floor_hour(moment: datetime) -> datetime:
+    return moment.astimezone(dt_timezone.utc).replace(
+        minute=0, second=0, microsecond=0
+    )
+
+
+def floor_day(moment: datetime) -> datetime:
+    return floor_hour(moment).replace(hour=0)
+
+
+def settled_until(now: datetime | None = None) -> datetime:
+    """
+    End of the last hour that counts as closed.
+
+    An hour closes ``SALES_ROLLUP_SETTLE_SECONDS`` after it ends, so orders
+    whose transaction commits shortly after their ``created_at`` hour are in
+    place before that hour is rolled up.
+    """
+    settle = timedelta(seconds=settings.SALES_ROLLUP_SETTLE_SECONDS)
+    return floor_hour((now or timezone.now()) - settle)
+
+
+class SalesRollupVersion:
+    """
+    Shared stamp that changes whenever already rolled hours are rewritten;
+    see CatalogVersion for how the stamp is used. Cached analytics buckets
+    are keyed on it, so a re-roll retires them all at once.
+    """
+
+    @staticmethod
+    def current() -> int:
+        version = cache.get(SALES_ROLLUP_VERSION_KEY)
+        if version is None:
+            cache.add(SALES_ROLLUP_VERSION_KEY, time.time_ns(), timeout=None)
+            version = cache.get(SALES_ROLLUP_VERSION_KEY)
+        return version
+
+    @staticmethod
+    def bump() -> None:
+        try:
+            cache.incr(SALES_ROLLUP_VERSION_KEY)
+        except ValueError:
+            cache.add(SALES_ROLLUP_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+class SalesRollupService:
+    """Builds the hourly and daily SalesRollup tables from orders."""
+
+    @staticmethod
+    def compute_facts(start: datetime, end: datetime) -> list[SalesFact]:
+        """
+        Aggregate orders placed in ``[start, end)`` into hourly facts.
+
+        Reads each order line once, joined with its order, and emits the
+        facts for every dimension from that single pass. Tags come from one
+        lookup of the sold products' tag ids, and a line counts once towards
+        each distinct tag of its product.
+
+        Args:
+            start: Inclusive lower bound, aligned to an hour
+            end: Exclusive upper bound, aligned to an hour
+
+        Returns:
+            Facts per hour and dimension key; hours without orders have no rows
+        """
+        lines = list(
+            Order.objects.filter(created_at__gte=start, created_at__lt=end)
+            .annotate(hour=TruncHour("created_at"))
+            .order_by()
+            .values_list(*LINE_COLUMNS)
+        )
+        product_ids = {line[8] for line in lines if line[8] is not None}
+        product_tags: dict[int, dict[int, str]] = defaultdict(dict)
+        for product_id, tag_id, tag_name in Product.tags.through.objects.filter(
+            product_id__in=product_ids
+        ).values_list("product_id", "tag_id", "tag__name"):
+            product_tags[product_id][tag_id] = tag_name
+
+        facts = _FactAccumulator()
+        for (
+            order_id,
+            hour,
+            order_total,
+            coupon_id,
+            shipping_method_id,
+            shipping_method_name,
+            country_id,
+            country_name,
+            product_id,
+            product_name,
+            manufacturer_id,
+            manufacturer_name,
+            quantity,
+            line_total,
+        ) in lines:
+            has_coupon = coupon_id is not None
+            quantity = quantity or 0
+            for dimension, key, label in (
+                (Dimension.TOTAL, 0, ""),
+                (Dimension.SHIPPING_METHOD, shipping_method_id, shipping_method_name),
+                (Dimension.COUNTRY, country_id, country_name),
+            ):
+                facts.add(
+                    dimension,
+                    hour,
+                    key,
+                    label,
+                    order_id=order_id,
+                    has_coupon=has_coupon,
+                    quantity=quantity,
+                    revenue=order_total,
+                    per_order=True,
+                )
+            if product_id is None:
+                continue
+            line_dimensions = [
+                (Dimension.PRODUCT, product_id, product_name),
+                (Dimension.MANUFACTURER, manufacturer_id, manufacturer_name),
+            ]
+            line_dimensions.extend(
+                (Dimension.TAG, tag_id, tag_name)
+                for tag_id, tag_name in product_tags[product_id].items()
+            )
+            for dimension, key, label in line_dimensions:
+                facts.add(
+                    dimension,
+                    hour,
+                    key,
+                    label,
+                    order_id=order_id,
+                    has_coupon=has_coupon,
+                    quantity=quantity,
+                    revenue=line_total,
+                )
+        return facts.facts()
+
+    @classmethod
+    @transaction.atomic
+    def roll_up_hours(cls, start: datetime, end: datetime) -> None:
+        """
+        (Re)write hourly rows for ``[start, end)`` and daily rows for any day
+        that range completes.
+        """
+        facts = cls.compute_facts(start, end)
+        rolled = {fact.bucket for fact in facts if fact.dimension == Dimension.TOTAL}
+        hour = start
+        while hour < end:
+            if hour not in rolled:
+                facts.append(
+                    SalesFact(Dimension.TOTAL, hour, 0, "", 0, 0, Decimal("0"), 0)
+                )
+            hour += HOUR
+
+        SalesRollup.objects.filter(
+            granularity=SalesRollup.Granularity.HOUR,
+            bucket__gte=start,
+            bucket__lt=end,
+        ).delete()
+        SalesRollup.objects.bulk_create(
+            [
+                SalesRollup(
+                    granularity=SalesRollup.Granularity.HOUR,
+                    dimension=fact.dimension,
+                    bucket=fact.bucket,
+                    key=fact.key,
+                    label=fact.label[:255],
+                    orders_count=fact.orders_count,
+                    items_sold=fact.items_sold,
+                    revenue=fact.revenue,
+                    coupon_orders=fact.coupon_orders,
+                )
+                for fact in facts
+            ],
+            batch_size=settings.SALES_ROLLUP_BATCH_SIZE,
+        )
+
+        day = floor_day(start)
+        while day + DAY <= end:
+            cls.roll_up_day(day)
+            day += DAY
+
+    @staticmethod
+    def roll_up_day(day: datetime) -> None:
+        """Replace the daily rows of ``day`` with the sum of its hourly rows."""
+        hourly = SalesRollup.objects.filter(
+            granularity=SalesRollup.Granularity.HOUR,
+            bucket__gte=day,
+            bucket__lt=day + DAY,
+        )
+        rows = (
+            hourly.values("dimension", "key")
+            .annotate(
+                latest_label=Max("label"),
+                total_orders=Sum("orders_count"),
+                total_items=Sum("items_sold"),
+                total_revenue=Sum("revenue"),
+                total_coupon_orders=Sum("coupon_orders"),
+            )
+            .order_by()
+        )
+        daily = [
+            SalesRollup(
+                granularity=SalesRollup.Granularity.DAY,
+                dimension=row["dimension"],
+                bucket=day,
+                key=row["key"],
+                label=row["latest_label"],
+                orders_count=row["total_orders"],
+                items_sold=row["total_items"],
+                revenue=row["total_revenue"],
+                coupon_orders=row["total_coupon_orders"],
+            )
+            for row in rows
+        ]
+        SalesRollup.objects.filter(
+            granularity=SalesRollup.Granularity.DAY, bucket=day
+        ).delete()
+        SalesRollup.objects.bulk_create(
+            daily, batch_size=settings.SALES_ROLLUP_BATCH_SIZE
+        )
+
+    @classmethod
+    def reroll_hour(cls, hour: datetime) -> bool:
+        """
+        Recompute an already rolled hour after its orders changed.
+
+        Also rewrites the daily rows of its day when that day is complete, and
+        bumps SalesRollupVersion so cached analytics buckets are dropped.
+        Hours past the watermark are left to ``catch_up``.
+
+        Args:
+            hour: Any moment within the hour to recompute
+
+        Returns:
+            True if the hour was rewritten
+        """
+        hour = floor_hour(hour)
+        rolled_until = SalesRollup.rolled_until()
+        if rolled_until is None or hour >= rolled_until:
+            return False
+
+        with transaction.atomic():
+            cls.roll_up_hours(hour, hour + HOUR)
+            day = floor_day(hour)
+            if day + DAY <= rolled_until:
+                cls.roll_up_day(day)
+            transaction.on_commit(SalesRollupVersion.bump)
+        logger.info(f"Re-rolled sales for {hour.isoformat()}")
+        return True
+
+    @classmethod
+    def catch_up(cls, now: datetime | None = None) -> int:
+        """
+        Roll up every closed hour not yet in the table.
+
+        Hours close ``SALES_ROLLUP_SETTLE_SECONDS`` after they end. Starts
+        from the hour after the last rolled one (or the first order),
+        works in day-aligned chunks and stops after
+        ``SALES_ROLLUP_MAX_HOURS_PER_RUN`` hours so a first run over a large
+        history is spread across several task runs.
+
+        Returns:
+            Number of hours rolled up
+        """
+        until = settled_until(now)
+        start = SalesRollup.rolled_until()
+        if start is None:
+            first_order_at = (
+                Order.objects.order_by("created_at")
+                .values_list("created_at", flat=True)
+                .first()
+            )
+            if first_order_at is None:
+                return 0
+            start = floor_hour(first_order_at)
+
+        end = min(until, start + settings.SALES_ROLLUP_MAX_HOURS_PER_RUN * HOUR)
+        hours = 0
+        while start < end:
+            chunk_end = min(floor_day(start) + DAY, end)
+            cls.roll_up_hours(start, chunk_end)
+            hours += int((chunk_end - start) / HOUR)
+            start = chunk_end
+        if hours:
+            logger.info(f"Rolled up {hours} hours of sales up to {end.isoformat()}")
+        return hours
+
+
+class _FactAccumulator:
+    """Sums line-level contributions into SalesFacts in a single pass."""
+
+    def __init__(self):
+        self._groups: dict[tuple, dict] = {}
+
+    def add(
+        self,
+        dimension,
+        hour,
+        key,
+        label,
+        order_id,
+        has_coupon,
+        quantity,
+        revenue,
+        per_order=False,
+    ):
+        group = self._groups.get((dimension, hour, key or 0))
+        if group is None:
+            group = self._groups[(dimension, hour, key or 0)] = {
+                "label": label or "",
+                "orders": set(),
+                "coupon_orders": set(),
+                "items_sold": 0,
+                "revenue": Decimal("0"),
+            }
+        new_order = order_id not in group["orders"]
+        group["orders"].add(order_id)
+        if has_coupon:
+            group["coupon_orders"].add(order_id)
+        group["items_sold"] += quantity
+        # Order-level dimensions take the order total once, not per line.
+        if not per_order or new_order:
+            group["revenue"] += revenue or Decimal("0")
+
+    def facts(self) -> list[SalesFact]:
+        return [
+            SalesFact(
+                dimension=dimension,
+                bucket=hour,
+                key=key,
+                label=group["label"],
+                orders_count=len(group["orders"]),
+                items_sold=group["items_sold"],
+                revenue=group["revenue"],
+                coupon_orders=len(group["coupon_orders"]),
+            )
+            for (dimension, hour, key), group in self._groups.items()
+        ]
@@ -0,0 +1,108 @@
+import logging
+
+from django.conf import settings
+from django.db.models import QuerySet
+
+from apps.checkout.models import Cart, Order
+
+logger = logging.getLogger(__name__)
+
+ORDER_DOCUMENT_FIELDS = (
+    "order_number",
+    "user__email",
+    "user__username",
+    "user__first_name",
+    "user__last_name",
+    "shipping_method__name",
+    "shipping_method__courier__name",
+    "applied_coupon__code",
+    "applied_coupon__description",
+    "shipping_address__address",
+    "shipping_address__city",
+    "shipping_address__postal_code",
+    "shipping_address__country__name",
+)
+
+CART_DOCUMENT_FIELDS = (
+    "user__email",
+    "user__username",
+    "user__first_name",
+    "user__last_name",
+    "shipping_address__address",
+    "shipping_address__city",
+    "shipping_method__name",
+    "applied_coupon__code",
+)
+
+
+class SearchDocumentService:
+    """Maintains the denormalized back-office search text of orders and carts."""
+
+    @staticmethod
+    def compose(values) -> str:
+        """Join the searchable values into one lowercased document."""
+        return " ".join(str(value).lower() for value in values if value)
+
+    @classmethod
+    def _refresh(cls, queryset: QuerySet, fields: tuple[str, ...]) -> int:
+        batch_size = settings.SEARCH_DOCUMENT_BATCH_SIZE
+        model = queryset.model
+        pending = []
+        updated = 0
+        rows = queryset.order_by().values_list("id", "search_document", *fields)
+        for pk, current, *values in rows.iterator(chunk_size=batch_size):
+            document = cls.compose(values)
+            if document == current:
+                continue
+            pending.append(model(pk=pk, search_document=document))
+            if len(pending) >= batch_size:
+                model.objects.bulk_update(pending, ["search_document"])
+                updated += len(pending)
+                pending = []
+        if pending:
+            model.objects.bulk_update(pending, ["search_document"])
+            updated += len(pending)
+        return updated
+
+    @classmethod
+    def refresh_orders(cls, queryset: QuerySet | None = None) -> int:
+        """
+        Rebuild search documents for the given orders.
+
+        Reads all searchable columns in one joined query and writes only the
+        documents that changed, in batches of ``SEARCH_DOCUMENT_BATCH_SIZE``.
+
+        Args:
+            queryset: Orders to refresh; all orders when omitted
+
+        Returns:
+            Number of orders whose document changed
+        """
+        if queryset is None:
+            queryset = Order.objects.all()
+        return cls._refresh(queryset, ORDER_DOCUMENT_FIELDS)
+
+    @classmethod
+    def refresh_carts(cls, queryset: QuerySet | None = None) -> int:
+        """
+        Rebuild search documents for the given carts.
+
+        Args:
+            queryset: Carts to refresh; all carts when omitted
+
+        Returns:
+            Number of carts whose document changed
+        """
+        if queryset is None:
+            queryset = Cart.objects.all()
+        return cls._refresh(queryset, CART_DOCUMENT_FIELDS)
+
+    @classmethod
+    def refresh_for_user(cls, user_id: int) -> None:
+        cls.refresh_orders(Order.objects.filter(user_id=user_id))
+        cls.refresh_carts(Cart.objects.filter(user_id=user_id))
+
+    @classmethod
+    def refresh_for_address(cls, address_id: int) -> None:
+        cls.refresh_orders(Order.objects.filter(shipping_address_id=address_id))
+        cls.refresh_carts(Cart.objects.filter(shipping_address_id=address_id))
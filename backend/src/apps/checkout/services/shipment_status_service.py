@@ -0,0 +1,166 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from apps.checkout.models import Order, Shipment
+from apps.profile.models import Address
+
+logger = logging.getLogger(__name__)
+
+SHIPPED = "shipped"
+DELIVERED = "delivered"
+
+# One statement per batch: unnest the events, stamp the shipments that have
+# not recorded that milestone yet, then move their orders to the matching
+# status. Existing timestamps win, so redelivered scans are no-ops.
+APPLY_EVENTS_SQL = """
+WITH events (order_number, shipped_at, delivered_at) AS (
+    SELECT * FROM unnest(%s::varchar[], %s::timestamptz[], %s::timestamptz[])
+),
+updated_shipments AS (
+    UPDATE checkout_shipment AS s
+    SET shipped_at = COALESCE(s.shipped_at, e.shipped_at),
+        delivered_at = COALESCE(s.delivered_at, e.delivered_at),
+        updated_at = now()
+    FROM events AS e
+    JOIN checkout_order AS o ON o.order_number = e.order_number
+    WHERE s.order_id = o.id
+      AND (
+          (s.shipped_at IS NULL AND e.shipped_at IS NOT NULL)
+          OR (s.delivered_at IS NULL AND e.delivered_at IS NOT NULL)
+      )
+    RETURNING s.order_id, s.shipped_at, s.delivered_at
+),
+updated_orders AS (
+    UPDATE checkout_order AS o
+    SET status = CASE
+            WHEN u.delivered_at IS NOT NULL THEN 'delivered'
+            ELSE 'shipped'
+        END,
+        updated_at = now()
+    FROM updated_shipments AS u
+    WHERE o.id = u.order_id
+    RETURNING o.id
+)
+SELECT
+    (SELECT count(*) FROM updated_shipments),
+    (SELECT count(*) FROM updated_orders)
+"""
+
+
+@dataclass(frozen=True)
+class ShipmentStatusEvent:
+    order_number: str
+    status: str
+    occurred_at: datetime
+
+
+class ShipmentStatusService:
+    """Shipment lifecycle: creation after checkout and courier status updates."""
+
+    @staticmethod
+    def create_for_order(order_id: int) -> Shipment | None:
+        """
+        Create the shipment for an order, snapshotting its shipping address.
+
+        Runs after the checkout transaction commits, so it never holds locks
+        taken by order creation. Safe to call more than once.
+
+        Args:
+            order_id: Order to create the shipment for
+
+        Returns:
+            The order's shipment, or None if the order no longer exists
+        """
+        order = (
+            Order.objects.filter(pk=order_id)
+            .only("id", "order_number", "shipping_address_id")
+            .first()
+        )
+        if order is None:
+            return None
+
+        address = (
+            Address.objects.filter(pk=order.shipping_address_id)
+            .only("label", "address", "city")
+            .first()
+        )
+        shipment, created = Shipment.objects.get_or_create(
+            order_id=order.id,
+            defaults={"shipping_address": str(address) if address else ""},
+        )
+        if created:
+            logger.info(f"Automatically created shipment for order {order.order_number}")
+        return shipment
+
+    @staticmethod
+    def sync_order_status(shipment: Shipment) -> None:
+        """Reflect a single shipment's milestones on its order."""
+        if shipment.delivered_at:
+            new_status = Order.OrderStatus.DELIVERED
+        elif shipment.shipped_at:
+            new_status = Order.OrderStatus.SHIPPED
+        else:
+            return
+        Order.objects.filter(pk=shipment.order_id).exclude(status=new_status).update(
+            status=new_status
+        )
+
+    @classmethod
+    def apply_events(cls, events: list[ShipmentStatusEvent]) -> dict[str, int]:
+        """
+        Apply a courier scan feed set-wise.
+
+        Events are collapsed per order (earliest scan per milestone; a delivery
+        scan also stamps a missing shipped_at) and written in batches of
+        ``SHIPMENT_EVENT_BATCH_SIZE``, each batch being a single statement
+        that updates shipments and orders together.
+
+        Args:
+            events: Scan events, in any order, possibly repeated
+
+        Returns:
+            Counts of received events and updated shipments and orders
+        """
+        milestones: dict[str, dict[str, datetime]] = {}
+        for event in events:
+            order_milestones = milestones.setdefault(event.order_number, {})
+            current = order_milestones.get(event.status)
+            if current is None or event.occurred_at < current:
+                order_milestones[event.status] = event.occurred_at
+
+        rows = [
+            (
+                order_number,
+                times.get(SHIPPED) or times.get(DELIVERED),
+                times.get(DELIVERED),
+            )
+            for order_number, times in milestones.items()
+        ]
+
+        updated_shipments = 0
+        updated_orders = 0
+        batch_size = settings.SHIPMENT_EVENT_BATCH_SIZE
+        for start in range(0, len(rows), batch_size):
+            order_numbers, shipped, delivered = zip(*rows[start : start + batch_size])
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(
+                    APPLY_EVENTS_SQL,
+                    [list(order_numbers), list(shipped), list(delivered)],
+                )
+                shipments_count, orders_count = cursor.fetchone()
+            updated_shipments += shipments_count
+            updated_orders += orders_count
+
+        logger.info(
+            f"Applied {len(events)} shipment events: "
+            f"{updated_shipments} shipments, {updated_orders} orders updated"
+        )
+        return {
+            "received": len(events),
+            "updated_shipments": updated_shipments,
+            "updated_orders": updated_orders,
+        }
@@ -0,0 +1,102 @@
+import logging
+from datetime import timedelta
+from typing import Any
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.catalog.models import Product
+from apps.checkout.models import Cart, CartItem, StockReservation
+
+logger = logging.getLogger(__name__)
+
+
+class StockReservationService:
+    """Holds cart quantities for the duration of a payment."""
+
+    @staticmethod
+    def available_quantity(product: Product, exclude_cart_id: int | None = None) -> int:
+        """Stock left for a cart once other carts' unexpired holds are taken out."""
+        reserved = StockReservation.reserved_quantities(
+            [product.id], exclude_cart_id=exclude_cart_id
+        ).get(product.id, 0)
+        return max(product.stock_quantity - reserved, 0)
+
+    @classmethod
+    def reserve(cls, cart: Cart) -> list[dict[str, Any]]:
+        """
+        Hold every cart line for ``STOCK_RESERVATION_TTL_SECONDS``.
+
+        Product rows are locked only while the holds are written, never across
+        the payment provider round-trip. Reserving the same cart again
+        replaces its previous holds and restarts the TTL.
+
+        Args:
+            cart: Cart about to be paid for
+
+        Returns:
+            Items that could not be held; empty when the reservation succeeded
+        """
+        lines = dict(
+            CartItem.objects.filter(cart=cart).values_list("product_id", "quantity")
+        )
+        expires_at = timezone.now() + timedelta(
+            seconds=settings.STOCK_RESERVATION_TTL_SECONDS
+        )
+
+        with transaction.atomic():
+            products = list(
+                Product.objects.select_for_update()
+                .filter(id__in=lines)
+                .order_by("id")
+                .only("id", "name", "stock_quantity")
+            )
+            reserved = StockReservation.reserved_quantities(
+                lines, exclude_cart_id=cart.id
+            )
+
+            unavailable_items = []
+            for product in products:
+                available = max(product.stock_quantity - reserved.get(product.id, 0), 0)
+                if lines[product.id] > available:
+                    unavailable_items.append(
+                        {
+                            "product_id": product.id,
+                            "product_name": product.name,
+                            "requested_quantity": lines[product.id],
+                            "available_stock": available,
+                        }
+                    )
+            if unavailable_items:
+                return unavailable_items
+
+            StockReservation.objects.filter(cart=cart).delete()
+            StockReservation.objects.bulk_create(
+                [
+                    StockReservation(
+                        cart=cart,
+                        product_id=product_id,
+                        quantity=quantity,
+                        expires_at=expires_at,
+                    )
+                    for product_id, quantity in lines.items()
+                ]
+            )
+
+        logger.info(f"Reserved {len(lines)} products for cart {cart.id}")
+        return []
+
+    @staticmethod
+    def release(cart_id: int) -> int:
+        """Drop all holds of a cart (after conversion or a failed payment)."""
+        deleted, _ = StockReservation.objects.filter(cart_id=cart_id).delete()
+        return deleted
+
+    @staticmethod
+    def release_expired() -> int:
+        """Delete holds whose TTL has passed."""
+        deleted, _ = StockReservation.objects.filter(
+            expires_at__lte=timezone.now()
+        ).delete()
+        return deleted
@@ -1,27 +1,187 @@
-from django.db.models.signals import post_save
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 import logging
 
-from apps.checkout.models import Order, Shipment
+from apps.checkout.models import (
+    Cart,
+    Coupon,
+    CouponRedemption,
+    Courier,
+    Order,
+    Shipment,
+    ShippingMethod,
+)
+from apps.checkout.services.sales_rollup_service import floor_hour, settled_until
+from apps.checkout.services.search_document_service import SearchDocumentService
+from apps.checkout.services.shipment_status_service import ShipmentStatusService
+from apps.checkout.tasks import reroll_sales_hour
+from apps.common.services.reference_data import ReferenceDataVersion
+from apps.geographic.models import Country
+from apps.profile.models import Address
 
 logger = logging.getLogger(__name__)
 
+User = get_user_model()
+
+ORDER_SEARCH_SOURCE_FIELDS = {
+    "order_number",
+    "user",
+    "shipping_address",
+    "shipping_method",
+    "applied_coupon",
+}
+ORDER_SALES_SOURCE_FIELDS = {
+    "created_at",
+    "total",
+    "applied_coupon",
+    "shipping_method",
+    "shipping_address",
+}
+CART_SEARCH_SOURCE_FIELDS = {
+    "user",
+    "shipping_address",
+    "shipping_method",
+    "applied_coupon",
+}
+USER_SEARCH_SOURCE_FIELDS = {"email", "username", "first_name", "last_name"}
+
+
+def _may_change_search_text(update_fields, source_fields) -> bool:
+    """Saves restricted to unrelated fields (e.g. last_login) need no re-index."""
+    return not update_fields or bool(source_fields & set(update_fields))
+
+
+def _schedule_sales_reroll(created_at) -> None:
+    """Queue a re-roll of the order's hour if that hour may already be rolled up."""
+    hour = floor_hour(created_at)
+    if hour >= settled_until():
+        return
+    delay = settings.SALES_ROLLUP_SETTLE_SECONDS
+    # One task per hour and window; the lock expires before the task runs, so
+    # later changes either are seen by it or queue another one.
+    if cache.add(f"sales-reroll:{int(hour.timestamp())}", True, timeout=delay):
+        reroll_sales_hour.apply_async((hour.isoformat(),), countdown=delay + 1)
+
 
 @receiver(post_save, sender=Order)
 def create_shipment_on_order_creation(sender, instance, created, **kwargs):
     """
-    Automatically create a shipment when a new order is created.
+    Create the shipment for a new order once the checkout transaction commits.
     """
     if not created:
         return
 
-    try:
-        Shipment.objects.create(
-            order=instance,
-            shipping_address=str(instance.shipping_address),
-        )
-        logger.info(f"Automatically created shipment for order {instance.order_number}")
-    except Exception as e:
-        logger.error(
-            f"Failed to create shipment for order {instance.order_number}: {str(e)}"
+    order_id = instance.id
+
+    def create_shipment():
+        try:
+            ShipmentStatusService.create_for_order(order_id)
+        except Exception as e:
+            logger.error(f"Failed to create shipment for order {order_id}: {str(e)}")
+
+    transaction.on_commit(create_shipment)
+
+
+@receiver(post_save, sender=Shipment)
+def sync_order_status_on_shipment_save(sender, instance, raw=False, **kwargs):
+    """Move the order to shipped/delivered when a shipment is edited directly."""
+    if not raw:
+        ShipmentStatusService.sync_order_status(instance)
+
+
+@receiver(post_save, sender=CouponRedemption)
+def increment_coupon_usage_count(sender, instance, created, **kwargs):
+    """Keep Coupon.usage_count in step with newly recorded redemptions."""
+    if created:
+        Coupon.adjust_usage_count(instance.coupon_id, 1)
+
+
+@receiver(post_delete, sender=CouponRedemption)
+def decrement_coupon_usage_count(sender, instance, **kwargs):
+    """Release the counter slot when a redemption row is removed."""
+    Coupon.adjust_usage_count(instance.coupon_id, -1)
+
+
+@receiver(post_save, sender=Order)
+def build_order_search_document(
+    sender, instance, raw=False, update_fields=None, **kwargs
+):
+    """Re-index an order when one of its searchable fields may have changed."""
+    if raw or not _may_change_search_text(update_fields, ORDER_SEARCH_SOURCE_FIELDS):
+        return
+    order_id = instance.id
+    transaction.on_commit(
+        lambda: SearchDocumentService.refresh_orders(Order.objects.filter(pk=order_id))
+    )
+
+
+@receiver(post_save, sender=Order)
+def reroll_sales_on_order_save(
+    sender, instance, raw=False, update_fields=None, **kwargs
+):
+    """Orders committed or edited after their hour was rolled up."""
+    if raw or not _may_change_search_text(update_fields, ORDER_SALES_SOURCE_FIELDS):
+        return
+    created_at = instance.created_at
+    transaction.on_commit(lambda: _schedule_sales_reroll(created_at))
+
+
+@receiver(post_delete, sender=Order)
+def reroll_sales_on_order_delete(sender, instance, **kwargs):
+    """A deleted order must leave the totals of its hour."""
+    created_at = instance.created_at
+    transaction.on_commit(lambda: _schedule_sales_reroll(created_at))
+
+
+@receiver(post_save, sender=Cart)
+def build_cart_search_document(
+    sender, instance, raw=False, update_fields=None, **kwargs
+):
+    """Re-index a cart when one of its searchable relations may have changed."""
+    if raw or not _may_change_search_text(update_fields, CART_SEARCH_SOURCE_FIELDS):
+        return
+    cart_id = instance.id
+    transaction.on_commit(
+        lambda: SearchDocumentService.refresh_carts(Cart.objects.filter(pk=cart_id))
+    )
+
+
+@receiver(post_save, sender=User)
+def refresh_search_documents_for_user(
+    sender, instance, created, raw=False, update_fields=None, **kwargs
+):
+    """Names and emails are part of order and cart search documents."""
+    if (
+        not created
+        and not raw
+        and _may_change_search_text(update_fields, USER_SEARCH_SOURCE_FIELDS)
+    ):
+        user_id = instance.id
+        transaction.on_commit(lambda: SearchDocumentService.refresh_for_user(user_id))
+
+
+@receiver(post_save, sender=Address)
+def refresh_search_documents_for_address(
+    sender, instance, created, raw=False, **kwargs
+):
+    """Orders and carts shipping to an edited address carry its text."""
+    if not created and not raw:
+        address_id = instance.id
+        transaction.on_commit(
+            lambda: SearchDocumentService.refresh_for_address(address_id)
         )
+
+
+@receiver(post_save, sender=Country)
+@receiver(post_delete, sender=Country)
+@receiver(post_save, sender=Courier)
+@receiver(post_delete, sender=Courier)
+@receiver(post_save, sender=ShippingMethod)
+@receiver(post_delete, sender=ShippingMethod)
+def bump_reference_data_version(sender, **kwargs):
+    """Tell per-process reference data registries to reload once the change commits."""
+    transaction.on_commit(ReferenceDataVersion.bump)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+
+from celery import shared_task
+
+from apps.checkout.services.order_finalization_service import (
+    OrderFinalizationService,
+)
+from apps.checkout.services.payment_gateway import (
+    PaymentGatewayError,
+    get_payment_gateway,
+)
+from apps.checkout.services.report_service import ReportJobService
+from apps.checkout.services.sales_rollup_service import SalesRollupService
+from apps.checkout.services.search_document_service import (
+    SearchDocumentService,
+)
+from apps.checkout.services.stock_reservation_service import (
+    StockReservationService,
+)
+
+logger = logging.getLogger(__name__)
+
+@shared_task(
+    name="checkout.finalize_paid_order",
+    autoretry_for=(Exception,),
+    dont_autoretry_for=(ValueError,),
+    retry_backoff=True,
+    max_retries=5,
+)
+def finalize_paid_order(payment_intent_id: str) -> str | None:
+    """Create the order for a succeeded PaymentIntent (idempotent)."""
+    order = OrderFinalizationService.finalize(payment_intent_id)
+    return order.order_number if order else None
+
+
+@shared_task(name="checkout.reconcile_payment_intent")
+def reconcile_payment_intent(payment_intent_id: str) -> None:
+    """Fallback for missed webhooks: ask the provider for the intent status."""
+    try:
+        payment_intent = get_payment_gateway().retrieve_payment_intent(
+            payment_intent_id
+        )
+    except PaymentGatewayError as e:
+        logger.warning(f"Could not reconcile PaymentIntent {payment_intent_id}: {e}")
+        return
+
+    if payment_intent.status == "succeeded":
+        OrderFinalizationService.finalize(payment_intent_id)
+    elif payment_intent.status == "canceled":
+        OrderFinalizationService.mark_canceled(payment_intent_id)
+
+
+@shared_task(name="checkout.release_expired_reservations")
+def release_expired_reservations() -> int:
+    """Sweep stock holds whose TTL has passed."""
+    released = StockReservationService.release_expired()
+    if released:
+        logger.info(f"Released {released} expired stock reservations")
+    return released
+
+
+@shared_task(name="checkout.rebuild_search_documents")
+def rebuild_search_documents() -> dict[str, int]:
+    """
+    Re-sync every order and cart search document.
+
+    Signals cover user and address edits; this picks up renamed shipping
+    methods, couriers, coupons and countries.
+    """
+    result = {
+        "orders": SearchDocumentService.refresh_orders(),
+        "carts": SearchDocumentService.refresh_carts(),
+    }
+    logger.info(f"Rebuilt search documents: {result}")
+    return result
+
+
+@shared_task(name="checkout.roll_up_sales")
+def roll_up_sales() -> int:
+    """Add the hours closed since the last run to the sales rollup."""
+    return SalesRollupService.catch_up()
+
+
+@shared_task(name="checkout.reroll_sales_hour")
+def reroll_sales_hour(hour: str) -> bool:
+    """Recompute one rolled hour whose orders changed after it was rolled."""
+    return SalesRollupService.reroll_hour(datetime.fromisoformat(hour))
+
+
+@shared_task(name="checkout.build_report")
+def build_report(job_id: int) -> str | None:
+    """Build a requested report and store its artifact."""
+    job = ReportJobService.build(job_id)
+    return job.status if job else None
+
+
+@shared_task(name="checkout.purge_report_jobs")
+def purge_report_jobs() -> int:
+    """Drop report jobs and artifacts past their retention period."""
+    deleted = ReportJobService.purge_expired()
+    if deleted:
+        logger.info(f"Purged {deleted} expired report jobs")
+    return deleted
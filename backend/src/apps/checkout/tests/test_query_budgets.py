@@ -0,0 +1,103 @@
+import pytest
+
+from conftest import DATASET_SIZES
+from shopdjango.query_metrics import query_budget
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize("size", DATASET_SIZES)
+def test_customer_order_list(size, customer, api_client, make_products, make_order):
+    products = make_products(size)
+    for _ in range(size):
+        make_order(customer, products[:2])
+    client = api_client(customer)
+
+    with query_budget(3):
+        response = client.get("/api/checkout/orders/")
+
+    assert response.status_code == 200
+    assert response.data["count"] == size
+
+
+@pytest.mark.parametrize("size", DATASET_SIZES)
+def test_staff_order_list(
+    size, customer, employee, api_client, make_products, make_order
+):
+    products = make_products(size)
+    for _ in range(size):
+        make_order(customer, products[:2])
+    client = api_client(employee)
+
+    with query_budget(3):
+        response = client.get("/api/checkout/orders/")
+
+    assert response.status_code == 200
+    assert response.data["count"] == size
+
+
+@pytest.mark.parametrize("size", DATASET_SIZES)
+def test_order_detail(size, customer, api_client, make_products, make_order):
+    order = make_order(customer, make_products(size))
+    client = api_client(customer)
+
+    with query_budget(3):
+        response = client.get(f"/api/checkout/orders/{order.id}/")
+
+    assert response.status_code == 200
+    assert len(response.data["items"]) == size
+
+
+@pytest.mark.parametrize("size", DATASET_SIZES)
+def test_create_checkout_session(size, customer, api_client, make_products, make_cart):
+    cart = make_cart(customer, make_products(size))
+    client = api_client(customer)
+
+    # 1 shipping address lookup during validation
+    # 3 reference data load: couriers, shipping methods, countries (cold process)
+    # 3 active cart, shipping address, cart save with the shipping choice
+    # 2 preflight: availability and line quantities
+    # 6 stock holds: savepoint, product rows, held totals, delete and insert
+    #   holds, release
+    # 4 Payment get_or_create: lookup, savepoint, insert, release
+    with query_budget(19):
+        response = client.post(
+            "/api/checkout/create_checkout_session/",
+            {
+                "currency": "pln",
+                "shipping_address_id": cart.shipping_address_id,
+                "shipping_method_id": cart.shipping_method_id,
+            },
+            format="json",
+        )
+
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("size", DATASET_SIZES)
+def test_current_cart(size, customer, api_client, make_products, make_cart):
+    make_cart(customer, make_products(size))
+    client = api_client(customer)
+
+    with query_budget(4):
+        response = client.get("/api/checkout/carts/current/")
+
+    assert response.status_code == 200
+    assert len(response.data["items"]) == size
+
+
+@pytest.mark.parametrize("size", DATASET_SIZES)
+def test_orders_export_csv(
+    size, customer, employee, api_client, make_products, make_order
+):
+    products = make_products(size)
+    for _ in range(size):
+        make_order(customer, products[:2])
+    client = api_client(employee)
+
+    with query_budget(2):
+        response = client.get("/api/checkout/orders/export.csv?period=24h")
+        content = b"".join(response.streaming_content).decode()
+
+    assert response.status_code == 200
+    assert len(content.splitlines()) == size + 1
@@ -6,15 +6,21 @@ from apps.checkout.views import (
     CartItemViewSet,
     CreateCheckoutSessionView,
     ConfirmPaymentIntentView,
+    StripeWebhookView,
     ShippingMethodViewSet,
     CourierViewSet,
     ShipmentViewSet,
     OrderProcessingNoteViewSet,
     PaymentViewSet,
     CouponRedemptionViewSet,
+    ReportJobViewSet,
 )
 from apps.checkout.views.order import OrderViewSet
-from apps.checkout.views.analytics import DashboardAnalyticsView, OrdersExportCsvView
+from apps.checkout.views.analytics import (
+    DashboardAnalyticsView,
+    OrdersExportCsvView,
+    SalesSeriesView,
+)
 from apps.checkout.views.coupon import CouponViewSet
 from apps.checkout.views.invoice import InvoiceTemplateViewSet, InvoiceViewSet
 
@@ -39,10 +45,12 @@ router.register(
     r"invoice-templates", InvoiceTemplateViewSet, basename="invoice-template"
 )
 router.register(r"invoices", InvoiceViewSet, basename="invoice")
+router.register(r"report-jobs", ReportJobViewSet, basename="report-job")
 
 urlpatterns = [
     path("orders/export.csv", OrdersExportCsvView.as_view(), name="orders_export_csv"),
     path("dashboard/", DashboardAnalyticsView.as_view(), name="dashboard_analytics"),
+    path("dashboard/series/", SalesSeriesView.as_view(), name="sales_series"),
     path("", include(router.urls)),
     path(
         "create_checkout_session/",
@@ -54,4 +62,5 @@ urlpatterns = [
         ConfirmPaymentIntentView.as_view(),
         name="confirm_payment_intent",
     ),
+    path("webhooks/stripe/", StripeWebhookView.as_view(), name="stripe_webhook"),
 ]
@@ -3,6 +3,7 @@ from apps.checkout.views.cart_item import CartItemViewSet
 from apps.checkout.views.payment_stripe import (
     CreateCheckoutSessionView,
     ConfirmPaymentIntentView,
+    StripeWebhookView,
 )
 from apps.checkout.views.shipping_method import ShippingMethodViewSet
 from apps.checkout.views.invoice import InvoiceTemplateViewSet, InvoiceViewSet
@@ -12,12 +13,14 @@ from apps.checkout.views.shipment import ShipmentViewSet
 from apps.checkout.views.order_processing_note import OrderProcessingNoteViewSet
 from apps.checkout.views.payment import PaymentViewSet
 from apps.checkout.views.coupon_redemption import CouponRedemptionViewSet
+from apps.checkout.views.report_job import ReportJobViewSet
 
 __all__ = [
     "CartViewSet",
     "CartItemViewSet",
     "CreateCheckoutSessionView",
     "ConfirmPaymentIntentView",
+    "StripeWebhookView",
     "ShippingMethodViewSet",
     "InvoiceTemplateViewSet",
     "InvoiceViewSet",
@@ -27,4 +30,5 @@ __all__ = [
     "OrderProcessingNoteViewSet",
     "PaymentViewSet",
     "CouponRedemptionViewSet",
+    "ReportJobViewSet",
 ]
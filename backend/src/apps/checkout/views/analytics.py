@@ -2,9 +2,9 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from django.utils import timezone
-from datetime import timedelta
-from django.db.models import Sum, Count
-from django.http import HttpResponse
+from datetime import datetime
+from itertools import chain
+from django.http import StreamingHttpResponse
 import csv
 from drf_spectacular.utils import (
     extend_schema,
@@ -12,16 +12,30 @@ from drf_spectacular.utils import (
     OpenApiTypes,
 )
 from drf_spectacular.utils import OpenApiResponse
-from apps.checkout.models.order import Order
-from apps.checkout.models.order_item import OrderItem
+from apps.checkout.models.sales_rollup import SalesRollup
 from apps.profile.models import Profile
-from apps.profile.permissions import ReadOnlyOrRoles
-from apps.checkout.serializers.analytics import DashboardStatsSerializer
+from apps.profile.permissions import RolesAllowed
+from apps.checkout.serializers.analytics import (
+    DashboardStatsSerializer,
+    SalesSeriesQuerySerializer,
+    SalesSeriesSerializer,
+)
+from apps.checkout.services.report_service import (
+    ORDER_EXPORT_COLUMNS,
+    order_export_rows,
+    period_start,
+)
+from apps.checkout.services.sales_analytics_service import (
+    METRICS,
+    SalesAnalyticsService,
+)
 
 
 class DashboardAnalyticsView(APIView):
+    read_replica_actions = {"get"}
+
     def get_permissions(self):
-        return [ReadOnlyOrRoles({Profile.Role.ADMIN, Profile.Role.EMPLOYEE})]
+        return [RolesAllowed({Profile.Role.ADMIN, Profile.Role.EMPLOYEE})]
 
     @extend_schema(
         summary="Dashboard analytics",
@@ -40,88 +54,58 @@ class DashboardAnalyticsView(APIView):
     def get(self, request):
         period = request.query_params.get("period", "7d")
         now = timezone.now()
-        if period == "24h":
-            since = now - timedelta(days=1)
-        elif period == "7d":
-            since = now - timedelta(days=7)
-        elif period == "30d":
-            since = now - timedelta(days=30)
-        elif period == "lifetime":
-            since = None
-        else:
+        try:
+            since = period_start(period, now)
+        except ValueError:
             return Response(
                 {"error": "Invalid period"}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        qs = Order.objects.all()
+        summary = SalesAnalyticsService.summary(since, now)
 
-        if since is not None:
-            qs = qs.filter(created_at__gte=since)
+        def ranked(dimension, metric):
+            return sorted(summary[dimension], key=lambda e: e[metric], reverse=True)
 
-        total_orders = qs.count()
-        revenue = qs.aggregate(v=Sum("total"))["v"] or 0
+        totals = next(iter(summary[SalesRollup.Dimension.TOTAL]), None) or {
+            metric: 0 for metric in METRICS
+        }
+        total_orders = int(totals["orders_count"])
+        revenue = round(totals["revenue"], 2)
         avg_order = (revenue / total_orders) if total_orders else 0
+        items_sold = int(totals["items_sold"])
 
-        items_qs = OrderItem.objects.filter(order__in=qs)
-        items_sold = items_qs.aggregate(v=Sum("quantity"))["v"] or 0
-
-        methods = list(
-            qs.values("shipping_method__name")
-            .annotate(count=Count("id"))
-            .order_by("-count")
-        )
         methods_entries = [
-            {"name": m["shipping_method__name"] or "Unknown", "count": m["count"]}
-            for m in methods
+            {"name": m["label"] or "Unknown", "count": int(m["orders_count"])}
+            for m in ranked(SalesRollup.Dimension.SHIPPING_METHOD, "orders_count")
         ]
         methods_total = sum(m["count"] for m in methods_entries)
 
-        products = list(
-            items_qs.values("product__name")
-            .annotate(qty=Sum("quantity"), revenue=Sum("total_price"))
-            .order_by("-qty")
-        )
         products_entries = [
             {
-                "name": p["product__name"] or "Unknown",
-                "qty": int(p["qty"] or 0),
-                "revenue": float(p["revenue"] or 0),
+                "name": p["label"] or "Unknown",
+                "qty": int(p["items_sold"]),
+                "revenue": round(p["revenue"], 2),
             }
-            for p in products
+            for p in ranked(SalesRollup.Dimension.PRODUCT, "items_sold")
         ]
         total_qty = sum(p["qty"] for p in products_entries)
 
-        manufacturers = list(
-            items_qs.values("product__manufacturer__name")
-            .annotate(qty=Sum("quantity"))
-            .order_by("-qty")
-        )
         manufacturers_entries = [
-            {
-                "name": m["product__manufacturer__name"] or "Unknown",
-                "qty": int(m["qty"] or 0),
-            }
-            for m in manufacturers
+            {"name": m["label"] or "Unknown", "qty": int(m["items_sold"])}
+            for m in ranked(SalesRollup.Dimension.MANUFACTURER, "items_sold")
         ]
 
-        tags = list(
-            items_qs.filter(product__tags__isnull=False)
-            .values("product__tags__name")
-            .annotate(qty=Sum("quantity"))
-            .order_by("-qty")
-        )
         tags_entries = [
-            {"name": t["product__tags__name"] or "Unknown", "qty": int(t["qty"] or 0)}
-            for t in tags
+            {"name": t["label"] or "Unknown", "qty": int(t["items_sold"])}
+            for t in ranked(SalesRollup.Dimension.TAG, "items_sold")
         ]
 
-        used = qs.filter(applied_coupon__isnull=False).count()
-        coupon_usage = {"used": used, "total": total_orders}
+        coupon_usage = {"used": int(totals["coupon_orders"]), "total": total_orders}
         data = {
             "period": period,
             "orders_count": total_orders,
-            "revenue": float(revenue),
-            "avg_order": float(avg_order),
+            "revenue": revenue,
+            "avg_order": round(avg_order, 2),
             "items_sold": int(items_sold),
             "shipping_methods": {"entries": methods_entries, "total": methods_total},
             "products": {"entries": products_entries, "totalQty": total_qty},
@@ -133,13 +117,78 @@ class DashboardAnalyticsView(APIView):
         return Response(data)
 
 
+class SalesSeriesView(APIView):
+    read_replica_actions = {"get"}
+
+    def get_permissions(self):
+        return [RolesAllowed({Profile.Role.ADMIN, Profile.Role.EMPLOYEE})]
+
+    @extend_schema(
+        summary="Sales time series",
+        description=(
+            "Orders, units, revenue and coupon usage per time bucket over "
+            "[start, end), optionally grouped by product, manufacturer, tag, "
+            "shipping method or country. Served from the sales rollup."
+        ),
+        parameters=[SalesSeriesQuerySerializer],
+        responses={200: SalesSeriesSerializer},
+    )
+    def get(self, request):
+        query = SalesSeriesQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        series = SalesAnalyticsService.series(
+            params["group_by"], params["start"], params["end"], params["bucket"]
+        ).top(params["limit"])
+
+        entries = []
+        for index, key in enumerate(series.keys.tolist()):
+            values = {
+                metric: series.values[position, index]
+                for position, metric in enumerate(METRICS)
+            }
+            entries.append(
+                {
+                    "key": key,
+                    "label": series.labels[index] or "Unknown",
+                    "orders_count": values["orders_count"].astype(int).tolist(),
+                    "items_sold": values["items_sold"].astype(int).tolist(),
+                    "revenue": values["revenue"].round(2).tolist(),
+                    "coupon_orders": values["coupon_orders"].astype(int).tolist(),
+                    "totals": {
+                        "orders_count": int(values["orders_count"].sum()),
+                        "items_sold": int(values["items_sold"].sum()),
+                        "revenue": round(float(values["revenue"].sum()), 2),
+                        "coupon_orders": int(values["coupon_orders"].sum()),
+                    },
+                }
+            )
+
+        data = {
+            "group_by": params["group_by"],
+            "start": series.buckets[0],
+            "end": params["end"],
+            "bucket": request.query_params.get("bucket", "1d"),
+            "buckets": series.buckets,
+            "series": entries,
+        }
+        return Response(SalesSeriesSerializer(data).data)
+
+
 class OrdersExportCsvView(APIView):
+    read_replica_actions = {"get"}
+
     def get_permissions(self):
-        return [ReadOnlyOrRoles({Profile.Role.ADMIN, Profile.Role.EMPLOYEE})]
+        return [RolesAllowed({Profile.Role.ADMIN, Profile.Role.EMPLOYEE})]
 
     @extend_schema(
         summary="Export orders CSV",
-        description="Download CSV of orders for the given period (24h, 7d, 30d, lifetime)",
+        description=(
+            "Stream a CSV of orders for the given period (24h, 7d, 30d, "
+            "lifetime). For large periods or other formats, request a "
+            "report job instead."
+        ),
         parameters=[
             OpenApiParameter(
                 name="period",
@@ -157,89 +206,29 @@ class OrdersExportCsvView(APIView):
     )
     def get(self, request):
         period = request.query_params.get("period", "7d")
-        now = timezone.now()
-        if period == "24h":
-            since = now - timedelta(days=1)
-        elif period == "7d":
-            since = now - timedelta(days=7)
-        elif period == "30d":
-            since = now - timedelta(days=30)
-        elif period == "lifetime":
-            since = None
-        else:
+        try:
+            since = period_start(period, timezone.now())
+        except ValueError:
             return Response(
                 {"error": "Invalid period"}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        qs = Order.objects.select_related(
-            "shipping_method",
-            "shipping_address",
-            "applied_coupon",
+        writer = csv.writer(_Echo())
+        header = [column.name for column in ORDER_EXPORT_COLUMNS]
+        rows = (
+            [value.isoformat() if isinstance(value, datetime) else value for value in row]
+            for row in order_export_rows(since)
+        )
+        response = StreamingHttpResponse(
+            (writer.writerow(row) for row in chain([header], rows)),
+            content_type="text/csv",
         )
-
-        if since is not None:
-            qs = qs.filter(created_at__gte=since)
-
-        response = HttpResponse(content_type="text/csv")
         response["Content-Disposition"] = f'attachment; filename="orders_{period}.csv"'
+        return response
 
-        writer = csv.writer(response)
-        writer.writerow(
-            [
-                "id",
-                "order_number",
-                "created_at",
-                "status",
-                "subtotal",
-                "shipping_cost",
-                "total",
-                "shipping_method_name",
-                "coupon_code",
-                "buyer_display_name",
-                "buyer_email",
-                "shipping_country",
-                "shipping_city",
-            ]
-        )
 
-        for o in qs.iterator():
-            shipping_method_name = (
-                getattr(o.shipping_method, "name", "") if o.shipping_method else ""
-            )
-            coupon_code = (
-                getattr(o.applied_coupon, "code", "") if o.applied_coupon else ""
-            )
-            shipping_address = getattr(o, "shipping_address", None)
-            buyer_display_name = ""
-            buyer_email = ""
-            country_name = ""
-            city = ""
-            if shipping_address is not None:
-                profile = getattr(shipping_address, "profile", None)
-                buyer_display_name = (
-                    getattr(profile, "display_name", "") if profile else ""
-                )
-                buyer_email = getattr(profile, "user_email", "") if profile else ""
-                country = getattr(shipping_address, "country", None)
-                country_name = getattr(country, "name", "") if country else ""
-                city = getattr(shipping_address, "city", "") or ""
-
-            writer.writerow(
-                [
-                    o.id,
-                    o.order_number,
-                    o.created_at.isoformat(),
-                    o.status,
-                    str(o.subtotal),
-                    str(o.shipping_cost),
-                    str(o.total),
-                    shipping_method_name,
-                    coupon_code,
-                    buyer_display_name,
-                    buyer_email,
-                    country_name,
-                    city,
-                ]
-            )
+class _Echo:
+    """File-like object that hands back what csv.writer writes to it."""
 
-        return response
+    def write(self, value):
+        return value
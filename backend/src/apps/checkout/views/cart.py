@@ -1,11 +1,13 @@
+from apps.common.filters import SearchDocumentFilter
 from apps.common.models import BaseViewSet
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.filters import OrderingFilter
+from django.db.models import Prefetch
 from django_filters.rest_framework import DjangoFilterBackend
 
-from apps.checkout.models import Cart
+from apps.checkout.models import Cart, CartItem
 from apps.checkout.serializers import (
     CartSerializer,
     CartListSerializer,
@@ -16,20 +18,11 @@ class CartViewSet(BaseViewSet):
     """ViewSet for Cart model with CRUD operations."""
 
     serializer_class = CartSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, SearchDocumentFilter, OrderingFilter]
     filterset_fields = ["id"]
 
-    search_fields = [
-        "status",
-        "user__email",
-        "user__username",
-        "user__first_name",
-        "user__last_name",
-        "shipping_address__address_line_1",
-        "shipping_address__city",
-        "shipping_method__name",
-        "applied_coupon__code",
-    ]
+    search_document_field = "search_document"
+    search_exact_fields = ("status",)
     ordering_fields = [
         "status",
         "created_at",
@@ -45,7 +38,24 @@ class CartViewSet(BaseViewSet):
 
     def get_queryset(self):
         """Filter queryset to user's carts only."""
-        return Cart.objects.filter(user=self.request.user)
+        queryset = Cart.objects.filter(user=self.request.user)
+        if self.action == "list":
+            return queryset
+        return queryset.select_related(
+            "shipping_address__country",
+            "shipping_address__profile__user",
+            "shipping_method",
+            "applied_coupon",
+        ).prefetch_related(
+            Prefetch(
+                "items",
+                queryset=CartItem.objects.select_related(
+                    "product__category",
+                    "product__manufacturer",
+                    "product__primary_image",
+                ),
+            )
+        )
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -61,6 +71,7 @@ class CartViewSet(BaseViewSet):
     def current(self, request):
         """Get current user's active cart."""
         cart = Cart.get_or_create_active_cart(request.user)
+        cart = self.get_queryset().get(pk=cart.pk)
         serializer = CartSerializer(cart, context={"request": request})
         response = Response(serializer.data)
         return response
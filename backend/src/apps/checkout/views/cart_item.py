@@ -6,6 +6,9 @@ from rest_framework.filters import OrderingFilter, SearchFilter
 from django_filters.rest_framework import DjangoFilterBackend
 
 from apps.checkout.models import Cart, CartItem
+from apps.checkout.services.stock_reservation_service import (
+    StockReservationService,
+)
 from apps.checkout.serializers import (
     CartItemSerializer,
     CartItemCreateSerializer,
@@ -73,16 +76,19 @@ class CartItemViewSet(BaseViewSet):
         amount = serializer.validated_data["amount"]
 
         new_quantity = item.quantity + amount
-        if new_quantity > item.product.stock_quantity:
+        available_stock = StockReservationService.available_quantity(
+            item.product, exclude_cart_id=item.cart_id
+        )
+        if new_quantity > available_stock:
             from rest_framework import status
             return Response(
                 {
                     "error": "Insufficient stock",
-                    "detail": f"Requested quantity ({new_quantity}) exceeds available stock ({item.product.stock_quantity})",
+                    "detail": f"Requested quantity ({new_quantity}) exceeds available stock ({available_stock})",
                     "product_id": item.product.id,
                     "product_name": item.product.name,
                     "requested_quantity": new_quantity,
-                    "available_stock": item.product.stock_quantity,
+                    "available_stock": available_stock,
                 },
                 status=status.HTTP_422_UNPROCESSABLE_ENTITY,
             )
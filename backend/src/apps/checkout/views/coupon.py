@@ -7,7 +7,6 @@ from drf_spectacular.utils import extend_schema, inline_serializer
 from apps.profile.models import Profile
 from apps.profile.permissions import ReadOnlyOrRoles, get_user_role
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Count
 
 from apps.checkout.models.coupon import Coupon
 from apps.checkout.serializers.coupon import (
@@ -63,12 +62,6 @@ class CouponViewSet(BaseViewSet):
             return []
         return [ReadOnlyOrRoles({Profile.Role.ADMIN})]
 
-    def get_queryset(self):
-        """Optimize queryset with prefetch for usage count."""
-        return self.queryset.prefetch_related('redemptions').annotate(
-            usage_count=Count('redemptions')
-        )
-
     def list(self, request, *args, **kwargs):
         role = get_user_role(getattr(self.request, "user", None))
         if role not in [Profile.Role.ADMIN, Profile.Role.EMPLOYEE]:
@@ -1,4 +1,5 @@
-from apps.common.models import BaseViewSet
+from apps.common.models import BaseViewSet, InMemoryListMixin
+from apps.common.services.reference_data import ReferenceData
 from rest_framework.filters import SearchFilter, OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
 
@@ -9,7 +10,7 @@ from apps.checkout.models import Courier
 from apps.checkout.serializers import CourierSerializer
 
 
-class CourierViewSet(BaseViewSet):
+class CourierViewSet(InMemoryListMixin, BaseViewSet):
     queryset = Courier.objects.all()
     serializer_class = CourierSerializer
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
@@ -30,3 +31,6 @@ class CourierViewSet(BaseViewSet):
 
     def get_permissions(self):
         return [ReadOnlyOrRoles({Profile.Role.ADMIN})]
+
+    def get_list_rows(self):
+        return ReferenceData.get().couriers
@@ -1,5 +1,7 @@
 from django.http import HttpResponse
+from apps.common.filters import SearchDocumentFilter
 from apps.common.models import BaseViewSet
+from apps.common.querysets import QueryPlan, QueryPlanMixin
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -20,6 +22,7 @@ from apps.profile.permissions import ReadOnlyOrRoles, get_user_role
 from apps.checkout.serializers.invoice import (
     InvoiceTemplateSerializer,
     InvoiceSerializer,
+    InvoiceListSerializer,
 )
 from apps.checkout.serializers.template_variables import (
     TemplateVariablesResponseSerializer,
@@ -107,24 +110,19 @@ class InvoiceTemplateViewSet(BaseViewSet):
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
 
-class InvoiceViewSet(BaseViewSet):
+class InvoiceViewSet(QueryPlanMixin, BaseViewSet):
     """ViewSet for managing invoices."""
 
     queryset = Invoice.objects.all()
     serializer_class = InvoiceSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, SearchDocumentFilter, OrderingFilter]
     filterset_fields = ["id"]
 
-    search_fields = [
-        "invoice_number",
-        "order__order_number",
-        "order__user__email",
-        "order__user__username",
-        "order__shipping_address__address_line_1",
-        "order__shipping_address__city",
-        "order__shipping_address__postal_code",
-        "order__shipping_address__country__name",
-    ]
+    search_document_field = "order__search_document"
+    search_prefix_fields = {
+        "INV-": "invoice_number",
+        "ORD-": "order__order_number",
+    }
     ordering_fields = [
         "id",
         "invoice_number",
@@ -143,15 +141,34 @@ class InvoiceViewSet(BaseViewSet):
     ]
     ordering = ["-created_at"]
     pagination_class = None
+    query_plans = {
+        "list": QueryPlan(
+            select_related=("order",),
+            only=(
+                "id",
+                "invoice_number",
+                "created_at",
+                "updated_at",
+                "order__order_number",
+            ),
+        ),
+        "retrieve": QueryPlan(select_related=("order",)),
+    }
 
     def get_permissions(self):
         return [ReadOnlyOrRoles({Profile.Role.ADMIN, Profile.Role.EMPLOYEE})]
 
     def get_queryset(self):
         role = get_user_role(getattr(self.request, "user", None))
-        if role in [Profile.Role.ADMIN, Profile.Role.EMPLOYEE]:
-            return self.queryset
-        return self.queryset.filter(order__user=self.request.user)
+        queryset = self.queryset
+        if role not in [Profile.Role.ADMIN, Profile.Role.EMPLOYEE]:
+            queryset = queryset.filter(order__user=self.request.user)
+        return self.apply_query_plan(queryset)
+
+    def get_serializer_class(self):
+        if self.action == "list":
+            return InvoiceListSerializer
+        return InvoiceSerializer
 
     @extend_schema(
         summary="Download invoice PDF by order",
@@ -1,35 +1,28 @@
+from apps.common.filters import SearchDocumentFilter
 from apps.common.models import BaseViewSet
+from apps.common.querysets import QueryPlan, QueryPlanMixin
 from drf_spectacular.utils import extend_schema
 from apps.checkout.models.order import Order
 from apps.profile.models import Profile
 from apps.profile.permissions import ReadOnlyOrRoles, get_user_role
 from apps.checkout.serializers.order import OrderSerializer, OrderDetailSerializer
 from drf_spectacular.utils import inline_serializer
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.filters import OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
 from apps.checkout.filters import OrderFilter
 
 
-class OrderViewSet(BaseViewSet):
+class OrderViewSet(QueryPlanMixin, BaseViewSet):
     """Orders: users read their own; employees/admins full CRUD across all."""
 
     serializer_class = OrderSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, SearchDocumentFilter, OrderingFilter]
     filterset_fields = ["id"]
 
     filterset_class = OrderFilter
-    search_fields = [
-        "order_number",
-        "status",
-        "user__email",
-        "user__username",
-        "user__first_name",
-        "user__last_name",
-        "shipping_method__name",
-        "shipping_method__courier__name",
-        "applied_coupon__code",
-        "applied_coupon__description",
-    ]
+    search_document_field = "search_document"
+    search_prefix_fields = {"ORD-": "order_number"}
+    search_exact_fields = ("status",)
     ordering_fields = [
         "id",
         "order_number",
@@ -50,15 +43,39 @@ class OrderViewSet(BaseViewSet):
         "applied_coupon__code",
     ]
     ordering = ["-created_at"]
+    query_plans = {
+        "list": QueryPlan(
+            only=(
+                "id",
+                "order_number",
+                "status",
+                "subtotal",
+                "shipping_cost",
+                "coupon_discount",
+                "total",
+                "created_at",
+            ),
+        ),
+        "retrieve": QueryPlan(
+            select_related=(
+                "shipping_address__country",
+                "shipping_address__profile__user",
+                "shipping_method",
+                "applied_coupon",
+            ),
+            prefetch_related=("items",),
+        ),
+    }
 
     def get_permissions(self):
         return [ReadOnlyOrRoles({Profile.Role.ADMIN})]
 
     def get_queryset(self):
         role = get_user_role(getattr(self.request, "user", None))
-        if role in {Profile.Role.ADMIN, Profile.Role.EMPLOYEE}:
-            return Order.objects.all()
-        return Order.objects.filter(user=self.request.user)
+        queryset = Order.objects.all()
+        if role not in {Profile.Role.ADMIN, Profile.Role.EMPLOYEE}:
+            queryset = queryset.filter(user=self.request.user)
+        return self.apply_query_plan(queryset)
 
     def get_serializer_class(self):
         """Use appropriate serializer for different actions."""
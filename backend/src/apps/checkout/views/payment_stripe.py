@@ -1,12 +1,14 @@
 from rest_framework import status
 from rest_framework.views import APIView
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
-from django.shortcuts import get_object_or_404
 from django.conf import settings
+from django.core.cache import cache
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from drf_spectacular.utils import extend_schema, extend_schema_serializer
-import stripe
 import logging
+from datetime import timedelta
 
 from apps.checkout.models import Cart, Payment, Order
 from apps.checkout.serializers import (
@@ -15,11 +17,25 @@ from apps.checkout.serializers import (
     CheckoutSessionResponseSerializer,
     PaymentConfirmationResponseSerializer,
 )
+from apps.checkout.services.checkout_preflight_service import (
+    CheckoutPreflightService,
+)
+from apps.checkout.services.order_finalization_service import (
+    OrderFinalizationService,
+)
+from apps.checkout.services.payment_gateway import (
+    PaymentGateway,
+    PaymentGatewayError,
+    WebhookVerificationError,
+    get_payment_gateway,
+)
+from apps.checkout.services.stock_reservation_service import (
+    StockReservationService,
+)
+from apps.checkout.tasks import finalize_paid_order, reconcile_payment_intent
 
 logger = logging.getLogger(__name__)
 
-stripe.api_key = settings.STRIPE_SECRET_KEY
-
 
 class CreateCheckoutSessionView(APIView):
     """Create a Stripe Checkout session for a cart."""
@@ -46,15 +62,11 @@ class CreateCheckoutSessionView(APIView):
         serializer.is_valid(raise_exception=True)
         data = serializer.validated_data
         currency = data["currency"]
+        cart = None
 
         try:
             cart = Cart.get_or_create_active_cart(request.user)
 
-            if cart.is_empty():
-                return Response(
-                    {"error": "Cart is empty"}, status=status.HTTP_400_BAD_REQUEST
-                )
-
             cart = serializer.set_shipping_on_cart(cart)
 
             if not cart.shipping_address:
@@ -69,16 +81,23 @@ class CreateCheckoutSessionView(APIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            unavailable_items = []
-            for item in cart.items.all():
-                if not item.stock_available:
-                    unavailable_items.append({
-                        "product_id": item.product.id,
-                        "product_name": item.product.name,
-                        "requested_quantity": item.quantity,
-                        "available_stock": item.product.stock_quantity,
-                    })
-            
+            preflight = CheckoutPreflightService.run(cart)
+
+            if preflight.is_empty:
+                return Response(
+                    {"error": "Cart is empty"}, status=status.HTTP_400_BAD_REQUEST
+                )
+
+            if not preflight.is_available:
+                return Response(
+                    {
+                        "error": "Some items are no longer available in the requested quantity",
+                        "unavailable_items": preflight.unavailable_items,
+                    },
+                    status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                )
+
+            unavailable_items = StockReservationService.reserve(cart)
             if unavailable_items:
                 return Response(
                     {
@@ -88,31 +107,36 @@ class CreateCheckoutSessionView(APIView):
                     status=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 )
 
-            payment_intent = stripe.PaymentIntent.create(
-                amount=int(cart.total * 100),
+            amount_cents = preflight.amount_cents
+            item_count = preflight.item_count
+            metadata = {
+                "cart_id": cart.id,
+                "user_id": request.user.id,
+                "item_count": item_count,
+                "customer_email": request.user.email if request.user.email else "",
+            }
+            payment_intent = get_payment_gateway().create_payment_intent(
+                amount_cents=amount_cents,
                 currency=currency,
-                automatic_payment_methods={
-                    "enabled": True,
-                },
-                metadata={
-                    "cart_id": cart.id,
-                    "user_id": request.user.id,
-                    "item_count": cart.item_count,
-                    "customer_email": request.user.email if request.user.email else "",
-                },
+                metadata=metadata,
+                idempotency_key=PaymentGateway.idempotency_key_for_cart(
+                    cart.id, amount_cents, currency, metadata
+                ),
             )
 
-            payment = Payment.objects.create(
-                user=request.user,
-                amount=cart.total,
-                status=Payment.PaymentStatus.PENDING,
+            payment, _ = Payment.objects.get_or_create(
                 stripe_payment_intent_id=payment_intent.id,
-                description=f"Payment for cart {cart.id}",
-                metadata={
-                    "cart_id": cart.id,
-                    "payment_intent_id": payment_intent.id,
-                    "item_count": cart.item_count,
-                    "currency": currency,
+                defaults={
+                    "user": request.user,
+                    "amount": preflight.total,
+                    "status": Payment.PaymentStatus.PENDING,
+                    "description": f"Payment for cart {cart.id}",
+                    "metadata": {
+                        "cart_id": cart.id,
+                        "payment_intent_id": payment_intent.id,
+                        "item_count": item_count,
+                        "currency": currency,
+                    },
                 },
             )
 
@@ -126,8 +150,16 @@ class CreateCheckoutSessionView(APIView):
             serializer = CheckoutSessionResponseSerializer(response_data)
             return Response(serializer.data)
 
+        except PaymentGatewayError:
+            StockReservationService.release(cart.id)
+            return Response(
+                {"error": "Payment provider is unavailable, please try again"},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
         except Exception as e:
             logger.error(f"Error creating checkout session: {str(e)}")
+            if cart is not None:
+                StockReservationService.release(cart.id)
             return Response(
                 {"error": "Failed to create checkout session"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -135,7 +167,11 @@ class CreateCheckoutSessionView(APIView):
 
 
 class ConfirmPaymentIntentView(APIView):
-    """Confirm PaymentIntent and create order after successful PaymentSheet payment."""
+    """Report whether the order for a PaymentIntent has been created.
+
+    Orders are finalized by the Stripe webhook; this endpoint only reads local
+    state so clients can poll it cheaply after PaymentSheet completes.
+    """
     
     permission_classes = [IsAuthenticated]
 
@@ -149,8 +185,9 @@ class ConfirmPaymentIntentView(APIView):
         request=ConfirmPaymentSerializer,
         responses={
             200: PaymentConfirmationResponseSerializer,
+            202: PaymentConfirmationResponseSerializer,
             400: {"type": "object", "properties": {"error": {"type": "string"}}},
-            500: {"type": "object", "properties": {"error": {"type": "string"}}},
+            404: {"type": "object", "properties": {"error": {"type": "string"}}},
         },
         tags=["checkout"],
     )
@@ -160,73 +197,85 @@ class ConfirmPaymentIntentView(APIView):
 
         payment_intent_id = serializer.validated_data["session_id"]
 
-        try:
-            payment_intent = stripe.PaymentIntent.retrieve(payment_intent_id)
-
-            if payment_intent.metadata.get("user_id") != str(request.user.id):
-                return Response(
-                    {"error": "Invalid PaymentIntent for this user"},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
+        payment = get_object_or_404(
+            Payment.objects.filter(
+                stripe_payment_intent_id=payment_intent_id, user=request.user
+            )
+        )
 
-            payment = get_object_or_404(
-                Payment.objects.filter(
-                    stripe_payment_intent_id=payment_intent_id, user=request.user
-                )
+        if payment.status in (
+            Payment.PaymentStatus.FAILED,
+            Payment.PaymentStatus.CANCELED,
+        ):
+            return Response(
+                {"error": f"Payment status is {payment.status}"},
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
-            if payment_intent.status == "succeeded":
-                payment.status = Payment.PaymentStatus.COMPLETED
-                payment.save()
-
-                cart_id = payment_intent.metadata.get("cart_id")
-                if cart_id:
-                    cart = get_object_or_404(
-                        Cart.objects.filter(id=cart_id, user=request.user)
-                    )
-
-                    order = Order.create_from_cart(cart, payment)
-                    logger.info(
-                        f"Successfully created order {order.order_number} from cart {cart.id}"
-                    )
-                    order_items_count = order.items.count()
-                    cart_items_count = cart.items.count()
-                    logger.info(
-                        f"Order {order.order_number}: {order_items_count} items created from {cart_items_count} cart items"
-                    )
-
-                    cart.status = Cart.CartStatus.CONVERTED
-                    cart.save()
-                    cart.clear()
-                    logger.info(f"Successfully cleared cart {cart.id}")
-
-                logger.info(
-                    f"PaymentIntent {payment_intent_id} confirmed and order {order.order_number} created for user {request.user.id}"
-                )
+        order = (
+            Order.objects.filter(payment=payment).only("id", "order_number").first()
+        )
+        response_data = {
+            "success": order is not None,
+            "status": "completed" if order else "processing",
+            "payment_id": payment.id,
+            "order_number": order.order_number if order else None,
+            "message": (
+                "Payment confirmed and order created successfully"
+                if order
+                else "Payment is being processed"
+            ),
+            "amount_paid": payment.amount,
+            "currency": payment.metadata.get("currency", ""),
+        }
+
+        if order is None:
+            self._schedule_reconciliation(payment)
+
+        serializer = PaymentConfirmationResponseSerializer(response_data)
+        return Response(
+            serializer.data,
+            status=status.HTTP_200_OK if order else status.HTTP_202_ACCEPTED,
+        )
 
-                response_data = {
-                    "success": True,
-                    "payment_id": payment.id,
-                    "order_number": order.order_number,
-                    "message": "Payment confirmed and order created successfully",
-                    "amount_paid": payment_intent.amount / 100,
-                    "currency": payment_intent.currency,
-                }
-                serializer = PaymentConfirmationResponseSerializer(response_data)
-                return Response(serializer.data)
-
-            else:
-                payment.status = Payment.PaymentStatus.FAILED
-                payment.save()
+    @staticmethod
+    def _schedule_reconciliation(payment: Payment) -> None:
+        """Ask the provider directly if the webhook is overdue (once per window)."""
+        grace = timedelta(seconds=settings.PAYMENT_WEBHOOK_GRACE_SECONDS)
+        if timezone.now() - payment.created_at < grace:
+            return
+        lock_key = f"payment-reconcile:{payment.stripe_payment_intent_id}"
+        if cache.add(lock_key, True, timeout=settings.PAYMENT_WEBHOOK_GRACE_SECONDS):
+            reconcile_payment_intent.delay(payment.stripe_payment_intent_id)
 
-                return Response(
-                    {"error": f"Payment status is {payment_intent.status}"},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
 
-        except Exception as e:
-            logger.error(f"Error confirming PaymentIntent: {str(e)}")
+class StripeWebhookView(APIView):
+    """Receive signed Stripe events and queue order finalization."""
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    throttle_classes = []
+
+    @extend_schema(exclude=True)
+    def post(self, request):
+        signature = request.META.get("HTTP_STRIPE_SIGNATURE", "")
+        try:
+            event = get_payment_gateway().parse_webhook_event(request.body, signature)
+        except WebhookVerificationError as e:
+            logger.warning(f"Rejected Stripe webhook: {str(e)}")
             return Response(
-                {"error": "Failed to confirm PaymentIntent"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                {"error": "Invalid webhook"}, status=status.HTTP_400_BAD_REQUEST
             )
+
+        payment_intent = event.payment_intent
+        if payment_intent is not None:
+            if event.type == "payment_intent.succeeded":
+                finalize_paid_order.delay(payment_intent.id)
+            elif event.type == "payment_intent.canceled":
+                OrderFinalizationService.mark_canceled(payment_intent.id)
+            # payment_intent.payment_failed is not terminal: the customer can
+            # retry on the same intent, so the payment stays pending and keeps
+            # its stock holds until they expire or the intent is canceled.
+
+        logger.info(f"Processed Stripe webhook {event.id} ({event.type})")
+        return Response({"received": True})
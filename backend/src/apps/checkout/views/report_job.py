@@ -0,0 +1,57 @@
+from apps.common.models import BaseViewSet
+from rest_framework import status
+from rest_framework.filters import OrderingFilter
+from rest_framework.response import Response
+from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.utils import extend_schema
+
+from apps.checkout.models import ReportJob
+from apps.checkout.serializers import ReportJobCreateSerializer, ReportJobSerializer
+from apps.checkout.services.report_service import ReportJobService
+from apps.profile.models import Profile
+from apps.profile.permissions import RolesAllowed
+
+
+class ReportJobViewSet(BaseViewSet):
+    """
+    Background report exports.
+
+    POST queues a job (or returns a recent identical one); clients poll the
+    job until ``status`` is ``ready`` and then fetch ``download_url``.
+    """
+
+    queryset = ReportJob.objects.all()
+    serializer_class = ReportJobSerializer
+    http_method_names = ["get", "post", "head", "options"]
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_fields = ["id", "status", "report_type", "file_format", "requested_by"]
+    ordering_fields = ["id", "created_at", "finished_at", "status"]
+    ordering = ["-created_at"]
+
+    def get_permissions(self):
+        return [RolesAllowed({Profile.Role.ADMIN, Profile.Role.EMPLOYEE})]
+
+    @extend_schema(
+        summary="Request a report",
+        description=(
+            "Queue an orders export or sales summary as CSV, XLSX or Parquet. "
+            "Returns 201 with a new job, or 200 with a recent identical job "
+            "whose artifact is reused."
+        ),
+        request=ReportJobCreateSerializer,
+        responses={200: ReportJobSerializer, 201: ReportJobSerializer},
+    )
+    def create(self, request, *args, **kwargs):
+        serializer = ReportJobCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        job, created = ReportJobService.request(
+            request.user,
+            data["report_type"],
+            data["file_format"],
+            {"period": data["period"]},
+        )
+        return Response(
+            ReportJobSerializer(job).data,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
@@ -1,32 +1,56 @@
+from apps.common.filters import SearchDocumentFilter
 from apps.common.models import BaseViewSet
-from rest_framework.filters import SearchFilter, OrderingFilter
+from apps.common.querysets import QueryPlan, QueryPlanMixin
+from rest_framework.decorators import action
+from rest_framework.filters import OrderingFilter
+from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.utils import extend_schema
 
 from apps.checkout.models import Shipment
+from apps.checkout.services.shipment_status_service import (
+    ShipmentStatusEvent,
+    ShipmentStatusService,
+)
 from apps.profile.models import Profile
 from apps.profile.permissions import ReadOnlyOrRoles, get_user_role
-from apps.checkout.serializers import ShipmentSerializer
+from apps.checkout.serializers import (
+    ShipmentSerializer,
+    ShipmentStatusBatchSerializer,
+    ShipmentStatusBatchResponseSerializer,
+)
 
 
-class ShipmentViewSet(BaseViewSet):
-    queryset = Shipment.objects.select_related(
-        "order", "order__shipping_method", "order__shipping_method__courier"
-    )
-    serializer_class = ShipmentSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ["id"]
-
-    search_fields = [
-        "order__order_number",
+SHIPMENT_ROW_PLAN = QueryPlan(
+    select_related=(
+        "order__user",
+        "order__shipping_method__courier",
+    ),
+    only=(
+        "id",
+        "shipped_at",
+        "delivered_at",
         "shipping_address",
-        "order__id",
+        "created_at",
+        "updated_at",
+        "order__order_number",
         "order__status",
-        "order__total",
         "order__user__email",
-        "order__user__username",
         "order__shipping_method__name",
         "order__shipping_method__courier__name",
-    ]
+    ),
+)
+
+
+class ShipmentViewSet(QueryPlanMixin, BaseViewSet):
+    queryset = Shipment.objects.all()
+    serializer_class = ShipmentSerializer
+    filter_backends = [DjangoFilterBackend, SearchDocumentFilter, OrderingFilter]
+    filterset_fields = ["id"]
+
+    search_document_field = "order__search_document"
+    search_prefix_fields = {"ORD-": "order__order_number"}
+    search_exact_fields = ("order__status",)
     filterset_fields = ["id"]
     ordering_fields = [
         "id",
@@ -46,12 +70,31 @@ class ShipmentViewSet(BaseViewSet):
         "order__shipping_method__courier__name",
     ]
     ordering = ["-created_at"]
+    query_plans = {"list": SHIPMENT_ROW_PLAN, "retrieve": SHIPMENT_ROW_PLAN}
 
     def get_permissions(self):
         return [ReadOnlyOrRoles({Profile.Role.EMPLOYEE, Profile.Role.ADMIN})]
 
     def get_queryset(self):
         role = get_user_role(getattr(self.request, "user", None))
-        if role in {Profile.Role.ADMIN, Profile.Role.EMPLOYEE}:
-            return self.queryset
-        return self.queryset.filter(order__user=self.request.user)
+        queryset = self.queryset
+        if role not in {Profile.Role.ADMIN, Profile.Role.EMPLOYEE}:
+            queryset = queryset.filter(order__user=self.request.user)
+        return self.apply_query_plan(queryset)
+
+    @extend_schema(
+        request=ShipmentStatusBatchSerializer,
+        responses={200: ShipmentStatusBatchResponseSerializer},
+        description="Ingest a batch of courier scan events (shipped/delivered).",
+    )
+    @action(detail=False, methods=["post"], url_path="status-events")
+    def status_events(self, request):
+        serializer = ShipmentStatusBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        events = [
+            ShipmentStatusEvent(**event)
+            for event in serializer.validated_data["events"]
+        ]
+        result = ShipmentStatusService.apply_events(events)
+        return Response(ShipmentStatusBatchResponseSerializer(result).data)
@@ -1,4 +1,5 @@
-from apps.common.models import BaseViewSet
+from apps.common.models import BaseViewSet, InMemoryListMixin
+from apps.common.services.reference_data import ReferenceData
 from rest_framework.filters import SearchFilter, OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
 
@@ -9,7 +10,7 @@ from apps.checkout.models import ShippingMethod
 from apps.checkout.serializers import ShippingMethodSerializer
 
 
-class ShippingMethodViewSet(BaseViewSet):
+class ShippingMethodViewSet(InMemoryListMixin, BaseViewSet):
     serializer_class = ShippingMethodSerializer
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ["id"]
@@ -40,3 +41,6 @@ class ShippingMethodViewSet(BaseViewSet):
 
     def get_permissions(self):
         return [ReadOnlyOrRoles({Profile.Role.ADMIN})]
+
+    def get_list_rows(self):
+        return ReferenceData.get().shipping_methods
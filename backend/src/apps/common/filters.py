@@ -0,0 +1,53 @@
+from django.db.models import Q
+from rest_framework.filters import SearchFilter
+
+
+class SearchDocumentFilter(SearchFilter):
+    """
+    ``?search=`` over a denormalized, trigram-indexed text column.
+
+    Views set ``search_document_field`` to the lowercased document column
+    (possibly across one relation, e.g. ``order__search_document``). Each
+    search term must appear in it as a substring, which Postgres answers from
+    a ``gin_trgm_ops`` index instead of ``icontains`` across joined tables.
+
+    Optional view attributes:
+
+    - ``search_prefix_fields``: maps an uppercase identifier prefix (``ORD-``)
+      to a unique field; terms starting with it become a ``startswith``
+      lookup served by that field's btree pattern index.
+    - ``search_exact_fields``: fields also matched by equality with the
+      lowercased term, for short values kept out of the document (status).
+
+    Views without ``search_document_field`` keep DRF's ``search_fields``
+    behaviour.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        document_field = getattr(view, "search_document_field", None)
+        terms = self.get_search_terms(request)
+        if not document_field or not terms:
+            return super().filter_queryset(request, queryset, view)
+
+        prefix_fields = getattr(view, "search_prefix_fields", {})
+        exact_fields = getattr(view, "search_exact_fields", ())
+        for term in terms:
+            identifier = term.upper()
+            prefix_field = next(
+                (
+                    field
+                    for prefix, field in prefix_fields.items()
+                    if identifier.startswith(prefix)
+                ),
+                None,
+            )
+            if prefix_field:
+                queryset = queryset.filter(**{f"{prefix_field}__startswith": identifier})
+                continue
+
+            lowered = term.lower()
+            condition = Q(**{f"{document_field}__contains": lowered})
+            for field in exact_fields:
+                condition |= Q(**{field: lowered})
+            queryset = queryset.filter(condition)
+        return queryset
@@ -1,3 +1,5 @@
+from abc import ABC, abstractmethod
+
 from django.db import models
 from rest_framework import viewsets
 from rest_framework.response import Response
@@ -62,3 +64,35 @@ class BaseViewSet(viewsets.ModelViewSet):
                 {"detail": f"Cannot delete this item because it's being used by other items. {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+class InMemoryListMixin(ABC):
+    """
+    Serve plain ``list`` requests from rows already held in memory.
+
+    Requests with no parameters other than pagination are answered from
+    ``get_list_rows()``; searching, filtering or ordering goes through the
+    queryset.
+    """
+
+    @abstractmethod
+    def get_list_rows(self):
+        """Rows for an unfiltered list, in the view's default ordering."""
+
+    def list(self, request, *args, **kwargs):
+        paginator = self.paginator
+        pagination_params = (
+            {paginator.page_query_param, paginator.page_size_query_param}
+            if paginator is not None
+            else set()
+        )
+        if set(request.query_params) - pagination_params:
+            return super().list(request, *args, **kwargs)
+
+        rows = self.get_list_rows()
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer(rows, many=True)
+        return Response(serializer.data)
@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+
+from django.db.models import QuerySet
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """Relations to join/prefetch and columns to load for one view action."""
+
+    select_related: tuple[str, ...] = ()
+    prefetch_related: tuple[str, ...] = ()
+    only: tuple[str, ...] = ()
+    defer: tuple[str, ...] = ()
+
+    def apply(self, queryset: QuerySet) -> QuerySet:
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        if self.only:
+            queryset = queryset.only(*self.only)
+        if self.defer:
+            queryset = queryset.defer(*self.defer)
+        return queryset
+
+
+class QueryPlanMixin:
+    """
+    Shape a ViewSet's queryset per action from ``query_plans``.
+
+    Back-office tables search and sort across related columns; declaring the
+    joins and loaded columns next to the serializer choice keeps list
+    endpoints from lazy-loading relations row by row. Call
+    ``self.apply_query_plan(queryset)`` at the end of ``get_queryset``.
+    """
+
+    query_plans: dict[str, QueryPlan] = {}
+
+    def apply_query_plan(self, queryset: QuerySet) -> QuerySet:
+        plan = self.query_plans.get(getattr(self, "action", None))
+        return plan.apply(queryset) if plan else queryset
@@ -0,0 +1,123 @@
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+
+if TYPE_CHECKING:
+    from apps.checkout.models import Courier, ShippingMethod
+    from apps.geographic.models import Country
+
+logger = logging.getLogger(__name__)
+
+REFERENCE_DATA_VERSION_KEY = "reference_data:version"
+
+
+class ReferenceDataVersion:
+    """
+    Shared stamp that changes whenever countries, couriers or shipping
+    methods change; see CatalogVersion for how the stamp is used.
+    """
+
+    @staticmethod
+    def current() -> int:
+        version = cache.get(REFERENCE_DATA_VERSION_KEY)
+        if version is None:
+            cache.add(REFERENCE_DATA_VERSION_KEY, time.time_ns(), timeout=None)
+            version = cache.get(REFERENCE_DATA_VERSION_KEY)
+        return version
+
+    @staticmethod
+    def bump() -> None:
+        try:
+            cache.incr(REFERENCE_DATA_VERSION_KEY)
+        except ValueError:
+            cache.add(REFERENCE_DATA_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+class ReferenceData:
+    """
+    Per-process copy of the small, rarely edited reference tables.
+
+    Countries, couriers and shipping methods are read in three queries and
+    kept until ReferenceDataVersion changes (admin edits bump it) or
+    ``REFERENCE_DATA_MAX_AGE_SECONDS`` passes. The model instances are
+    shared between requests and must be treated as read-only.
+
+    Models are looked up through the app registry so that lower-level apps
+    (geographic) can use the registry without depending on checkout.
+    """
+
+    _lock = threading.Lock()
+    _current: "ReferenceData | None" = None
+
+    def __init__(
+        self,
+        version: int,
+        countries: tuple["Country", ...],
+        couriers: tuple["Courier", ...],
+        shipping_methods: tuple["ShippingMethod", ...],
+    ):
+        self.version = version
+        self.built_at = time.monotonic()
+        # Each tuple is in its list endpoint's default order (by name).
+        self.countries = countries
+        self.couriers = couriers
+        self.shipping_methods = shipping_methods
+        self._countries = {country.pk: country for country in countries}
+        self._countries_by_code = {
+            country.code.upper(): country for country in countries
+        }
+        self._couriers = {courier.pk: courier for courier in couriers}
+        self._shipping_methods = {method.pk: method for method in shipping_methods}
+
+    @classmethod
+    def get(cls) -> "ReferenceData":
+        """The current process-wide registry, reloaded if the data changed."""
+        version = ReferenceDataVersion.current()
+        registry = cls._current
+        if registry is None or not registry._fresh(version):
+            with cls._lock:
+                registry = cls._current
+                if registry is None or not registry._fresh(version):
+                    registry = cls._current = cls.load(version)
+        return registry
+
+    def _fresh(self, version: int) -> bool:
+        return (
+            self.version == version
+            and time.monotonic() - self.built_at
+            < settings.REFERENCE_DATA_MAX_AGE_SECONDS
+        )
+
+    @classmethod
+    def load(cls, version: int) -> "ReferenceData":
+        Country = apps.get_model("geographic", "Country")
+        Courier = apps.get_model("checkout", "Courier")
+        ShippingMethod = apps.get_model("checkout", "ShippingMethod")
+        couriers = tuple(Courier.objects.order_by("name", "id"))
+        couriers_by_id = {courier.pk: courier for courier in couriers}
+        shipping_methods = tuple(ShippingMethod.objects.order_by("name", "id"))
+        for method in shipping_methods:
+            method.courier = couriers_by_id[method.courier_id]
+        countries = tuple(Country.objects.order_by("name", "id"))
+        logger.info(
+            f"Loaded reference data: {len(countries)} countries, "
+            f"{len(couriers)} couriers, {len(shipping_methods)} shipping methods"
+        )
+        return cls(version, countries, couriers, shipping_methods)
+
+    def country(self, country_id: int) -> "Country | None":
+        return self._countries.get(country_id)
+
+    def country_by_code(self, code: str) -> "Country | None":
+        return self._countries_by_code.get(code.strip().upper())
+
+    def courier(self, courier_id: int) -> "Courier | None":
+        return self._couriers.get(courier_id)
+
+    def shipping_method(self, shipping_method_id: int) -> "ShippingMethod | None":
+        return self._shipping_methods.get(shipping_method_id)
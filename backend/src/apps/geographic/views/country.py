@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 
-from apps.common.models import BaseViewSet
+from apps.common.models import BaseViewSet, InMemoryListMixin
+from apps.common.services.reference_data import ReferenceData
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.filters import OrderingFilter, SearchFilter
 from django_filters.rest_framework import DjangoFilterBackend
@@ -23,7 +24,7 @@ if TYPE_CHECKING:
 @extend_schema(
     parameters=[OpenApiParameter(name="id", type=int, location=OpenApiParameter.PATH)]
 )
-class CountryViewSet(BaseViewSet):
+class CountryViewSet(InMemoryListMixin, BaseViewSet):
     queryset = Country.objects.all()
     serializer_class = CountrySerializer
     search_fields = ["code", "name", "currency_code", "currency_name"]
@@ -52,5 +53,8 @@ class CountryViewSet(BaseViewSet):
         }
         return serializer_map.get(self.action, CountrySerializer)
 
+    def get_list_rows(self):
+        return ReferenceData.get().countries
+
     def get_permissions(self):
         return [ReadOnlyOrRoles({Profile.Role.ADMIN})]
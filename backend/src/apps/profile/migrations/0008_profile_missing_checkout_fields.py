@@ -0,0 +1,59 @@
+from django.db import migrations, models
+
+import apps.profile.models.profile
+
+
+def backfill_checkout_readiness(apps, schema_editor):
+    Profile = apps.get_model("profile", "Profile")
+    Address = apps.get_model("profile", "Address")
+
+    default_addresses = {
+        address.profile_id: address
+        for address in Address.objects.filter(is_default=True).order_by("created_at")
+    }
+
+    for profile in Profile.objects.all().iterator():
+        missing_fields = []
+        if not (profile.first_name or "").strip():
+            missing_fields.append("First Name")
+        if not (profile.last_name or "").strip():
+            missing_fields.append("Last Name")
+        if not (profile.phone_number or "").strip():
+            missing_fields.append("Phone Number")
+
+        address = default_addresses.get(profile.pk)
+        if address is None:
+            missing_fields.append("Default Address")
+        elif not all(
+            [
+                (address.address or "").strip(),
+                (address.city or "").strip(),
+                (address.postal_code or "").strip(),
+                address.country_id,
+            ]
+        ):
+            missing_fields.append("Complete Default Address")
+
+        Profile.objects.filter(pk=profile.pk).update(
+            missing_checkout_fields=missing_fields,
+            profile_completed=not missing_fields,
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("profile", "0007_delete_roleassignment"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="profile",
+            name="missing_checkout_fields",
+            field=models.JSONField(
+                default=apps.profile.models.profile.default_missing_checkout_fields,
+                editable=False,
+                help_text="Fields still required for checkout, kept in sync with profile_completed",
+            ),
+        ),
+        migrations.RunPython(backfill_checkout_readiness, migrations.RunPython.noop),
+    ]
@@ -5,6 +5,11 @@ from django.forms import ValidationError
 from apps.common.models import TimestampedModel
 
 
+def default_missing_checkout_fields() -> list[str]:
+    """Readiness of a freshly created, empty profile."""
+    return ["First Name", "Last Name", "Phone Number", "Default Address"]
+
+
 class Profile(TimestampedModel):
     """Extended user profile with personal information."""
 
@@ -41,6 +46,11 @@ class Profile(TimestampedModel):
         default=False,
         help_text="Whether profile has all required information for checkout",
     )
+    missing_checkout_fields: models.JSONField = models.JSONField(
+        default=default_missing_checkout_fields,
+        editable=False,
+        help_text="Fields still required for checkout, kept in sync with profile_completed",
+    )
 
     class Meta:
         verbose_name = "User Profile"
@@ -94,24 +104,16 @@ class Profile(TimestampedModel):
 
     def is_checkout_ready(self) -> bool:
         """Check if profile has all required information for checkout."""
-        personal_info_complete = all(
-            [
-                self.first_name.strip() if self.first_name else False,
-                self.last_name.strip() if self.last_name else False,
-                self.phone_number.strip() if self.phone_number else False,
-            ]
-        )
-
-        default_address = self.get_default_address()
-
-        return (
-            personal_info_complete
-            and default_address is not None
-            and default_address.is_complete()
-        )
+        return self.profile_completed
 
     def get_missing_checkout_fields(self) -> list[str]:
         """Get list of fields required to complete checkout."""
+        return list(self.missing_checkout_fields)
+
+    def compute_missing_checkout_fields(self) -> list[str]:
+        """Evaluate checkout requirements against the profile and its default address."""
+        from apps.profile.models import Address
+
         missing_fields: list[str] = []
 
         if not (self.first_name and self.first_name.strip()):
@@ -121,7 +123,11 @@ class Profile(TimestampedModel):
         if not (self.phone_number and self.phone_number.strip()):
             missing_fields.append("Phone Number")
 
-        default_address = self.get_default_address()
+        default_address = (
+            Address.objects.filter(profile=self, is_default=True)
+            .select_related("country")
+            .first()
+        )
         if not default_address:
             missing_fields.append("Default Address")
         elif not default_address.is_complete():
@@ -130,12 +136,20 @@ class Profile(TimestampedModel):
         return missing_fields
 
     def update_completion_status(self) -> None:
-        current_status = self.profile_completed
-        new_status = self.is_checkout_ready()
-
-        if current_status != new_status:
-            self.profile_completed = new_status
-            self.save(update_fields=["profile_completed", "updated_at"])
+        """Recompute and store checkout readiness; runs on profile and address saves."""
+        missing_fields = self.compute_missing_checkout_fields()
+        completed = not missing_fields
+
+        if (
+            completed != self.profile_completed
+            or missing_fields != self.missing_checkout_fields
+        ):
+            self.profile_completed = completed
+            self.missing_checkout_fields = missing_fields
+            Profile.objects.filter(pk=self.pk).update(
+                profile_completed=completed,
+                missing_checkout_fields=missing_fields,
+            )
 
     def clean(self) -> None:
         super().clean()
@@ -85,8 +85,6 @@ class ProfileSerializer(serializers.ModelSerializer):
 
         instance.save()
 
-        instance.update_completion_status()
-
         return instance
 
 
@@ -165,6 +163,5 @@ class ProfileUpdateSerializer(serializers.ModelSerializer):
             setattr(instance, attr, value)
 
         instance.save()
-        instance.update_completion_status()
 
         return instance
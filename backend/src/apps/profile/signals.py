@@ -1,8 +1,8 @@
 from django.conf import settings
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from apps.profile.models import Profile
+from apps.profile.models import Address, Profile
 from apps.catalog.models.notification import NotificationPreference
 
 
@@ -16,3 +16,25 @@ def create_user_profile(sender, instance, created: bool, **kwargs) -> None:
             stock_alerts_enabled=False,
             price_drop_alerts_enabled=False,
         )
+
+
+@receiver(post_save, sender=Profile)
+def refresh_checkout_readiness_on_profile_save(
+    sender, instance: Profile, raw: bool = False, **kwargs
+) -> None:
+    """Keep the stored checkout readiness in step with personal details."""
+    if not raw:
+        instance.update_completion_status()
+
+
+@receiver(post_save, sender=Address)
+@receiver(post_delete, sender=Address)
+def refresh_checkout_readiness_on_address_change(
+    sender, instance: Address, raw: bool = False, **kwargs
+) -> None:
+    """Default address changes affect readiness of the owning profile."""
+    if raw:
+        return
+    profile = Profile.objects.filter(pk=instance.profile_id).first()
+    if profile:
+        profile.update_completion_status()
@@ -109,8 +109,7 @@ class ProfileViewSet(BaseViewSet):
             serializer.save()
 
     def perform_update(self, serializer: ProfileUpdateSerializer) -> None:
-        profile = serializer.save()
-        profile.update_completion_status()
+        serializer.save()
 
     @action(detail=False, methods=["get", "patch"], url_path="me")
     def me(self, request: Request) -> Response:
@@ -0,0 +1,191 @@
+from decimal import Decimal
+from itertools import count
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from apps.catalog.models import Category, Manufacturer, Product, ProductImage
+from apps.catalog.services.catalog_snapshot import CatalogSnapshot
+from apps.checkout.models import (
+    Cart,
+    CartItem,
+    Courier,
+    Order,
+    OrderItem,
+    ShippingMethod,
+)
+from apps.checkout.services.payment_gateway import (
+    FakePaymentGateway,
+    get_payment_gateway,
+)
+from apps.common.services.reference_data import ReferenceData
+from apps.geographic.models import Country
+from apps.profile.models import Address, Profile
+
+User = get_user_model()
+
+# Query budgets are checked against both sizes: an endpoint whose query count
+# grows with the number of rows fails on the larger one.
+DATASET_SIZES = [2, 25]
+
+_sequence = count(1)
+
+
+@pytest.fixture(autouse=True)
+def isolated_process_state(settings):
+    """Drop per-process snapshots and cached stamps left by earlier tests."""
+    settings.PAYMENT_GATEWAY = (
+        "apps.checkout.services.payment_gateway.FakePaymentGateway"
+    )
+    cache.clear()
+    CatalogSnapshot._current = None
+    ReferenceData._current = None
+    get_payment_gateway.cache_clear()
+    FakePaymentGateway.reset()
+    yield
+    get_payment_gateway.cache_clear()
+
+
+@pytest.fixture
+def make_user(db):
+    def make_user(role: int | None = None) -> User:
+        number = next(_sequence)
+        user = User.objects.create_user(
+            username=f"user{number}", email=f"user{number}@example.com"
+        )
+        if role is not None:
+            Profile.objects.filter(user=user).update(role=role)
+        # Fresh instance: requests load the profile themselves, as in production.
+        return User.objects.get(pk=user.pk)
+
+    return make_user
+
+
+@pytest.fixture
+def customer(make_user) -> User:
+    return make_user()
+
+
+@pytest.fixture
+def employee(make_user) -> User:
+    return make_user(Profile.Role.EMPLOYEE)
+
+
+@pytest.fixture
+def api_client():
+    def api_client(user: User) -> APIClient:
+        client = APIClient()
+        client.force_authenticate(user)
+        return client
+
+    return api_client
+
+
+@pytest.fixture
+def make_products(db):
+    """Visible products spread over a few categories and manufacturers."""
+
+    def make_products(size: int) -> list[Product]:
+        categories = [
+            Category.objects.create(name=f"Category {i}", slug=f"category-{i}")
+            for i in range(3)
+        ]
+        manufacturers = [
+            Manufacturer.objects.create(name=f"Maker {i}", slug=f"maker-{i}")
+            for i in range(3)
+        ]
+        products = []
+        for i in range(size):
+            product = Product.objects.create(
+                name=f"Product {i}",
+                slug=f"product-{i}",
+                description="Description",
+                price=Decimal("10.00") + i,
+                original_price=Decimal("10.00") + i,
+                sku=f"SKU-{i}",
+                stock_quantity=100,
+                category=categories[i % len(categories)],
+                manufacturer=manufacturers[i % len(manufacturers)],
+                is_visible=True,
+            )
+            ProductImage.objects.create(
+                product=product, image=f"product-{i}.jpg", is_primary=True
+            )
+            products.append(product)
+        return products
+
+    return make_products
+
+
+@pytest.fixture
+def shipping(db):
+    """A country, courier and shipping method for addresses and carts."""
+    country = Country.objects.create(code="PL", name="Poland")
+    courier = Courier.objects.create(name="Courier")
+    method = ShippingMethod.objects.create(
+        name="Standard", price=Decimal("10.00"), courier=courier
+    )
+    return country, method
+
+
+@pytest.fixture
+def make_address(shipping):
+    def make_address(user: User) -> Address:
+        country, _ = shipping
+        return Address.objects.create(
+            profile=Profile.objects.get(user=user),
+            address="Main 1",
+            city="Warsaw",
+            postal_code="00-001",
+            country=country,
+        )
+
+    return make_address
+
+
+@pytest.fixture
+def make_cart(shipping, make_address):
+    """An active cart with two units of each product and shipping set."""
+
+    def make_cart(user: User, products: list[Product]) -> Cart:
+        cart = Cart.get_or_create_active_cart(user)
+        for product in products:
+            CartItem.objects.create(
+                cart=cart, product=product, quantity=2, unit_price=product.price
+            )
+        cart.shipping_address = make_address(user)
+        cart.shipping_method = shipping[1]
+        cart.save()
+        return cart
+
+    return make_cart
+
+
+@pytest.fixture
+def make_order(shipping, make_address):
+    """A confirmed order with one line per product."""
+
+    def make_order(user: User, products: list[Product]) -> Order:
+        order = Order.objects.create(
+            user=user,
+            subtotal=Decimal("0.00"),
+            total=Decimal("0.00"),
+            shipping_address=make_address(user),
+            shipping_method=shipping[1],
+            status=Order.OrderStatus.CONFIRMED,
+        )
+        for product in products:
+            OrderItem.objects.create(
+                order=order,
+                product=product,
+                product_name=product.name,
+                product_sku=product.sku,
+                quantity=1,
+                unit_price=product.price,
+                total_price=product.price,
+            )
+        return order
+
+    return make_order
@@ -0,0 +1,60 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+REPLICA_DB_ALIAS = "replica"
+
+# Authentication and session lookups must see rows written a moment ago
+# (login, token refresh), so these apps never read from the replica.
+PRIMARY_ONLY_APP_LABELS = {
+    "auth",
+    "sessions",
+    "account",
+    "socialaccount",
+    "contenttypes",
+    "admin",
+}
+
+_read_from_replica: ContextVar[bool] = ContextVar("read_from_replica", default=False)
+
+
+def replica_configured() -> bool:
+    return REPLICA_DB_ALIAS in settings.DATABASES
+
+
+@contextmanager
+def use_read_replica():
+    """Route reads inside the block to the replica, if one is configured."""
+    token = _read_from_replica.set(True)
+    try:
+        yield
+    finally:
+        _read_from_replica.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """
+    Send reads to the replica only when the current request or task opted in.
+
+    Everything else, including all writes and migrations, goes to the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        if (
+            _read_from_replica.get()
+            and replica_configured()
+            and model._meta.app_label not in PRIMARY_ONLY_APP_LABELS
+        ):
+            return REPLICA_DB_ALIAS
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
@@ -1,7 +1,17 @@
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.contrib.auth import authenticate
+from django.conf import settings
+from django.core.cache import cache
 from apps.profile.models import Profile
+from shopdjango.db_router import _read_from_replica, replica_configured
+from shopdjango.query_metrics import collect_queries
+import hashlib
 import json
+import logging
+
+query_logger = logging.getLogger("shopdjango.queries")
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
 
 
 def _json_or_empty(request: HttpRequest) -> dict:
@@ -29,6 +39,47 @@ def _forbidden_response() -> JsonResponse:
     )
 
 
+class QueryMetricsMiddleware:
+    """
+    Record query count, total DB time and the slowest statement per request.
+
+    Metrics are always logged as structured fields; with DEBUG on they are
+    also returned as ``X-DB-*`` response headers.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        with collect_queries() as metrics:
+            response = self.get_response(request)
+
+        fields = {
+            "method": request.method,
+            "path": request.path,
+            "status_code": response.status_code,
+            **metrics.as_log_fields(),
+        }
+        level = (
+            logging.WARNING
+            if metrics.count > settings.QUERY_METRICS_WARN_THRESHOLD
+            else logging.INFO
+        )
+        query_logger.log(
+            level,
+            f"{request.method} {request.path}: {metrics.count} queries "
+            f"in {metrics.total_ms:.1f} ms",
+            extra=fields,
+        )
+
+        if settings.DEBUG:
+            response["X-DB-Query-Count"] = str(metrics.count)
+            response["X-DB-Time-Ms"] = f"{metrics.total_ms:.2f}"
+            response["X-DB-Slowest-Ms"] = f"{metrics.slowest_ms:.2f}"
+            response["X-DB-Slowest-SQL"] = " ".join(metrics.slowest_sql.split())[:500]
+        return response
+
+
 class TimeDelayMiddleware(object):
     """Middleware that introduces a delay for each request. Used for testing"""
 
@@ -66,3 +117,76 @@ class BrowserLoginRoleMiddleware:
                             return _forbidden_response()
 
         return self.get_response(request)
+
+
+class ReadReplicaMiddleware:
+    """
+    Serve opted-in read-only views from the replica database.
+
+    ViewSet ``list`` actions use the replica by default; other views opt in
+    with ``read_replica_actions`` (action names for ViewSets, ``"get"`` for
+    APIViews). After a successful write, the client is pinned to the primary
+    for ``DATABASE_REPLICA_PIN_SECONDS`` so it reads its own changes.
+    """
+
+    default_viewset_actions = frozenset({"list"})
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        try:
+            response = self.get_response(request)
+        finally:
+            token = getattr(request, "_read_replica_token", None)
+            if token is not None:
+                _read_from_replica.reset(token)
+
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            pin_key = self._pin_key(request)
+            if pin_key:
+                cache.set(pin_key, True, settings.DATABASE_REPLICA_PIN_SECONDS)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if (
+            request.method in SAFE_METHODS
+            and replica_configured()
+            and self._view_allows_replica(request, view_func)
+            and not self._is_pinned(request)
+        ):
+            request._read_replica_token = _read_from_replica.set(True)
+        return None
+
+    def _view_allows_replica(self, request: HttpRequest, view_func) -> bool:
+        view_class = getattr(view_func, "cls", None)
+        if view_class is None:
+            return False
+        method = request.method.lower()
+        actions = getattr(view_func, "actions", None)
+        if actions is not None:
+            action = actions.get(method)
+            allowed = getattr(
+                view_class, "read_replica_actions", self.default_viewset_actions
+            )
+        else:
+            action = method
+            allowed = getattr(view_class, "read_replica_actions", ())
+        return action in allowed
+
+    def _is_pinned(self, request: HttpRequest) -> bool:
+        pin_key = self._pin_key(request)
+        return bool(pin_key and cache.get(pin_key))
+
+    @staticmethod
+    def _pin_key(request: HttpRequest) -> str | None:
+        """Identify the client by its credential without touching the database."""
+        credential = (
+            request.META.get("HTTP_X_SESSION_TOKEN")
+            or request.META.get("HTTP_AUTHORIZATION")
+            or request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+        )
+        if not credential:
+            return None
+        digest = hashlib.sha256(credential.encode()).hexdigest()
+        return f"db-primary-pin:{digest}"
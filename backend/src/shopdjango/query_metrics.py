@@ -0,0 +1,75 @@
+import time
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+
+from django.db import connections
+
+
+@dataclass
+class QueryMetrics:
+    """Database work observed while a block of code ran."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    slowest_ms: float = 0.0
+    slowest_sql: str = ""
+    keep_statements: bool = False
+    statements: list[str] = field(default_factory=list)
+
+    def __call__(self, execute, sql, params, many, context):
+        """``connection.execute_wrapper`` hook timing every statement."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.count += 1
+            self.total_ms += elapsed_ms
+            if self.keep_statements:
+                self.statements.append(sql)
+            if elapsed_ms > self.slowest_ms:
+                self.slowest_ms = elapsed_ms
+                self.slowest_sql = sql
+
+    def as_log_fields(self) -> dict[str, object]:
+        return {
+            "db_query_count": self.count,
+            "db_time_ms": round(self.total_ms, 2),
+            "db_slowest_ms": round(self.slowest_ms, 2),
+            "db_slowest_sql": self.slowest_sql,
+        }
+
+
+@contextmanager
+def collect_queries(keep_statements: bool = False):
+    """
+    Record every query issued on any configured database inside the block.
+
+    Only counts and timings are kept unless ``keep_statements`` is set, so the
+    per-request middleware does not hold on to every SQL string.
+    """
+    metrics = QueryMetrics(keep_statements=keep_statements)
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(metrics))
+        yield metrics
+
+
+@contextmanager
+def query_budget(max_queries: int):
+    """
+    Fail when the block issues more than ``max_queries`` queries.
+
+    Intended for tests pinning per-endpoint budgets, e.g. running the same
+    request against small and large seeded datasets with one budget so that
+    an N+1 regression shows up as a failure.
+    """
+    with collect_queries(keep_statements=True) as metrics:
+        yield metrics
+    if metrics.count > max_queries:
+        listing = "\n".join(
+            f"{index}. {sql}" for index, sql in enumerate(metrics.statements, 1)
+        )
+        raise AssertionError(
+            f"{metrics.count} queries executed, budget is {max_queries}:\n{listing}"
+        )
@@ -1,6 +1,7 @@
 import os
 import warnings
 from pathlib import Path
+from datetime import timedelta
 import sys
 from corsheaders.defaults import default_headers
 from dotenv import load_dotenv
@@ -63,6 +64,7 @@ INSTALLED_APPS: list[str] = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
 
 MIDDLEWARE: list[str] = [
+    "shopdjango.middleware.QueryMetricsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -72,6 +74,7 @@ MIDDLEWARE: list[str] = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "allauth.account.middleware.AccountMiddleware",
+    "shopdjango.middleware.ReadReplicaMiddleware",
     # "shopdjango.middleware.BrowserLoginRoleMiddleware",  # Temporarily disabled for testing
     "shopdjango.middleware.TimeDelayMiddleware",
 ]
@@ -97,6 +100,10 @@ TEMPLATES: list[dict] = [
 WSGI_APPLICATION: str = "shopdjango.wsgi.application"
 
 
+# Connections are persistent by default. Setting POSTGRES_POOL_MAX_SIZE switches
+# to psycopg's connection pool instead (requires the psycopg-pool package).
+POSTGRES_POOL_MAX_SIZE = int(os.environ.get("POSTGRES_POOL_MAX_SIZE", "0"))
+
 DATABASES: dict[str, dict] = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
@@ -105,9 +112,63 @@ DATABASES: dict[str, dict] = {
         "PASSWORD": os.environ.get("POSTGRES_PASSWORD", "secret"),
         "HOST": os.environ.get("POSTGRES_HOST", "localhost"),
         "PORT": os.environ.get("POSTGRES_PORT", "5432"),
+        "CONN_MAX_AGE": 0
+        if POSTGRES_POOL_MAX_SIZE
+        else int(os.environ.get("POSTGRES_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": (
+            {
+                "pool": {
+                    "min_size": int(os.environ.get("POSTGRES_POOL_MIN_SIZE", "2")),
+                    "max_size": POSTGRES_POOL_MAX_SIZE,
+                }
+            }
+            if POSTGRES_POOL_MAX_SIZE
+            else {}
+        ),
     }
 }
 
+if os.environ.get("POSTGRES_REPLICA_HOST"):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "HOST": os.environ["POSTGRES_REPLICA_HOST"],
+        "PORT": os.environ.get("POSTGRES_REPLICA_PORT", DATABASES["default"]["PORT"]),
+        "TEST": {"MIRROR": "default"},
+    }
+
+# Requests issuing more queries than this are logged at WARNING level.
+QUERY_METRICS_WARN_THRESHOLD = int(os.environ.get("QUERY_METRICS_WARN_THRESHOLD", "50"))
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "shopdjango.queries": {
+            "handlers": ["console"],
+            "level": os.environ.get("QUERY_METRICS_LOG_LEVEL", "INFO"),
+            "propagate": False,
+        },
+    },
+}
+
+DATABASE_ROUTERS = ["shopdjango.db_router.PrimaryReplicaRouter"]
+# How long a client keeps reading from the primary after it wrote something.
+DATABASE_REPLICA_PIN_SECONDS = int(
+    os.environ.get("DATABASE_REPLICA_PIN_SECONDS", "10")
+)
+
+if os.environ.get("REDIS_CACHE_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ["REDIS_CACHE_URL"],
+        }
+    }
+
 
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -258,6 +319,89 @@ CSRF_TRUSTED_ORIGINS = [
 
 
 STRIPE_SECRET_KEY = os.environ["STRIPE_SECRET_KEY"]
+STRIPE_WEBHOOK_SECRET = os.environ.get("STRIPE_WEBHOOK_SECRET", "")
+STRIPE_TIMEOUT_SECONDS = float(os.environ.get("STRIPE_TIMEOUT_SECONDS", "10"))
+STRIPE_MAX_NETWORK_RETRIES = int(os.environ.get("STRIPE_MAX_NETWORK_RETRIES", "2"))
+STRIPE_HTTP_POOL_SIZE = int(os.environ.get("STRIPE_HTTP_POOL_SIZE", "10"))
+
+PAYMENT_GATEWAY = os.environ.get(
+    "PAYMENT_GATEWAY",
+    "apps.checkout.services.payment_gateway.StripePaymentGateway",
+)
+PAYMENT_WEBHOOK_GRACE_SECONDS = int(
+    os.environ.get("PAYMENT_WEBHOOK_GRACE_SECONDS", "15")
+)
+STOCK_RESERVATION_TTL_SECONDS = int(
+    os.environ.get("STOCK_RESERVATION_TTL_SECONDS", "900")
+)
+SHIPMENT_EVENT_BATCH_SIZE = int(os.environ.get("SHIPMENT_EVENT_BATCH_SIZE", "1000"))
+SEARCH_DOCUMENT_BATCH_SIZE = int(os.environ.get("SEARCH_DOCUMENT_BATCH_SIZE", "1000"))
+SALES_ROLLUP_BATCH_SIZE = int(os.environ.get("SALES_ROLLUP_BATCH_SIZE", "1000"))
+# Caps a single catch-up run, e.g. the first one over a long order history.
+SALES_ROLLUP_MAX_HOURS_PER_RUN = int(
+    os.environ.get("SALES_ROLLUP_MAX_HOURS_PER_RUN", str(24 * 31))
+)
+# An hour is rolled up this long after it ends; later changes to its orders
+# are re-rolled by the Order signals.
+SALES_ROLLUP_SETTLE_SECONDS = int(os.environ.get("SALES_ROLLUP_SETTLE_SECONDS", "300"))
+SALES_ANALYTICS_CACHE_SECONDS = int(
+    os.environ.get("SALES_ANALYTICS_CACHE_SECONDS", str(7 * 24 * 3600))
+)
+SALES_ANALYTICS_MAX_BUCKETS = int(os.environ.get("SALES_ANALYTICS_MAX_BUCKETS", "1000"))
+# Per-process catalog snapshots refresh incrementally on every catalog change
+# and are fully reloaded after this long regardless.
+CATALOG_SNAPSHOT_MAX_AGE_SECONDS = int(
+    os.environ.get("CATALOG_SNAPSHOT_MAX_AGE_SECONDS", "3600")
+)
+# Re-read products updated this long before the previous load, to catch
+# transactions that committed after it with an earlier updated_at.
+CATALOG_SNAPSHOT_DELTA_OVERLAP_SECONDS = int(
+    os.environ.get("CATALOG_SNAPSHOT_DELTA_OVERLAP_SECONDS", "60")
+)
+# Upper bounds of the price facet buckets; the last bucket is open-ended.
+CATALOG_FACET_PRICE_EDGES = [
+    float(edge)
+    for edge in os.environ.get(
+        "CATALOG_FACET_PRICE_EDGES", "50,100,200,500,1000"
+    ).split(",")
+]
+# Resized copies made of every product image, by name and maximum width.
+PRODUCT_IMAGE_VARIANT_WIDTHS = {"thumb": 160, "card": 480, "large": 1200}
+# Encodings produced for each size, best first; those Pillow lacks are skipped.
+PRODUCT_IMAGE_VARIANT_FORMATS = ["avif", "webp", "jpeg"]
+# Formats served to clients whose Accept header names no image types.
+PRODUCT_IMAGE_DEFAULT_FORMATS = ["webp", "jpeg"]
+PRODUCT_IMAGE_VARIANT_BACKFILL_SIZE = int(
+    os.environ.get("PRODUCT_IMAGE_VARIANT_BACKFILL_SIZE", "200")
+)
+# Direct uploads: accepted types (with the extension used for the key), the
+# size cap enforced by the presigned POST policy, how long the upload URL is
+# valid and how long afterwards the upload can still be confirmed.
+PRODUCT_IMAGE_UPLOAD_CONTENT_TYPES = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "image/avif": ".avif",
+}
+PRODUCT_IMAGE_UPLOAD_MAX_BYTES = int(
+    os.environ.get("PRODUCT_IMAGE_UPLOAD_MAX_BYTES", str(20 * 1024 * 1024))
+)
+PRODUCT_IMAGE_UPLOAD_EXPIRES_SECONDS = int(
+    os.environ.get("PRODUCT_IMAGE_UPLOAD_EXPIRES_SECONDS", "900")
+)
+PRODUCT_IMAGE_UPLOAD_CONFIRM_SECONDS = int(
+    os.environ.get("PRODUCT_IMAGE_UPLOAD_CONFIRM_SECONDS", "86400")
+)
+# Most product ids one wishlist membership check may ask about (a grid page).
+WISHLIST_CHECK_MAX_PRODUCTS = int(os.environ.get("WISHLIST_CHECK_MAX_PRODUCTS", "200"))
+# Safety-net reload interval of the in-memory countries/couriers/shipping methods.
+REFERENCE_DATA_MAX_AGE_SECONDS = int(
+    os.environ.get("REFERENCE_DATA_MAX_AGE_SECONDS", "3600")
+)
+REPORT_JOB_BATCH_SIZE = int(os.environ.get("REPORT_JOB_BATCH_SIZE", "2000"))
+# Identical report requests within this window share one artifact.
+REPORT_JOB_REUSE_SECONDS = int(os.environ.get("REPORT_JOB_REUSE_SECONDS", "600"))
+REPORT_JOB_RETENTION_DAYS = int(os.environ.get("REPORT_JOB_RETENTION_DAYS", "7"))
 
 
 CELERY_BROKER_URL = os.environ.get("CELERY_BROKER_URL", "redis://localhost:6379/0")
@@ -269,6 +413,32 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = "UTC"
+CELERY_BEAT_SCHEDULE = {
+    "release-expired-stock-reservations": {
+        "task": "checkout.release_expired_reservations",
+        "schedule": timedelta(minutes=1),
+    },
+    "roll-up-sales": {
+        "task": "checkout.roll_up_sales",
+        "schedule": timedelta(minutes=5),
+    },
+    "rebuild-search-documents": {
+        "task": "checkout.rebuild_search_documents",
+        "schedule": timedelta(hours=24),
+    },
+    "reconcile-product-counts": {
+        "task": "catalog.reconcile_product_counts",
+        "schedule": timedelta(hours=1),
+    },
+    "backfill-image-variants": {
+        "task": "catalog.backfill_image_variants",
+        "schedule": timedelta(hours=1),
+    },
+    "purge-report-jobs": {
+        "task": "checkout.purge_report_jobs",
+        "schedule": timedelta(hours=24),
+    },
+}
 
 
 SIMULATOR_PUSH_RELAY_URL = os.environ.get("SIMULATOR_PUSH_RELAY_URL")
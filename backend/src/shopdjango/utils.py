@@ -1,19 +1,20 @@
+from functools import cache
+
 import boto3
 from botocore.config import Config
 from django.conf import settings
 from urllib.parse import quote
 
 
-def presign_download(key: str, expires: int = 600, as_attachment: bool = False) -> str:
-    """Generate a pre-signed URL for downloading from MinIO using browser-accessible endpoint."""
-    params = {"Bucket": settings.AWS_STORAGE_BUCKET_NAME, "Key": key}
-    if as_attachment:
-        filename = key.rsplit("/", 1)[-1]
-        params["ResponseContentDisposition"] = (
-            f'attachment; filename="{quote(filename)}"'
-        )
+@cache
+def _public_s3_client():
+    """
+    S3 client that signs URLs for the browser-accessible MinIO endpoint.
 
-    client = boto3.client(
+    Built once per process: creating a client costs far more than signing,
+    and presigning is local, thread-safe work.
+    """
+    return boto3.client(
         "s3",
         endpoint_url=settings.MINIO_PUBLIC_ENDPOINT,
         aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
@@ -23,4 +24,39 @@ def presign_download(key: str, expires: int = 600, as_attachment: bool = False)
         verify=settings.AWS_S3_VERIFY,
         config=Config(signature_version="s3v4"),
     )
+
+
+def presign_download(key: str, expires: int = 600, as_attachment: bool = False) -> str:
+    """Generate a pre-signed URL for downloading from MinIO using browser-accessible endpoint."""
+    params = {"Bucket": settings.AWS_STORAGE_BUCKET_NAME, "Key": key}
+    if as_attachment:
+        filename = key.rsplit("/", 1)[-1]
+        params["ResponseContentDisposition"] = (
+            f'attachment; filename="{quote(filename)}"'
+        )
+
+    client = _public_s3_client()
     return client.generate_presigned_url("get_object", Params=params, ExpiresIn=expires)
+
+
+def presign_upload(
+    key: str, content_type: str, max_bytes: int, expires: int = 900
+) -> dict:
+    """
+    Generate a pre-signed POST for uploading ``key`` straight to MinIO.
+
+    The policy pins the content type and caps the size, so the client can
+    only store what was asked for. Returns ``url`` and the form ``fields``
+    to send along with the file.
+    """
+    client = _public_s3_client()
+    return client.generate_presigned_post(
+        settings.AWS_STORAGE_BUCKET_NAME,
+        key,
+        Fields={"Content-Type": content_type},
+        Conditions=[
+            {"Content-Type": content_type},
+            ["content-length-range", 1, max_bytes],
+        ],
+        ExpiresIn=expires,
+    )